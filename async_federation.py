@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Asynchronous Federation
+
+The lockstep federation (federation.NWayFederation) reconciles every
+council in the same round. Here each council is an asyncio task with its
+own tick interval, and councils only learn each other's median phases
+from messages sent over a simulated network:
+
+- every tick a council reads whatever medians have arrived, moves its
+  accumulated offset toward the mean of the latest ones it has heard,
+  steps its trust, and sends its own median to its topology neighbours
+- SimulatedLink delivers each message after latency ± jitter (uniform)
+  seconds, or drops it with probability drop_rate; delivery is a
+  loop.call_later into the receiver's asyncio.Queue, so nothing blocks
+- a sampler task records the spread and sync of the councils' medians at
+  a fixed interval, giving convergence against time
+
+All timing goes through the running loop's clock (loop.time, asyncio.sleep,
+call_later). On an ordinary loop that is wall time; on a VirtualTimeLoop
+the clock jumps straight to the next due timer, so a run takes no real time
+and its tick counts, message order and medians are the same on every run.
+
+Optional per-council `work` (e.g. stepping the council's universe) runs in
+the default executor, so councils doing real work overlap with each other
+and with message handling.
+
+    result = run_async_federation(FederationTopology.ring(50), observer_phases,
+                                  link=SimulatedLink(latency=0.01, jitter=0.005, drop_rate=0.1),
+                                  duration=2.0)
+
+    result = run_async_federation(..., duration=2.0, virtual_time=True)
+"""
+
+import asyncio
+import selectors
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from council_bank import CouncilBank, LaggedTrust, MisalignmentDecay
+from federation import FederationTopology
+from history_recorder import HistoryRecorder
+from unity_script import SimulationClock
+
+ObserverPhases = Callable[[int, int], np.ndarray]  # (iteration, council) -> (M,) phases
+
+
+@dataclass
+class PhaseMessage:
+    sender: int
+    median: float
+    sent_at: float
+
+
+class _VirtualSelector(selectors.DefaultSelector):
+    """Polls without blocking and moves the clock by the timeout it was asked to wait."""
+
+    def __init__(self, clock: SimulationClock):
+        super().__init__()
+        self.clock = clock
+
+    def select(self, timeout=None):
+        events = super().select(None if timeout is None else 0)
+        if not events and timeout:
+            self.clock.advance(timeout)
+        return events
+
+
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop on simulated time: whenever nothing is ready it advances its
+    SimulationClock to the next scheduled callback instead of sleeping.
+    Executor work runs for real; simulated time does not wait for it.
+
+    Args:
+        start: Initial loop time in seconds
+    """
+
+    def __init__(self, start: float = 0.0):
+        self.clock = SimulationClock(start)
+        super().__init__(selector=_VirtualSelector(self.clock))
+
+    def time(self) -> float:
+        return self.clock.now()
+
+
+class SimulatedLink:
+    """
+    In-process stand-in for a network connection.
+
+    Args:
+        latency: Mean delivery delay in seconds
+        jitter: Half-width of the uniform noise added to the delay
+        drop_rate: Probability that a message is lost
+        seed: Seed for the delay and drop draws
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, drop_rate: float = 0.0, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.rng = np.random.default_rng(seed)
+        self.sent = 0
+        self.dropped = 0
+
+    def send(self, queue: asyncio.Queue, message: PhaseMessage):
+        """Deliver message into queue after the simulated delay (unless dropped)."""
+        self.sent += 1
+        if self.drop_rate and self.rng.random() < self.drop_rate:
+            self.dropped += 1
+            return
+        delay = max(0.0, self.latency + (self.rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0))
+        loop = asyncio.get_running_loop()
+        if delay > 0.0:
+            loop.call_later(delay, queue.put_nowait, message)
+        else:
+            loop.call_soon(queue.put_nowait, message)
+
+
+class AsyncCouncil:
+    """
+    One council running as an asyncio task.
+
+    Args:
+        index: Council index in the topology
+        bank: Single-council CouncilBank holding its trust
+        neighbours: Councils it sends its median to
+        tick_interval: Seconds between ticks
+        sync_strength: Fraction of the gap to the heard median closed per tick
+        work: Optional blocking callable (iteration, phases) run in an executor each tick
+    """
+
+    def __init__(
+        self,
+        index: int,
+        bank: CouncilBank,
+        neighbours: Sequence[int],
+        tick_interval: float,
+        sync_strength: float = 0.02,
+        work: Optional[Callable[[int, np.ndarray], object]] = None,
+    ):
+        self.index = index
+        self.bank = bank
+        self.neighbours = [int(neighbour) for neighbour in neighbours]
+        self.tick_interval = tick_interval
+        self.sync_strength = sync_strength
+        self.work = work
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.offset = 0.0
+        self.median = 0.0
+        self.ticks = 0
+        self.received = 0
+        self.delay_total = 0.0
+        self._heard: Dict[int, PhaseMessage] = {}
+
+    def _drain(self):
+        now = asyncio.get_running_loop().time()
+        while not self.inbox.empty():
+            message = self.inbox.get_nowait()
+            # A late message never overwrites a newer one from the same sender
+            latest = self._heard.get(message.sender)
+            if latest is None or latest.sent_at < message.sent_at:
+                self._heard[message.sender] = message
+            self.received += 1
+            self.delay_total += now - message.sent_at
+
+    async def run(self, observer_phases: ObserverPhases, link: SimulatedLink, peers: List['AsyncCouncil'], until: float):
+        loop = asyncio.get_running_loop()
+        while loop.time() < until:
+            self._drain()
+            phases = np.asarray(observer_phases(self.ticks, self.index), dtype=float) + self.offset
+            median = float(np.median(phases))
+            if self._heard:
+                heard = np.mean([message.median for message in self._heard.values()])
+                correction = self.sync_strength * (heard - median)
+                self.offset += correction
+                phases = phases + correction
+                median += correction
+            self.median = median
+            self.bank.step(phases)
+            if self.work is not None:
+                await loop.run_in_executor(None, self.work, self.ticks, phases)
+
+            message = PhaseMessage(self.index, median, loop.time())
+            for neighbour in self.neighbours:
+                link.send(peers[neighbour].inbox, message)
+            self.ticks += 1
+            await asyncio.sleep(self.tick_interval)
+
+
+@dataclass
+class AsyncFederationResult:
+    duration: float
+    ticks: np.ndarray               # per-council tick counts
+    throughput: float               # council ticks per second, all councils
+    messages_sent: int
+    messages_dropped: int
+    messages_delivered: int
+    mean_delay: float               # seconds from send to being read
+    history: HistoryRecorder        # 'time', 'spread', 'sync' samples
+    medians: np.ndarray             # final council medians
+    trust: np.ndarray               # final (C, M) trust
+
+    @property
+    def final_spread(self) -> float:
+        return float(np.std(self.medians))
+
+
+class AsyncFederation:
+    """
+    Councils of a topology as concurrently running tasks.
+
+    Args:
+        topology: Which councils send to which
+        observer_phases: (iteration, council) -> (M,) observer phases
+        observers: Observer count M
+        link: Simulated network between councils (default: instant, lossless)
+        tick_intervals: Seconds between ticks, scalar or one per council
+        sync_strength: Per-tick correction toward the heard medians
+        work: Optional blocking per-tick work, see AsyncCouncil
+    """
+
+    def __init__(
+        self,
+        topology: FederationTopology,
+        observer_phases: ObserverPhases,
+        observers: int,
+        link: Optional[SimulatedLink] = None,
+        tick_intervals: Union[float, Sequence[float]] = 0.005,
+        sync_strength: float = 0.02,
+        work: Optional[Callable[[int, np.ndarray], object]] = None,
+    ):
+        self.topology = topology
+        self.observer_phases = observer_phases
+        self.observers = observers
+        self.link = link or SimulatedLink()
+        self.tick_intervals = np.broadcast_to(np.asarray(tick_intervals, dtype=float), (topology.councils,))
+        self.sync_strength = sync_strength
+        self.work = work
+
+    def _sync(self, medians: np.ndarray) -> float:
+        listener, speaker = self.topology.edge_values(medians)
+        return float(np.mean(np.exp(-np.abs(listener - speaker)))) if self.topology.edges else 1.0
+
+    async def run(self, duration: float, sample_interval: float = 0.05) -> AsyncFederationResult:
+        """Run every council for `duration` seconds of loop time."""
+        loop = asyncio.get_running_loop()
+        topology = self.topology
+        councils = [
+            AsyncCouncil(
+                index,
+                CouncilBank.uniform(1, self.observers, decay=MisalignmentDecay(), hysteresis=LaggedTrust(0.1)),
+                topology.indices[topology.indptr[index]:topology.indptr[index + 1]],
+                float(self.tick_intervals[index]),
+                self.sync_strength,
+                self.work,
+            )
+            for index in range(topology.councils)
+        ]
+        history = HistoryRecorder(['time', 'spread', 'sync'], capacity=int(duration / sample_interval) + 2)
+        start = loop.time()
+        until = start + duration
+
+        async def sample():
+            while loop.time() < until:
+                await asyncio.sleep(sample_interval)
+                medians = np.array([council.median for council in councils])
+                history.record(time=loop.time() - start, spread=float(np.std(medians)), sync=self._sync(medians))
+
+        await asyncio.gather(
+            sample(),
+            *(council.run(self.observer_phases, self.link, councils, until) for council in councils),
+        )
+        elapsed = loop.time() - start
+        for council in councils:
+            council._drain()
+
+        ticks = np.array([council.ticks for council in councils])
+        delivered = sum(council.received for council in councils)
+        return AsyncFederationResult(
+            duration=elapsed,
+            ticks=ticks,
+            throughput=float(ticks.sum() / elapsed),
+            messages_sent=self.link.sent,
+            messages_dropped=self.link.dropped,
+            messages_delivered=delivered,
+            mean_delay=sum(council.delay_total for council in councils) / delivered if delivered else 0.0,
+            history=history,
+            medians=np.array([council.median for council in councils]),
+            trust=np.concatenate([council.bank.trust for council in councils]),
+        )
+
+
+def run_async_federation(
+    topology: FederationTopology,
+    observer_phases: ObserverPhases,
+    observers: int = 3,
+    link: Optional[SimulatedLink] = None,
+    duration: float = 1.0,
+    virtual_time: bool = False,
+    **options,
+) -> AsyncFederationResult:
+    """
+    Blocking entry point: run an AsyncFederation for `duration` seconds, of
+    wall time or, with virtual_time, on a VirtualTimeLoop.
+    """
+    federation = AsyncFederation(topology, observer_phases, observers, link, **options)
+    if not virtual_time:
+        return asyncio.run(federation.run(duration))
+    loop = VirtualTimeLoop()
+    try:
+        return loop.run_until_complete(federation.run(duration))
+    finally:
+        loop.close()
@@ -30,13 +30,18 @@ Date: February 4, 2026
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Dict
+from functools import partial
+from typing import List, Dict, Optional, Tuple
 
 import json
 import numpy as np
 import matplotlib.pyplot as plt
 
-from unity_script import Consciousness, QuantumParticle, UniversalSymphony
+from coherence_metrics import pairwise_wrapped_coherence
+from experiment_runner import ScenarioSpec, ScenarioStep, run_scenario
+from history_recorder import HistoryRecorder, history_column
+from observer_schedule import Drift, Every, Window, stack
+from unity_script import QuantumParticle, UniversalSymphony
 
 
 @dataclass
@@ -53,144 +58,113 @@ class ConsensusMetrics:
 
 
 class ConsensusMonitor:
-    def __init__(self, universe: UniversalSymphony, waves: List[QuantumParticle]):
+    system_coherence_history = history_column('system_coherence')
+    cross_coherence_history = history_column('cross_coherence')
+    observer_alignment_history = history_column('observer_alignment')
+    consensus_recovery_history = history_column('consensus_recovery')
+
+    def __init__(self, universe: UniversalSymphony, waves: List[QuantumParticle], capacity: Optional[int] = None):
         self.universe = universe
         self.waves = waves
 
-        self.system_coherence_history: List[float] = []
-        self.cross_coherence_history: List[float] = []
-        self.observer_alignment_history: List[float] = []
-        self.consensus_recovery_history: List[float] = []
+        self.history = HistoryRecorder(
+            ['system_coherence', 'cross_coherence', 'observer_alignment', 'consensus_recovery'],
+            capacity=capacity,
+        )
 
         self._last_alignment = None
 
-    @staticmethod
-    def _pairwise_cross_coherence(phases: List[float]) -> float:
-        if len(phases) < 2:
-            return 1.0
-        pair_values = []
-        for i in range(len(phases)):
-            for j in range(i + 1, len(phases)):
-                phase_diff = abs(phases[i] - phases[j])
-                pair_values.append(1.0 - (phase_diff % (2 * np.pi)) / (2 * np.pi))
-        return float(np.mean(pair_values)) if pair_values else 1.0
-
     def record(self, observer_alignment: float):
         system_coherence = self.universe.get_coherence()
         phases = [w.phase for w in self.waves]
-        cross_coherence = self._pairwise_cross_coherence(phases)
-
-        self.system_coherence_history.append(system_coherence)
-        self.cross_coherence_history.append(cross_coherence)
-        self.observer_alignment_history.append(observer_alignment)
+        cross_coherence = pairwise_wrapped_coherence(phases)
 
         if self._last_alignment is None:
             recovery = 0.0
         else:
             recovery = observer_alignment - self._last_alignment
-        self.consensus_recovery_history.append(recovery)
         self._last_alignment = observer_alignment
 
+        self.history.record(
+            system_coherence=system_coherence,
+            cross_coherence=cross_coherence,
+            observer_alignment=observer_alignment,
+            consensus_recovery=recovery,
+        )
+
     def final_metrics(self) -> ConsensusMetrics:
+        history = self.history
         consensus_index = (
-            float(np.mean(self.system_coherence_history))
-            + float(np.mean(self.cross_coherence_history))
-            + float(np.mean(self.observer_alignment_history))
+            history.mean('system_coherence')
+            + history.mean('cross_coherence')
+            + history.mean('observer_alignment')
         ) / 3.0
 
         return ConsensusMetrics(
-            system_coherence_final=float(self.system_coherence_history[-1]) if self.system_coherence_history else 0.0,
-            system_coherence_avg=float(np.mean(self.system_coherence_history)) if self.system_coherence_history else 0.0,
-            cross_coherence_avg=float(np.mean(self.cross_coherence_history)) if self.cross_coherence_history else 0.0,
-            cross_coherence_peak=float(np.max(self.cross_coherence_history)) if self.cross_coherence_history else 0.0,
-            observer_alignment_avg=float(np.mean(self.observer_alignment_history)) if self.observer_alignment_history else 0.0,
-            observer_alignment_final=float(self.observer_alignment_history[-1]) if self.observer_alignment_history else 0.0,
-            consensus_recovery_avg=float(np.mean(self.consensus_recovery_history)) if self.consensus_recovery_history else 0.0,
-            consensus_recovery_peak=float(np.max(self.consensus_recovery_history)) if self.consensus_recovery_history else 0.0,
+            system_coherence_final=history.last('system_coherence'),
+            system_coherence_avg=history.mean('system_coherence'),
+            cross_coherence_avg=history.mean('cross_coherence'),
+            cross_coherence_peak=history.max('cross_coherence'),
+            observer_alignment_avg=history.mean('observer_alignment'),
+            observer_alignment_final=history.last('observer_alignment'),
+            consensus_recovery_avg=history.mean('consensus_recovery'),
+            consensus_recovery_peak=history.max('consensus_recovery'),
             consensus_index=consensus_index,
         )
 
 
-def _create_universe() -> UniversalSymphony:
-    universe = UniversalSymphony()
-    for freq in [1.0, 2.0, 3.0, 4.0]:
-        particle = QuantumParticle(frequency=freq, depth=0)
-        particle.observe()
-        universe.add(particle)
-    return universe
-
-
-def _inject_triad(universe: UniversalSymphony) -> List[QuantumParticle]:
-    observer = Consciousness(frequency=7.83)
-    freqs = [8.0, 10.0, 12.0]
-    waves = []
-    for freq in freqs:
-        wave = observer.inject_frequency(
-            symphony=universe,
-            frequency=freq,
-            amplitude=1.0,
-            phase=0.0,
-            auto_observe=True,
-        )
-        waves.append(wave)
-    return waves
+_observer_phases = stack(
+    # Observer A tunes every 5 iterations
+    Drift(0.02, 7.0).reset_every(5),
+    # Observer B tunes every 7 iterations with phase lag and disagreement windows
+    Every(7).where(Drift(0.1, 9.0), Drift(0.12, 11.0, wave=np.cos))
+    # Inject a disagreement window (iterations 60-90 of every 120)
+    + Window(120, 60, 91).where(0.3, 0.0),
+)
 
 
-def run_asynchronous_observers(iterations: int = 600) -> ConsensusMonitor:
-    print("\n" + "=" * 70)
-    print("TEST: ASYNCHRONOUS OBSERVERS (Delayed Consensus)")
-    print("=" * 70)
+def _delayed_consensus(phases: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    phase_a, phase_b = phases[:, 0], phases[:, 1]
+    alignment = 1.0 - np.minimum(1.0, np.abs(phase_a - phase_b) / (2 * np.pi))
 
-    universe = _create_universe()
-    waves = _inject_triad(universe)
+    # Apply consensus: average of observer phases, but only if alignment is above threshold;
+    # otherwise partial consensus weighted toward observer A
+    target = np.where(alignment > 0.85, (phase_a + phase_b) / 2.0, 0.7 * phase_a + 0.3 * phase_b)
+    return target, alignment
 
-    observer_a = Consciousness(frequency=7.83)
-    observer_b = Consciousness(frequency=7.83)
 
-    monitor = ConsensusMonitor(universe, waves)
+def _record(monitor: ConsensusMonitor, step: ScenarioStep):
+    monitor.record(observer_alignment=step.alignment)
 
-    for iteration in range(iterations):
-        universe.apply_decoherence(entropy_factor=0.002)
 
-        # Observer A tunes every 5 iterations
-        if iteration % 5 == 0:
-            observer_a_phase = 0.0
-        else:
-            observer_a_phase = 0.02 * np.sin(iteration / 7.0)
-
-        # Observer B tunes every 7 iterations with phase lag and disagreement windows
-        if iteration % 7 == 0:
-            observer_b_phase = 0.1 * np.sin(iteration / 9.0)
-        else:
-            observer_b_phase = 0.12 * np.cos(iteration / 11.0)
-
-        # Inject a disagreement window every 120 iterations
-        if 60 <= (iteration % 120) <= 90:
-            observer_b_phase += 0.3
-
-        alignment = 1.0 - min(1.0, abs(observer_a_phase - observer_b_phase) / (2 * np.pi))
+def _progress(monitor: ConsensusMonitor, step: ScenarioStep) -> str:
+    return (
+        f"  Iteration {step.iteration + 1:4d}: System={monitor.system_coherence_history[-1]:.4f}, "
+        f"Cross={monitor.cross_coherence_history[-1]:.4f}, Align={step.alignment:.4f}"
+    )
 
-        # Apply consensus: average of observer phases, but only if alignment is above threshold
-        if alignment > 0.85:
-            target_phase = (observer_a_phase + observer_b_phase) / 2.0
-        else:
-            # Partial consensus: weighted toward observer A
-            target_phase = (0.7 * observer_a_phase + 0.3 * observer_b_phase)
 
-        if iteration % 4 == 0:
-            for wave in waves:
-                wave.phase = target_phase
-                wave.observe()
+def asynchronous_observers_scenario(iterations: int = 600, seed=None) -> ScenarioSpec:
+    """Two observers on different tuning schedules locking a shared triad every 4 iterations."""
+    return ScenarioSpec(
+        name="asynchronous_observers",
+        iterations=iterations,
+        monitor=partial(ConsensusMonitor, capacity=iterations),
+        record=_record,
+        observer_phases=_observer_phases,
+        consensus=_delayed_consensus,
+        lock_every=4,
+        progress=_progress,
+        seed=seed,
+    )
 
-        monitor.record(observer_alignment=alignment)
 
-        if (iteration + 1) % 100 == 0:
-            print(
-                f"  Iteration {iteration + 1:4d}: System={monitor.system_coherence_history[-1]:.4f}, "
-                f"Cross={monitor.cross_coherence_history[-1]:.4f}, Align={alignment:.4f}"
-            )
+def run_asynchronous_observers(iterations: int = 600) -> ConsensusMonitor:
+    print("\n" + "=" * 70)
+    print("TEST: ASYNCHRONOUS OBSERVERS (Delayed Consensus)")
+    print("=" * 70)
 
-    return monitor
+    return run_scenario(asynchronous_observers_scenario(iterations)).monitor
 
 
 def visualize_results(monitor: ConsensusMonitor):
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Checkpoint and Resume
+
+Long runs (a 10^7-iteration standing-wave persistence test, say) can be
+checkpointed at intervals and resumed bit-exactly after a crash. A
+checkpoint is one uncompressed .npz file: every array (particle columns,
+recorded histories, trust vectors) is dumped raw and every scalar (Omega
+Time, clock reading, random stream positions, monitor counters) goes into
+a JSON header entry. Nothing is pickled, so writing one costs about as
+much as copying the arrays.
+
+Objects take part through `state_dict()` / `load_state_dict(state)`
+(UniversalSymphony, HistoryRecorder, RollingWindow). Other objects such as
+monitors and councils are captured generically: their ndarray and JSON-able
+attributes, and recursively any nested plain objects. Universes and
+particles referenced by a monitor are skipped; checkpoint the universe as
+its own entry and restore into the objects the script has just rebuilt, so
+references between them stay valid:
+
+    checkpoint = Checkpointer('outputs/run.ckpt.npz', every_seconds=5.0)
+    start = checkpoint.resume(universe=universe, monitor=monitor)
+    for iteration in range(start, iterations):
+        ...
+        checkpoint.maybe_save(iteration + 1, universe=universe, monitor=monitor)
+"""
+
+import functools
+import inspect
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from metrics_sink import MetricsSink
+from unity_script import QuantumParticle, UniversalSymphony
+
+CHECKPOINT_VERSION = 1
+META_KEY = "__meta__"
+
+# Never captured through a monitor's attributes
+_SKIPPED = (UniversalSymphony, QuantumParticle, MetricsSink)
+
+
+def _is_json_value(value) -> bool:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return True
+    if isinstance(value, list):
+        return all(_is_json_value(item) for item in value)
+    return False
+
+
+def object_state(obj, _seen: Optional[set] = None) -> Dict[str, Any]:
+    """
+    Flat state of an object: keys map to ndarrays or JSON-able values,
+    nested objects use 'attribute/key'.
+    """
+    if hasattr(obj, "state_dict"):
+        return obj.state_dict()
+    return attribute_state(obj, _seen)
+
+
+def attribute_state(obj, _seen: Optional[set] = None) -> Dict[str, Any]:
+    """Generic object_state() from an object's attributes (usable inside a custom state_dict)."""
+    seen = set() if _seen is None else _seen
+    seen.add(id(obj))
+    state = {}
+    for name, value in vars(obj).items():
+        if isinstance(value, np.ndarray):
+            state[name] = value
+        elif isinstance(value, np.generic):
+            state[name] = value.item()
+        elif _is_json_value(value):
+            state[name] = value
+        elif (
+            isinstance(value, _SKIPPED + (type, functools.partial))
+            or inspect.isroutine(value)
+            or id(value) in seen
+            or not hasattr(value, "__dict__")
+        ):
+            continue
+        else:
+            nested = object_state(value, seen)
+            state.update({f"{name}/{key}": item for key, item in nested.items()})
+    return state
+
+
+def load_object_state(obj, state: Dict[str, Any]):
+    """Restore object_state() output into obj in place."""
+    if hasattr(obj, "load_state_dict"):
+        obj.load_state_dict(state)
+    else:
+        load_attribute_state(obj, state)
+
+
+def load_attribute_state(obj, state: Dict[str, Any]):
+    """Inverse of attribute_state(); arrays of unchanged shape are filled in place."""
+    nested: Dict[str, Dict[str, Any]] = {}
+    for key, value in state.items():
+        name, _, rest = key.partition("/")
+        if rest:
+            nested.setdefault(name, {})[rest] = value
+            continue
+        current = getattr(obj, name, None)
+        if isinstance(value, np.ndarray):
+            if isinstance(current, np.ndarray) and current.shape == value.shape and current.dtype == value.dtype:
+                current[...] = value
+            else:
+                setattr(obj, name, np.array(value))
+        else:
+            setattr(obj, name, value)
+    for name, values in nested.items():
+        load_object_state(getattr(obj, name), values)
+
+
+def save_checkpoint(path: str, iteration: Optional[int] = None, **objects) -> str:
+    """
+    Write the named objects' state to path (atomically: a crash mid-write
+    leaves the previous checkpoint intact). ndarray objects are saved as-is.
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    values: Dict[str, Dict[str, Any]] = {}
+    for name, obj in objects.items():
+        if isinstance(obj, np.ndarray):
+            arrays[name] = obj
+            continue
+        values[name] = {}
+        for key, value in object_state(obj).items():
+            if isinstance(value, np.ndarray):
+                arrays[f"{name}/{key}"] = value
+            else:
+                values[name][key] = value.item() if isinstance(value, np.generic) else value
+    meta = {"version": CHECKPOINT_VERSION, "iteration": iteration, "saved_at": time.time(), "values": values}
+    arrays[META_KEY] = np.array(json.dumps(meta))
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    partial = path + ".partial"
+    with open(partial, "wb") as handle:
+        np.savez(handle, **arrays)
+    os.replace(partial, path)
+    return path
+
+
+def load_checkpoint(path: str, **objects) -> Dict[str, Any]:
+    """
+    Restore a checkpoint into the named objects (ndarrays are filled in
+    place) and return its metadata (version, iteration, saved_at).
+    """
+    with np.load(path, allow_pickle=False) as stored:
+        meta = json.loads(str(stored[META_KEY]))
+        if meta["version"] > CHECKPOINT_VERSION:
+            raise ValueError(f"Checkpoint version {meta['version']} is newer than supported ({CHECKPOINT_VERSION})")
+        arrays = {name: stored[name] for name in stored.files if name != META_KEY}
+    for name, obj in objects.items():
+        if isinstance(obj, np.ndarray):
+            obj[...] = arrays[name]
+            continue
+        if name not in meta["values"]:
+            raise KeyError(f"Checkpoint {path} has no entry '{name}'")
+        prefix = name + "/"
+        state = dict(meta["values"][name])
+        state.update({key[len(prefix):]: value for key, value in arrays.items() if key.startswith(prefix)})
+        load_object_state(obj, state)
+    return {key: meta[key] for key in ("version", "iteration", "saved_at")}
+
+
+class Checkpointer:
+    """
+    Periodic checkpointing for a simulation loop.
+
+    Args:
+        path: Checkpoint file (.npz)
+        every_seconds: Save when at least this much wall time has passed
+        every_iterations: Save every this many iterations instead (if given)
+    """
+
+    def __init__(self, path: str, every_seconds: float = 5.0, every_iterations: Optional[int] = None):
+        self.path = path
+        self.every_seconds = float(every_seconds)
+        self.every_iterations = every_iterations
+        self.saves = 0
+        self._last_save = time.perf_counter()
+
+    def due(self, iteration: int) -> bool:
+        if self.every_iterations:
+            return iteration % self.every_iterations == 0
+        return time.perf_counter() - self._last_save >= self.every_seconds
+
+    def save(self, iteration: int, **objects):
+        save_checkpoint(self.path, iteration=iteration, **objects)
+        self.saves += 1
+        self._last_save = time.perf_counter()
+
+    def maybe_save(self, iteration: int, **objects) -> bool:
+        """Save if due; call once per iteration with the next iteration to run."""
+        if not self.due(iteration):
+            return False
+        self.save(iteration, **objects)
+        return True
+
+    def resume(self, **objects) -> int:
+        """Restore the last checkpoint if there is one; returns the iteration to continue from."""
+        if not os.path.exists(self.path):
+            return 0
+        return int(load_checkpoint(self.path, **objects)["iteration"] or 0)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -18,29 +18,22 @@ import matplotlib.pyplot as plt
 from unity_script import Consciousness, UniversalSymphony, generate_fractal_universe
 
 
-def run_chronos_dilation_test(
+def simulate_chronos_dilation(
     octaves: int = 3,
     steps: int = 100,
     dt: float = 0.01,
     entropy_factor: float = 0.05,
     injected_freq: float = 5.5,
     seed: int = 1234,
-):
-    print("=" * 70)
-    print("OMEGA CODE v0.3 — CHRONOS DILATION TEST")
-    print("Temporal Drag Hypothesis: Does Meaning slow Ωτ?")
-    print("=" * 70)
-    print()
-
-    # Build two identical universes
-    universe_a = UniversalSymphony()
-    universe_b = UniversalSymphony()
-
-    particles_a = generate_fractal_universe(base_freq=1.0, octaves=octaves)
-    particles_b = generate_fractal_universe(base_freq=1.0, octaves=octaves)
-
-    universe_a.add_all(particles_a)
-    universe_b.add_all(particles_b)
+) -> dict:
+    """
+    Step a noise-dominant and a Logos-dominant universe under identical
+    entropy and return their Ωτ / ΩTime trajectories and growth rates.
+    """
+    # Build one universe and fork an identical copy-on-write twin
+    universe_a = UniversalSymphony(seed=seed)
+    universe_a.add_all(generate_fractal_universe(base_freq=1.0, octaves=octaves, rng=universe_a.streams.universe))
+    universe_b = universe_a.fork()
 
     # Inject a coherent Word into System B
     observer = Consciousness(frequency=7.83)
@@ -52,12 +45,6 @@ def run_chronos_dilation_test(
         auto_observe=True,
     )
 
-    print(f"System A particles: {universe_a.get_complexity()}")
-    print(f"System B particles: {universe_b.get_complexity()} (includes Word {word.freq:.2f}Hz)")
-    print(f"Entropy factor: {entropy_factor}")
-    print(f"Steps: {steps}, dt: {dt}")
-    print()
-
     # Track temporal metrics
     tau_a, tau_b = [], []
     omega_a, omega_b = [], []
@@ -84,6 +71,57 @@ def run_chronos_dilation_test(
     delta = tau_growth_a - tau_growth_b
     delta_pct = (delta / tau_growth_a * 100.0) if tau_growth_a != 0 else 0.0
 
+    return {
+        "particles_a": universe_a.get_complexity(),
+        "particles_b": universe_b.get_complexity(),
+        "word_freq": word.freq,
+        "tau_a": tau_a,
+        "tau_b": tau_b,
+        "omega_a": omega_a,
+        "omega_b": omega_b,
+        "tau_growth_a": tau_growth_a,
+        "tau_growth_b": tau_growth_b,
+        "temporal_drag": delta,
+        "temporal_drag_pct": delta_pct,
+    }
+
+
+def chronos_dilation_metrics(**params) -> dict:
+    """Scalar results of simulate_chronos_dilation (parameter-sweep target)."""
+    result = simulate_chronos_dilation(**params)
+    return {
+        name: value
+        for name, value in result.items()
+        if name in ("tau_growth_a", "tau_growth_b", "temporal_drag", "temporal_drag_pct")
+    }
+
+
+def run_chronos_dilation_test(
+    octaves: int = 3,
+    steps: int = 100,
+    dt: float = 0.01,
+    entropy_factor: float = 0.05,
+    injected_freq: float = 5.5,
+    seed: int = 1234,
+):
+    print("=" * 70)
+    print("OMEGA CODE v0.3 — CHRONOS DILATION TEST")
+    print("Temporal Drag Hypothesis: Does Meaning slow Ωτ?")
+    print("=" * 70)
+    print()
+
+    result = simulate_chronos_dilation(octaves, steps, dt, entropy_factor, injected_freq, seed)
+    tau_a, tau_b = result["tau_a"], result["tau_b"]
+    omega_a, omega_b = result["omega_a"], result["omega_b"]
+    tau_growth_a, tau_growth_b = result["tau_growth_a"], result["tau_growth_b"]
+    delta, delta_pct = result["temporal_drag"], result["temporal_drag_pct"]
+
+    print(f"System A particles: {result['particles_a']}")
+    print(f"System B particles: {result['particles_b']} (includes Word {result['word_freq']:.2f}Hz)")
+    print(f"Entropy factor: {entropy_factor}")
+    print(f"Steps: {steps}, dt: {dt}")
+    print()
+
     print("RESULTS:")
     print(f"  Ωτ growth rate (System A): {tau_growth_a:.6f}")
     print(f"  Ωτ growth rate (System B): {tau_growth_b:.6f}")
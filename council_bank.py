@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Council Bank
+
+Trust-weighted councils hold one trust weight per observer and update it
+from how well each observer aligned with the consensus. CouncilBank holds
+the trust of C councils × M observers as 2-D arrays and updates, normalizes
+and weighs phases for every council in one call, so tens of thousands of
+councils cost a handful of array operations per step.
+
+The update rule is assembled from pluggable policies:
+
+    target ← (1 - lr) · target + lr · alignment − decay(alignment, participation)
+    target ← normalize(clip(target, floor, 1))
+    trust  ← normalize(clip(hysteresis(trust, target), floor, 1))   (if any)
+
+- decay: NonParticipationDecay (self-healing councils),
+  MisalignmentDecay (hysteresis councils) or None
+- participation: per-iteration flags, e.g. DutyCycle (an observer
+  schedule, so the flags of a whole run compile to one (T, M) table);
+  a council whose observers drop out sees their trust decay
+- hysteresis: LaggedTrust makes the published trust lag its target
+
+TrustWeightedCouncil, TrustDecayCouncil and TrustHysteresisCouncil are
+single-council views over a bank.
+"""
+
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from observer_schedule import Dropout, Schedule
+
+Participation = Callable[[int], np.ndarray]
+
+
+class NonParticipationDecay:
+    """Trust decays by `rate` for every step an observer sits out."""
+
+    def __init__(self, rate: float = 0.02):
+        self.rate = rate
+
+    def __call__(self, alignments: np.ndarray, participation: np.ndarray) -> np.ndarray:
+        return self.rate * (1.0 - participation)
+
+
+class MisalignmentDecay:
+    """Trust decays in proportion to an observer's misalignment."""
+
+    def __init__(self, rate: float = 0.02):
+        self.rate = rate
+
+    def __call__(self, alignments: np.ndarray, participation: np.ndarray) -> np.ndarray:
+        return self.rate * (1.0 - alignments)
+
+
+class LaggedTrust:
+    """Hysteresis: published trust moves a fraction `coeff` toward its target each step."""
+
+    def __init__(self, coeff: float = 0.1):
+        self.coeff = coeff
+
+    def __call__(self, trust: np.ndarray, target: np.ndarray) -> np.ndarray:
+        return (1.0 - self.coeff) * trust + self.coeff * target
+
+
+class DutyCycle(Schedule):
+    """
+    Participation flags: the listed observers take part for `active` of
+    every `period` iterations (optionally shifted per council); the rest
+    always participate. A scalar iteration gives (M,) or (C, M) flags, an
+    array of T iterations (T, M) or (T, C, M).
+
+    Args:
+        observers: Observer count M
+        intermittent: Indices of the observers that drop out
+        period: Cycle length in iterations
+        active: Iterations per cycle the intermittent observers participate
+        offsets: Optional (C,) per-council cycle shift
+    """
+
+    def __init__(
+        self,
+        observers: int,
+        intermittent: Sequence[int],
+        period: int,
+        active: int,
+        offsets: Optional[Sequence[int]] = None,
+    ):
+        self.intermittent = np.zeros(observers, dtype=bool)
+        self.intermittent[list(intermittent)] = True
+        self.offsets = None if offsets is None else np.asarray(offsets, dtype=np.int64)[:, None]
+        self.present = Dropout(int(period), int(active), 0 if self.offsets is None else self.offsets)
+
+    @property
+    def period(self) -> int:
+        return self.present.period
+
+    @property
+    def active(self) -> int:
+        return self.present.active
+
+    def evaluate(self, iterations: np.ndarray) -> np.ndarray:
+        # Trailing axes for the observer (and council) dimensions
+        trailing = (1,) if self.offsets is None else (1, 1)
+        present = self.present.evaluate(iterations.reshape(iterations.shape + trailing))
+        return np.where(self.intermittent, present, 1.0)
+
+
+def alignment_scores(phases: np.ndarray, consensus: np.ndarray) -> np.ndarray:
+    """1 - min(1, |φ - consensus| / 2π) per observer; consensus is per council."""
+    phases = np.asarray(phases, dtype=float)
+    consensus = np.asarray(consensus, dtype=float)
+    if phases.ndim == 2:
+        consensus = consensus.reshape(-1, 1)
+    return 1.0 - np.minimum(1.0, np.abs(phases - consensus) / (2 * np.pi))
+
+
+def _normalize(trust: np.ndarray, floor: float) -> np.ndarray:
+    np.clip(trust, floor, 1.0, out=trust)
+    trust /= np.sum(trust, axis=1, keepdims=True)
+    return trust
+
+
+class CouncilBank:
+    """
+    Trust of C councils × M observers.
+
+    Args:
+        trust: Initial (C, M) trust, or (M,) shared by `councils` councils
+        councils: Council count when `trust` is a single row
+        learning_rate: Weight of the latest alignment in the trust target
+        floor: Minimum trust before normalization
+        decay: Policy (alignments, participation) -> (C, M) decay, or None
+        participation: Policy iteration -> (C, M) or (M,) flags, or None
+        hysteresis: Policy (trust, target) -> trust, or None (trust = target)
+    """
+
+    def __init__(
+        self,
+        trust,
+        councils: Optional[int] = None,
+        learning_rate: float = 0.05,
+        floor: float = 0.02,
+        decay=None,
+        participation: Optional[Participation] = None,
+        hysteresis=None,
+    ):
+        trust = np.array(trust, dtype=float)
+        if trust.ndim == 1:
+            trust = np.tile(trust, (councils or 1, 1))
+        self.target = trust
+        self.trust = trust.copy() if hysteresis is not None else trust
+        self.learning_rate = learning_rate
+        self.floor = floor
+        self.decay = decay
+        self.participation = participation
+        self.hysteresis = hysteresis
+
+    @classmethod
+    def uniform(cls, councils: int, observers: int, **policies) -> 'CouncilBank':
+        """Every observer of every council starts with equal trust."""
+        return cls(np.full((councils, observers), 1.0 / observers), **policies)
+
+    @property
+    def councils(self) -> int:
+        return self.trust.shape[0]
+
+    @property
+    def observers(self) -> int:
+        return self.trust.shape[1]
+
+    def weighted_phase(self, phases) -> np.ndarray:
+        """Trust-weighted consensus phase of each council, shape (C,); phases are (C, M) or (M,)."""
+        return np.sum(np.asarray(phases, dtype=float) * self.trust, axis=1)
+
+    def update(
+        self,
+        alignments,
+        participation=None,
+        iteration: Optional[int] = None,
+        learning_rate: Optional[float] = None,
+    ):
+        """
+        One trust step for every council. Participation defaults to the
+        participation policy at `iteration` (or full participation).
+        """
+        learning_rate = self.learning_rate if learning_rate is None else learning_rate
+        alignments = np.asarray(alignments, dtype=float)
+
+        target = (1.0 - learning_rate) * self.target + learning_rate * alignments
+        if self.decay is not None:
+            if participation is None:
+                participation = self.participation(iteration) if self.participation is not None else 1.0
+            target -= self.decay(alignments, np.asarray(participation, dtype=float))
+        self.target = _normalize(target, self.floor)
+
+        if self.hysteresis is None:
+            self.trust = self.target
+        else:
+            self.trust = _normalize(self.hysteresis(self.trust, self.target), self.floor)
+
+    def step(self, phases, participation=None, iteration: Optional[int] = None) -> np.ndarray:
+        """
+        Weighted consensus from the current trust, then a trust update from
+        each observer's alignment with it. Returns the (C,) consensus phases.
+        """
+        phases = np.broadcast_to(np.asarray(phases, dtype=float), self.trust.shape)
+        consensus = self.weighted_phase(phases)
+        self.update(alignment_scores(phases, consensus), participation, iteration)
+        return consensus
+
+
+def run_council_bank(
+    bank: CouncilBank,
+    observer_phases: Callable[[int], np.ndarray],
+    iterations: int,
+) -> np.ndarray:
+    """
+    Step every council for `iterations` rounds with observer_phases(iteration)
+    -> (C, M) or (M,) phases. Returns the (iterations, C) consensus phases.
+    """
+    consensus = np.empty((iterations, bank.councils))
+    for iteration in range(iterations):
+        consensus[iteration] = bank.step(observer_phases(iteration), iteration=iteration)
+    return consensus
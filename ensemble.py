@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Universe Ensembles
+
+Many experiments compare nearly identical universes, and Monte Carlo
+studies need thousands of replicas of one. UniverseEnsemble holds K
+replicas that share a particle layout (frequencies) as K×N state arrays
+and steps them together: decoherence, phase locking, observation,
+coherence and Omega Time each update all replicas in one array pass,
+random draws included.
+
+Replicas differ only in their random draws (and in any per-replica
+frequencies, entropy or lock targets passed in). The draws are counter-based: each
+step takes one 64-bit key from streams.child(purpose, step), and the draw
+for replica k, particle j is a SplitMix64 hash of (key, k, j), computed
+for the whole (K, N) block at once. Replica k's trajectory therefore does
+not depend on how many replicas run beside it: an ensemble can be run in
+batches (first_replica) and still reproduce one large run bit for bit.
+Entanglement is not mirrored; use UniversalSymphony when partner collapse
+matters.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from unity_script import (
+    STREAM_DECOHERENCE,
+    STREAM_OBSERVATION,
+    QuantumParticle,
+    RandomStreams,
+    UniversalSymphony,
+)
+
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer, elementwise on uint64 arrays (wrapping arithmetic)."""
+    x = x + _GOLDEN
+    x = (x ^ (x >> np.uint64(30))) * _MIX_1
+    x = (x ^ (x >> np.uint64(27))) * _MIX_2
+    return x ^ (x >> np.uint64(31))
+
+
+def counter_uniform(key: int, rows: np.ndarray, columns: int, lane: int = 0) -> np.ndarray:
+    """
+    (len(rows), columns) uniforms in (0, 1], one per (key, row, column, lane).
+    A row's values depend only on its own index, never on the other rows.
+    """
+    row_keys = _mix64(np.uint64(key) ^ np.asarray(rows, dtype=np.uint64))
+    counters = np.arange(columns, dtype=np.uint64) * np.uint64(2) + np.uint64(lane)
+    bits = _mix64(row_keys[:, None] ^ counters)
+    return ((bits >> np.uint64(11)) + np.uint64(1)) * (1.0 / 2.0 ** 53)
+
+
+def counter_normal(key: int, rows: np.ndarray, columns: int) -> np.ndarray:
+    """Standard normals from two counter_uniform lanes (Box-Muller)."""
+    radius = np.sqrt(-2.0 * np.log(counter_uniform(key, rows, columns, 0)))
+    return radius * np.cos(2.0 * np.pi * counter_uniform(key, rows, columns, 1))
+
+
+class UniverseEnsemble:
+    """
+    K replicas of one particle layout, stepped in lockstep.
+
+    Args:
+        template: Universe whose live particles define the layout and initial state
+        replicas: Number of replicas K
+        seed: Seed for the ensemble's random streams
+        first_replica: Index of the first replica, for running an ensemble in batches
+    """
+
+    def __init__(self, template: UniversalSymphony, replicas: int, seed=None, first_replica: int = 0):
+        if replicas < 1:
+            raise ValueError("An ensemble needs at least one replica")
+        self.freq = template._view('freq').copy()
+        self.depth = template._view('depth').copy()
+        self.max_depth = template._view('max_depth').copy()
+        self.phase = np.tile(template._view('phase'), (replicas, 1))
+        self.observed = np.tile(template._view('observed'), (replicas, 1))
+        self.superposition = np.tile(template._view('superposition'), (replicas, 1))
+        self.omega_time = np.full(replicas, float(template.omega_time))
+        self.streams = RandomStreams(seed)
+        self.first_replica = int(first_replica)
+        self._decoherence_step = 0
+        self._observation_step = 0
+
+    @classmethod
+    def from_frequencies(
+        cls,
+        frequencies: Sequence[float],
+        replicas: int,
+        observed: bool = True,
+        seed=None,
+    ) -> 'UniverseEnsemble':
+        """
+        Ensemble of root-level particles at the given frequencies: (N,) shared
+        by every replica, or (K, N) with one row of frequencies per replica.
+        """
+        frequencies = np.asarray(frequencies, dtype=float)
+        if frequencies.ndim == 2 and len(frequencies) != replicas:
+            raise ValueError(f"Per-replica frequencies have {len(frequencies)} rows for {replicas} replicas")
+        root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        template_seed, ensemble_seed = (
+            np.random.SeedSequence(root.entropy, spawn_key=tuple(root.spawn_key) + (child,), pool_size=root.pool_size)
+            for child in range(2)
+        )
+        template = UniversalSymphony(seed=template_seed)
+        layout = frequencies if frequencies.ndim == 1 else frequencies[0]
+        particles = [QuantumParticle(frequency=float(f), depth=0, rng=template.streams.universe) for f in layout]
+        if observed:
+            for particle in particles:
+                particle.observe()
+        template.add_all(particles)
+        ensemble = cls(template, replicas, seed=ensemble_seed)
+        if frequencies.ndim == 2:
+            ensemble.freq = frequencies.copy()
+        return ensemble
+
+    @property
+    def replicas(self) -> int:
+        return self.phase.shape[0]
+
+    @property
+    def size(self) -> int:
+        return self.phase.shape[1]
+
+    def _per_replica(self, value) -> np.ndarray:
+        """Scalar or (K,) value as a (K, 1) column for broadcasting."""
+        return np.broadcast_to(np.asarray(value, dtype=float), (self.replicas,))[:, None]
+
+    def _step_key(self, purpose: int, step: int) -> int:
+        return int(self.streams.child(purpose, step).generate_state(1, np.uint64)[0])
+
+    @property
+    def _rows(self) -> np.ndarray:
+        return np.arange(self.first_replica, self.first_replica + self.replicas)
+
+    def apply_decoherence(self, entropy_factor=0.001):
+        """Phase drift on every replica; entropy_factor may be per-replica (K,)."""
+        noise = counter_normal(self._step_key(STREAM_DECOHERENCE, self._decoherence_step), self._rows, self.size)
+        self._decoherence_step += 1
+        self.phase += noise * self._per_replica(entropy_factor)
+
+    def lock_phase(self, indices, phase):
+        """Set the selected particles' phase (scalar or per-replica (K,)) and observe them."""
+        indices = np.asarray(indices, dtype=np.int64)
+        self.phase[:, indices] = self._per_replica(phase)
+        self.observed[:, indices] = True
+
+    def mean_phase(self, indices=None) -> np.ndarray:
+        """Mean phase of the selected particles in each replica, shape (K,)."""
+        phase = self.phase if indices is None else self.phase[:, np.asarray(indices, dtype=np.int64)]
+        return phase.mean(axis=1)
+
+    def observe(self, indices=None, probability: float = 1.0) -> np.ndarray:
+        """Collapse the selected particles in every replica; returns the (K, n) outcomes (NaN if not hit)."""
+        indices = np.arange(self.size) if indices is None else np.asarray(indices, dtype=np.int64)
+        hit = np.ones((self.replicas, len(indices)), dtype=bool)
+        if probability < 1.0:
+            # Every particle draws, as in UniversalSymphony.observe, so a draw never depends on the selection
+            draws = counter_uniform(self._step_key(STREAM_OBSERVATION, self._observation_step), self._rows, self.size)
+            self._observation_step += 1
+            hit = draws[:, indices] < probability
+        observed = self.observed[:, indices]
+        observed |= hit
+        self.observed[:, indices] = observed
+        collapsed = np.where(self.superposition[:, indices] > 0.5, 1.0, 0.0)
+        return np.where(hit, collapsed, np.nan)
+
+    def get_coherence(self) -> np.ndarray:
+        """Phase coherence of each replica, shape (K,)."""
+        if self.size == 0:
+            return np.ones(self.replicas)
+        return np.abs(np.mean(np.exp(1j * self.phase), axis=1))
+
+    @property
+    def emergent_time(self) -> np.ndarray:
+        """Ωτ of each replica: mean absolute phase, shape (K,)."""
+        if self.size == 0:
+            return np.zeros(self.replicas)
+        return np.mean(np.abs(self.phase), axis=1)
+
+    def get_observed_count(self) -> np.ndarray:
+        return np.count_nonzero(self.observed, axis=1)
+
+    def tick(self, dt: float = 1.0):
+        """Advance every replica's Omega Time by its own Σ|freq|·dt (freq is (N,) or per-replica (K, N))."""
+        self.omega_time += np.sum(np.abs(self.freq), axis=-1) * dt
+
+    def get_omega_time(self) -> np.ndarray:
+        return self.omega_time
+
+    def replica(self, k: int) -> UniversalSymphony:
+        """Materialize replica k as a standalone UniversalSymphony."""
+        universe = UniversalSymphony()
+        freq = np.broadcast_to(self.freq, self.phase.shape)[k]
+        particles = []
+        for j in range(self.size):
+            particle = QuantumParticle(
+                frequency=float(freq[j]),
+                depth=int(self.depth[j]),
+                max_depth=int(self.max_depth[j]),
+            )
+            particle.phase = float(self.phase[k, j])
+            particle.is_observed = bool(self.observed[k, j])
+            particle._superposition_value = float(self.superposition[k, j])
+            particles.append(particle)
+        universe.add_all(particles)
+        universe.omega_time = float(self.omega_time[k])
+        return universe
+
+
+def run_ensemble_trajectory(
+    ensemble: UniverseEnsemble,
+    iterations: int,
+    entropy_factor=0.002,
+    lock_indices: Optional[Sequence[int]] = None,
+    lock_every: int = 0,
+    lock_phase=None,
+) -> np.ndarray:
+    """
+    Step an ensemble and return its (iterations, K) coherence trajectory.
+    With lock_every > 0 the lock_indices are locked to lock_phase (scalar or
+    per-replica), or to their own mean phase when lock_phase is None.
+    """
+    coherence = np.empty((iterations, ensemble.replicas))
+    for iteration in range(iterations):
+        ensemble.apply_decoherence(entropy_factor)
+        if lock_every and lock_indices is not None and iteration % lock_every == 0:
+            target = ensemble.mean_phase(lock_indices) if lock_phase is None else lock_phase
+            ensemble.lock_phase(lock_indices, target)
+        coherence[iteration] = ensemble.get_coherence()
+    return coherence
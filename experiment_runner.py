@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Declarative Experiment Runner
+
+The observer experiments all share one shape: a base universe, a few
+injected Words, decoherence every iteration, periodic phase locking of the
+Words to a consensus target, and a monitor recording each step. A
+ScenarioSpec describes one such experiment declaratively and run_scenario
+executes it with a single inner loop:
+
+- decoherence and observer phase schedules are evaluated for the whole run
+  up front (vectorized over iterations)
+- stateless consensus is computed for every iteration at once; stateful
+  councils supply a per-step policy instead
+- locking uses UniversalSymphony.lock_phase over the Word positions
+
+run_cached_scenario memoizes a seeded scenario in a ResultCache, so
+repeated regression runs restore its final state instead of re-running it.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from checkpoint import Checkpointer, load_object_state, object_state
+from result_cache import ResultCache, Source
+from unity_script import Consciousness, QuantumParticle, UniversalSymphony
+
+PhaseSchedule = Callable[[np.ndarray], np.ndarray]
+Consensus = Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]
+Policy = Callable[[int, np.ndarray], Tuple[float, float]]
+
+
+@dataclass
+class ScenarioStep:
+    """What one iteration decided, passed to the record and progress hooks."""
+    iteration: int
+    phases: Optional[np.ndarray]
+    target: float
+    alignment: float
+    locked: bool
+
+
+def alignment_from_spread(phases: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """Mean over observers of 1 - min(1, |φ - target| / 2π), per iteration."""
+    distance = np.abs(phases - np.asarray(target)[:, None]) / (2 * np.pi)
+    return np.mean(1.0 - np.minimum(1.0, distance), axis=1)
+
+
+def mean_consensus(phases: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Default consensus: every observer weighs equally."""
+    target = np.mean(phases, axis=1)
+    return target, alignment_from_spread(phases, target)
+
+
+@dataclass
+class ScenarioSpec:
+    """
+    Declarative description of an observer experiment.
+
+    Args:
+        name: Label used in progress output
+        iterations: Number of steps
+        monitor: Factory (universe, waves) -> monitor
+        record: Hook (monitor, step) recording one iteration
+        base_frequencies: Observed root-level particles of the base universe
+        word_frequencies: Words injected by a 7.83 Hz observer
+        word_phase: Initial phase of the injected Words
+        entropy: Decoherence schedule, a constant or f(iterations) -> (T,)
+        lock_every: Lock the Words every this many iterations (0 disables)
+        lock_to_waves: Lock to the Words' own mean phase instead of the
+            observer consensus
+        observer_phases: f(iterations) -> (T, M) observer phase schedule
+        consensus: Vectorized (T, M) phases -> (targets, alignments)
+        policy: Stateful per-step (iteration, phases) -> (target, alignment);
+            overrides `consensus`
+        progress: Optional (monitor, step) -> line printed every
+            `progress_every` iterations
+        seed: Seed for the universe's random streams
+    """
+    name: str
+    iterations: int
+    monitor: Callable[[UniversalSymphony, List[QuantumParticle]], Any]
+    record: Callable[[Any, ScenarioStep], None] = lambda monitor, step: monitor.record()
+    base_frequencies: Sequence[float] = (1.0, 2.0, 3.0, 4.0)
+    word_frequencies: Sequence[float] = (8.0, 10.0, 12.0)
+    word_phase: float = 0.0
+    entropy: Union[float, PhaseSchedule] = 0.002
+    lock_every: int = 4
+    lock_to_waves: bool = False
+    observer_phases: Optional[PhaseSchedule] = None
+    consensus: Consensus = mean_consensus
+    policy: Optional[Policy] = None
+    progress: Optional[Callable[[Any, ScenarioStep], str]] = None
+    progress_every: int = 100
+    seed: Any = None
+
+
+@dataclass
+class ScenarioResult:
+    spec: ScenarioSpec
+    universe: UniversalSymphony
+    waves: List[QuantumParticle]
+    monitor: Any
+    targets: np.ndarray = field(repr=False)
+    alignments: np.ndarray = field(repr=False)
+
+
+def build_universe(spec: ScenarioSpec) -> Tuple[UniversalSymphony, List[QuantumParticle]]:
+    """Base universe plus the spec's injected Words."""
+    universe = UniversalSymphony(seed=spec.seed)
+    base = []
+    for freq in spec.base_frequencies:
+        particle = QuantumParticle(frequency=freq, depth=0, rng=universe.streams.universe)
+        particle.observe()
+        base.append(particle)
+    universe.add_all(base)
+
+    observer = Consciousness(frequency=7.83)
+    waves = [
+        observer.inject_frequency(
+            symphony=universe,
+            frequency=freq,
+            amplitude=1.0,
+            phase=spec.word_phase,
+            auto_observe=True,
+        )
+        for freq in spec.word_frequencies
+    ]
+    return universe, waves
+
+
+def _schedule(value, iterations: np.ndarray) -> np.ndarray:
+    if callable(value):
+        return np.broadcast_to(np.asarray(value(iterations), dtype=float), iterations.shape)
+    return np.full(iterations.shape, float(value))
+
+
+def run_scenario(spec: ScenarioSpec, checkpoint: Optional[Checkpointer] = None) -> ScenarioResult:
+    """
+    Execute a scenario and return its universe, Words and monitor.
+    With a Checkpointer the run resumes from its last checkpoint and saves
+    universe, monitor, policy and targets as it goes.
+    """
+    universe, waves = build_universe(spec)
+    monitor = spec.monitor(universe, waves)
+
+    steps = np.arange(spec.iterations)
+    entropy = _schedule(spec.entropy, steps)
+    phases = None
+    if spec.observer_phases is not None:
+        phases = np.asarray(spec.observer_phases(steps), dtype=float).reshape(spec.iterations, -1)
+    if phases is not None and spec.policy is None:
+        targets, alignments = (np.asarray(v, dtype=float) for v in spec.consensus(phases))
+    else:
+        targets = np.zeros(spec.iterations)
+        alignments = np.ones(spec.iterations)
+    locked = (steps % spec.lock_every == 0) if spec.lock_every else np.zeros(spec.iterations, dtype=bool)
+
+    word_positions = universe.indices_of([wave.particle_id for wave in waves])
+    state = dict(universe=universe, monitor=monitor, targets=targets, alignments=alignments)
+    if spec.policy is not None:
+        state['policy'] = spec.policy
+    start = checkpoint.resume(**state) if checkpoint is not None else 0
+    for iteration in range(start, spec.iterations):
+        universe.apply_decoherence(entropy_factor=entropy[iteration])
+
+        row = phases[iteration] if phases is not None else None
+        if spec.policy is not None:
+            targets[iteration], alignments[iteration] = spec.policy(iteration, row)
+        if locked[iteration]:
+            if spec.lock_to_waves:
+                targets[iteration] = float(np.mean(universe._view('phase')[word_positions]))
+            universe.lock_phase(word_positions, targets[iteration])
+
+        step = ScenarioStep(
+            iteration=iteration,
+            phases=row,
+            target=float(targets[iteration]),
+            alignment=float(alignments[iteration]),
+            locked=bool(locked[iteration]),
+        )
+        spec.record(monitor, step)
+        if spec.progress is not None and (iteration + 1) % spec.progress_every == 0:
+            print(spec.progress(monitor, step))
+        if checkpoint is not None:
+            checkpoint.maybe_save(iteration + 1, **state)
+
+    return ScenarioResult(spec, universe, waves, monitor, targets, alignments)
+
+
+def _result_state(result: ScenarioResult) -> Dict[str, Any]:
+    """Final universe, monitor and policy state (see checkpoint.object_state) plus targets and alignments."""
+    state: Dict[str, Any] = {'targets': result.targets, 'alignments': result.alignments}
+    objects = dict(universe=result.universe, monitor=result.monitor)
+    if result.spec.policy is not None:
+        objects['policy'] = result.spec.policy
+    for name, obj in objects.items():
+        state.update({f'{name}/{key}': value for key, value in object_state(obj).items()})
+    return state
+
+
+def run_cached_scenario(
+    spec: ScenarioSpec,
+    cache: ResultCache,
+    params: Mapping[str, Any],
+    sources: Sequence[Source] = (),
+) -> ScenarioResult:
+    """
+    run_scenario memoized in a ResultCache. A spec's callables cannot be
+    hashed, so `params` must identify the scenario (e.g. the arguments of
+    the factory that built it); the key also covers spec.name, spec.seed,
+    this module and `sources`. On a hit the universe is rebuilt and the
+    stored state loaded into it, the monitor and the policy, as a checkpoint
+    resume would. Unseeded specs always run.
+    """
+    ran: List[ScenarioResult] = []
+
+    def compute():
+        ran.append(run_scenario(spec))
+        return _result_state(ran[0])
+
+    state = cache.stage(f'scenario.{spec.name}', compute, dict(params), spec.seed, [run_scenario] + list(sources))
+    if ran:
+        return ran[0]
+
+    universe, waves = build_universe(spec)
+    monitor = spec.monitor(universe, waves)
+    objects = dict(universe=universe, monitor=monitor)
+    if spec.policy is not None:
+        objects['policy'] = spec.policy
+    nested: Dict[str, Dict[str, Any]] = {name: {} for name in objects}
+    for key, value in state.items():
+        name, _, rest = key.partition('/')
+        if rest:
+            nested[name][rest] = value
+    for name, obj in objects.items():
+        load_object_state(obj, nested[name])
+    return ScenarioResult(spec, universe, waves, monitor, state['targets'], state['alignments'])
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — N-Way Council Federation
+
+Federation reconciles the observer phases of many councils: every council
+is nudged toward the median phases of the councils it is linked to. The
+links form a FederationTopology stored as a sparse (CSR) adjacency:
+
+- complete:  every council hears every other (two councils = the original
+             FederationProtocol)
+- ring:      each council hears its `reach` neighbours on either side
+- tree:      a `branching`-ary hierarchy; councils hear parent and children
+- gossip:    a random graph where each council picks `degree` peers
+
+One reconciliation round computes all council medians at once (np.median
+partitions along the observer axis instead of sorting), averages the
+neighbours' medians with a single bincount over the edge list, and applies
+every council's correction in one broadcast.
+
+By default a round corrects only the phases it is given, as the original
+two-council protocol did. With persistent=True each council keeps its
+accumulated correction as an offset applied to all later phases, so the
+council medians actually converge and the rate depends on the topology.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from history_recorder import HistoryRecorder
+
+
+class FederationTopology:
+    """
+    Directed sparse adjacency between councils (CSR: council c hears
+    indices[indptr[c]:indptr[c + 1]]).
+    """
+
+    def __init__(self, councils: int, indptr: np.ndarray, indices: np.ndarray, name: str = "custom"):
+        self.councils = int(councils)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.name = name
+        self._rows = np.repeat(np.arange(self.councils), np.diff(self.indptr))
+
+    @classmethod
+    def from_edges(cls, councils: int, sources, targets, name: str = "custom", symmetric: bool = True) -> 'FederationTopology':
+        """Topology from edge lists (target hears source); duplicates and self-loops are dropped."""
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if symmetric:
+            sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+        keep = sources != targets
+        pairs = np.unique(np.stack([targets[keep], sources[keep]], axis=1), axis=0)
+        indptr = np.zeros(councils + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pairs[:, 0], minlength=councils), out=indptr[1:])
+        return cls(councils, indptr, pairs[:, 1], name)
+
+    @classmethod
+    def complete(cls, councils: int) -> 'FederationTopology':
+        rows, cols = np.nonzero(~np.eye(councils, dtype=bool))
+        return cls.from_edges(councils, cols, rows, "complete", symmetric=False)
+
+    @classmethod
+    def ring(cls, councils: int, reach: int = 1) -> 'FederationTopology':
+        nodes = np.arange(councils)
+        sources = np.concatenate([nodes for _ in range(reach)])
+        targets = np.concatenate([(nodes + step) % councils for step in range(1, reach + 1)])
+        return cls.from_edges(councils, sources, targets, "ring")
+
+    @classmethod
+    def tree(cls, councils: int, branching: int = 2) -> 'FederationTopology':
+        children = np.arange(1, councils)
+        return cls.from_edges(councils, (children - 1) // branching, children, "tree")
+
+    @classmethod
+    def gossip(cls, councils: int, degree: int = 3, seed=None) -> 'FederationTopology':
+        rng = np.random.default_rng(seed)
+        sources = np.repeat(np.arange(councils), degree)
+        # Offsets in [1, councils) never pick the council itself
+        targets = (sources + rng.integers(1, max(2, councils), size=len(sources))) % councils
+        return cls.from_edges(councils, sources, targets, "gossip")
+
+    @property
+    def edges(self) -> int:
+        return len(self.indices)
+
+    def degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def neighbour_mean(self, values: np.ndarray) -> np.ndarray:
+        """Mean of each council's neighbours' values (its own value if it has none)."""
+        total = np.bincount(self._rows, weights=values[self.indices], minlength=self.councils)
+        degree = self.degree()
+        return np.where(degree > 0, total / np.maximum(degree, 1), values)
+
+    def edge_values(self, values: np.ndarray):
+        """(listener, speaker) value pairs for every directed edge."""
+        return values[self._rows], values[self.indices]
+
+
+def council_medians(phases: np.ndarray) -> np.ndarray:
+    """Median observer phase of every council, shape (C,)."""
+    return np.median(np.asarray(phases, dtype=float), axis=1)
+
+
+class NWayFederation:
+    """
+    Federation of C councils over a topology.
+
+    Args:
+        topology: Which councils hear which
+        sync_strength: Fraction of the gap to the neighbours' median closed per round
+        capacity: Expected number of rounds (for the sync history)
+        persistent: Keep each council's accumulated correction as an offset
+    """
+
+    def __init__(
+        self,
+        topology: FederationTopology,
+        sync_strength: float = 0.02,
+        capacity: Optional[int] = None,
+        persistent: bool = False,
+    ):
+        self.topology = topology
+        self.sync_strength = sync_strength
+        self.persistent = persistent
+        self.offsets = np.zeros(topology.councils)
+        self.history = HistoryRecorder(['sync', 'spread'], capacity=capacity)
+
+    @property
+    def sync_index(self) -> float:
+        """Mean sync over all rounds so far (0.0 before the first)."""
+        return float(np.mean(self.history['sync'])) if len(self.history) else 0.0
+
+    def apply(self, phases) -> np.ndarray:
+        """(C, M) phases shifted by the accumulated offsets (unchanged unless persistent)."""
+        phases = np.asarray(phases, dtype=float)
+        return phases + self.offsets[:, None] if self.persistent else phases
+
+    def reconcile(self, phases) -> np.ndarray:
+        """
+        One round for every council: shift each council's (C, M) observer
+        phases toward the mean median of its neighbours. Records the mean
+        edge sync exp(-|Δmedian|) and the spread of the medians.
+        """
+        phases = self.apply(phases)
+        medians = council_medians(phases)
+        correction = self.sync_strength * (self.topology.neighbour_mean(medians) - medians)
+        if self.persistent:
+            self.offsets += correction
+        corrected = phases + correction[:, None]
+
+        listener, speaker = self.topology.edge_values(medians)
+        sync = float(np.mean(np.exp(-np.abs(listener - speaker)))) if self.topology.edges else 1.0
+        self.history.record(sync=sync, spread=float(np.std(medians)))
+        return corrected
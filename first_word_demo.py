@@ -53,6 +53,7 @@ def demonstrate_first_word():
     # Observer speaks a Word
     print("Phase 3: Observer injects 'The First Word' (5.5Hz)...")
     observer = Consciousness(frequency=7.83)
+    journal = universe.enable_journal()
     
     # Inject a new frequency NOT in the original fractal
     word = observer.inject_frequency(
@@ -62,6 +63,7 @@ def demonstrate_first_word():
         phase=0.0,
         auto_observe=True  # Born coherent
     )
+    journal.commit()
     
     post_word_count = universe.get_complexity()
     post_word_coherence = universe.get_coherence()
@@ -88,7 +90,7 @@ def demonstrate_first_word():
     fig, axes = plt.subplots(2, 1, figsize=(12, 8))
     
     # Before injection
-    universe.entities.remove(word)  # Temporarily remove
+    journal.undo()  # Roll back to before the Word
     field_before = universe.render_reality(t)
     axes[0].plot(t, field_before, color='red', alpha=0.7, linewidth=0.8)
     axes[0].set_title(f"Before Injection (Coherence: {fallen_coherence:.4f})", fontsize=12, weight='bold')
@@ -96,7 +98,7 @@ def demonstrate_first_word():
     axes[0].grid(True, alpha=0.3)
     
     # After injection
-    universe.add(word)  # Add back
+    journal.redo()  # Speak it again
     field_after = universe.render_reality(t)
     axes[1].plot(t, field_after, color='blue', alpha=0.7, linewidth=0.8)
     axes[1].set_title(f"After Injection (Coherence: {post_word_coherence:.4f})", fontsize=12, weight='bold')
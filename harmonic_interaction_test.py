@@ -45,19 +45,28 @@ Date: February 4, 2026
 import numpy as np
 import matplotlib.pyplot as plt
 from unity_script import UniversalSymphony, QuantumParticle, Consciousness
-from typing import List, Tuple, Dict
+from history_recorder import HistoryRecorder, history_column
+from typing import List, Optional, Tuple, Dict
 import json
 
 
 class WaveInteractionMonitor:
     """Tracks the evolution of two interacting Standing Waves."""
+
+    coherence_a_history = history_column('coherence_a')
+    coherence_b_history = history_column('coherence_b')
+    phase_a_history = history_column('phase_a')
+    phase_b_history = history_column('phase_b')
+    cross_coherence_history = history_column('cross_coherence')
+    system_coherence_history = history_column('system_coherence')
     
     def __init__(
         self,
         universe: UniversalSymphony,
         wave_a: QuantumParticle,
         wave_b: QuantumParticle,
-        interaction_mode: str = "isolated"
+        interaction_mode: str = "isolated",
+        capacity: Optional[int] = None,
     ):
         self.universe = universe
         self.wave_a = wave_a
@@ -65,12 +74,10 @@ class WaveInteractionMonitor:
         self.interaction_mode = interaction_mode
         
         # History tracking
-        self.coherence_a_history = []
-        self.coherence_b_history = []
-        self.phase_a_history = []
-        self.phase_b_history = []
-        self.cross_coherence_history = []
-        self.system_coherence_history = []
+        self.history = HistoryRecorder(
+            ['coherence_a', 'coherence_b', 'phase_a', 'phase_b', 'cross_coherence', 'system_coherence'],
+            capacity=capacity,
+        )
         
         # Metrics
         self.harmonic_depth = 0.0
@@ -89,22 +96,22 @@ class WaveInteractionMonitor:
         coh_a = max(0.0, 1.0 - phase_diff_a / (2 * np.pi))
         coh_b = max(0.0, 1.0 - phase_diff_b / (2 * np.pi))
         
-        self.coherence_a_history.append(coh_a)
-        self.coherence_b_history.append(coh_b)
-        
-        # Phase tracking
-        self.phase_a_history.append(self.wave_a.phase)
-        self.phase_b_history.append(self.wave_b.phase)
-        
         # Cross-coherence: measure phase synchronization
         phase_diff = abs(self.wave_a.phase - self.wave_b.phase)
         # Normalize to [0, 1]: 0 = fully synchronized, 1 = completely out of phase
         cross_coh = 1.0 - (phase_diff % (2 * np.pi)) / (2 * np.pi)
-        self.cross_coherence_history.append(cross_coh)
         
         # System coherence (average of all particles)
         system_coh = self.universe.get_coherence()
-        self.system_coherence_history.append(system_coh)
+
+        self.history.record(
+            coherence_a=coh_a,
+            coherence_b=coh_b,
+            phase_a=self.wave_a.phase,
+            phase_b=self.wave_b.phase,
+            cross_coherence=cross_coh,
+            system_coherence=system_coh,
+        )
         
         # Harmonic depth: measure frequency ratio (how locked they are)
         if self.wave_b.freq > 0:
@@ -131,15 +138,15 @@ class WaveInteractionMonitor:
         """Return summary metrics for this interaction."""
         return {
             "mode": self.interaction_mode,
-            "final_coh_a": float(self.coherence_a_history[-1]) if self.coherence_a_history else 0.0,
-            "final_coh_b": float(self.coherence_b_history[-1]) if self.coherence_b_history else 0.0,
-            "avg_cross_coherence": float(np.mean(self.cross_coherence_history)) if self.cross_coherence_history else 0.0,
-            "peak_cross_coherence": float(np.max(self.cross_coherence_history)) if self.cross_coherence_history else 0.0,
+            "final_coh_a": self.history.last('coherence_a'),
+            "final_coh_b": self.history.last('coherence_b'),
+            "avg_cross_coherence": self.history.mean('cross_coherence'),
+            "peak_cross_coherence": self.history.max('cross_coherence'),
             "harmonic_depth": float(self.harmonic_depth),
             "emergence_indicator": float(self.emergence_indicator),
             "synchronization_point": self.synchronization_point,
             "total_iterations": self.iteration_count,
-            "system_coherence": float(self.system_coherence_history[-1]) if self.system_coherence_history else 0.0,
+            "system_coherence": self.history.last('system_coherence'),
         }
 
 
@@ -188,8 +195,8 @@ def run_isolated_waves(iterations: int = 500) -> Tuple[WaveInteractionMonitor, W
     )
     
     # Create monitors
-    monitor_a = WaveInteractionMonitor(universe_a, wave_a, wave_a, "isolated_a")
-    monitor_b = WaveInteractionMonitor(universe_b, wave_b, wave_b, "isolated_b")
+    monitor_a = WaveInteractionMonitor(universe_a, wave_a, wave_a, "isolated_a", capacity=iterations)
+    monitor_b = WaveInteractionMonitor(universe_b, wave_b, wave_b, "isolated_b", capacity=iterations)
     
     print(f"\nWave A: 13.0 Hz (isolated)")
     print(f"Wave B: 11.0 Hz (isolated)")
@@ -265,7 +272,7 @@ def run_frequency_coupled_waves(iterations: int = 500) -> WaveInteractionMonitor
         auto_observe=True
     )
     
-    monitor = WaveInteractionMonitor(universe, wave_a, wave_b, "frequency_coupling")
+    monitor = WaveInteractionMonitor(universe, wave_a, wave_b, "frequency_coupling", capacity=iterations)
     
     print(f"\nWave A: 13.0 Hz (in shared universe)")
     print(f"Wave B: 11.0 Hz (in shared universe)")
@@ -345,7 +352,7 @@ def run_harmonic_bonding_waves(iterations: int = 500) -> WaveInteractionMonitor:
         auto_observe=True
     )
     
-    monitor = WaveInteractionMonitor(universe, wave_a, wave_b, "harmonic_bonding")
+    monitor = WaveInteractionMonitor(universe, wave_a, wave_b, "harmonic_bonding", capacity=iterations)
     
     print(f"\nWave A: 8.0 Hz (root)")
     print(f"Wave B: 12.0 Hz (perfect fifth: 3/2 ratio)")
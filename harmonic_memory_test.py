@@ -20,9 +20,12 @@ from unity_script import (
     UniversalSymphony,
     generate_fractal_universe,
 )
+from memory_distance import SnapshotTrail, spectral_difference
+from snapshot import Snapshot
+from typing import Union
 
 
-def capture_state_signature(universe: UniversalSymphony) -> dict:
+def capture_state_signature(universe: Union[UniversalSymphony, Snapshot]) -> dict:
     """
     Capture the topological signature of the current universe state.
     
@@ -31,16 +34,27 @@ def capture_state_signature(universe: UniversalSymphony) -> dict:
       - observed_ratio: Proportion of collapsed particles
       - coherence: Global coherence metric
       - frequency_spectrum: All frequencies present
+
+    A universe's columns are copied once (the signature must not change as
+    the universe evolves); a Snapshot's memory-mapped columns are used as-is.
     """
-    phases = [p.phase for p in universe.entities]
-    observed_count = sum(1 for p in universe.entities if p.is_observed)
-    total_count = len(universe.entities)
+    if isinstance(universe, Snapshot):
+        return {
+            'phases': universe.column('phase'),
+            'observed_ratio': universe.observed_ratio(),
+            'coherence': universe.coherence(),
+            'frequency_spectrum': universe.column('freq'),
+            'total_particles': len(universe),
+        }
+
+    observed_count = int(np.count_nonzero(universe._view('observed')))
+    total_count = universe.columns.live_count
     
     return {
-        'phases': np.array(phases),
+        'phases': np.array(universe._view('phase')),
         'observed_ratio': observed_count / total_count if total_count > 0 else 0,
         'coherence': universe.get_coherence(),
-        'frequency_spectrum': np.array([p.freq for p in universe.entities]),
+        'frequency_spectrum': np.array(universe._view('freq')),
         'total_particles': total_count
     }
 
@@ -67,11 +81,10 @@ def compute_topological_distance(state_a: dict, state_b: dict) -> dict:
     # Observation Ratio Delta (Δr)
     ratio_delta = abs(state_a['observed_ratio'] - state_b['observed_ratio'])
     
-    # Spectral Similarity (frequency sets)
-    freq_a = set(np.round(state_a['frequency_spectrum'], 2))
-    freq_b = set(np.round(state_b['frequency_spectrum'], 2))
-    new_frequencies = freq_b - freq_a  # Frequencies that appeared
-    lost_frequencies = freq_a - freq_b  # Frequencies that vanished
+    # Spectral Similarity (sorted rounded spectra)
+    new, lost = spectral_difference(state_a['frequency_spectrum'], state_b['frequency_spectrum'])
+    new_frequencies = set(new.tolist())  # Frequencies that appeared
+    lost_frequencies = set(lost.tolist())  # Frequencies that vanished
     
     return {
         'phase_delta': phase_delta,
@@ -153,6 +166,13 @@ def run_harmonic_memory_test():
     print(f"  Observation Ratio Delta (Δr): {distance['ratio_delta']:.4f}")
     print(f"  New Frequencies: {distance['new_frequencies']}")
     print(f"  Lost Frequencies: {distance['lost_frequencies']}")
+
+    # Which earlier state does Unity₁ resemble most?
+    trail = SnapshotTrail().extend([state_innocent, state_fallen])
+    nearest, scores = trail.nearest(state_enlightened, k=2)
+    labels = ['Unity₀ (Innocent)', 'Fallen']
+    print(f"  Nearest earlier state: {labels[nearest[0]]} (score {scores[0]:.4f}, "
+          f"{labels[nearest[1]]}: {scores[1]:.4f})")
     print()
     
     # ========================================
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Columnar History Recorder
+
+Experiment monitors record a handful of metrics every iteration. Instead
+of appending Python floats to lists, HistoryRecorder writes them into
+preallocated NumPy columns (growing geometrically when the iteration count
+is unknown) and keeps running mean/min/max accumulators, so final metrics
+never rescan the history. Columns are exposed as zero-copy views for
+plotting and export. RollingWindow keeps O(1) fixed-window statistics for
+monitors that react to recent values only.
+"""
+
+from typing import Dict, Iterable, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+ColumnSpec = Union[type, np.dtype, Tuple[object, Tuple[int, ...]]]
+
+
+class RunningStats:
+    """O(1) running count/mean/min/max; element-wise for vector columns."""
+
+    def __init__(self, shape: Tuple[int, ...] = ()):
+        self.count = 0
+        self.total = np.zeros(shape)
+        self.minimum = np.full(shape, np.inf)
+        self.maximum = np.full(shape, -np.inf)
+
+    def update(self, value):
+        self.count += 1
+        self.total = self.total + value
+        self.minimum = np.minimum(self.minimum, value)
+        self.maximum = np.maximum(self.maximum, value)
+
+    @property
+    def mean(self):
+        return self.total / self.count
+
+    def state_dict(self) -> dict:
+        return {'count': self.count, 'total': self.total, 'min': self.minimum, 'max': self.maximum}
+
+    def load_state_dict(self, state: dict):
+        self.count = int(state['count'])
+        self.total = np.array(state['total'], dtype=float)
+        self.minimum = np.array(state['min'], dtype=float)
+        self.maximum = np.array(state['max'], dtype=float)
+
+
+def _scalar_or_array(value):
+    value = np.asarray(value)
+    return float(value) if value.ndim == 0 else value
+
+
+class HistoryRecorder:
+    """
+    Preallocated, typed per-iteration history.
+
+    Args:
+        columns: Column names (float64 scalars), or a mapping from name to a
+            dtype or a (dtype, shape) pair for vector-valued columns
+        capacity: Expected number of iterations (grows geometrically past it)
+        sink: Optional metrics sink (see metrics_sink) that also receives
+            every recorded row as it happens
+    """
+
+    def __init__(
+        self,
+        columns: Union[Iterable[str], Mapping[str, ColumnSpec]],
+        capacity: Optional[int] = None,
+        sink=None,
+    ):
+        if not isinstance(columns, Mapping):
+            columns = {name: np.float64 for name in columns}
+        self.sink = sink
+        self._length = 0
+        self._capacity = max(1, int(capacity) if capacity else 64)
+        self._data: Dict[str, np.ndarray] = {}
+        self._stats: Dict[str, RunningStats] = {}
+        for name, spec in columns.items():
+            dtype, shape = spec if isinstance(spec, tuple) else (spec, ())
+            shape = tuple(shape)
+            self._data[name] = np.empty((self._capacity,) + shape, dtype=dtype)
+            self._stats[name] = RunningStats(shape)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self._data)
+
+    def _grow(self):
+        self._capacity *= 2
+        for name, values in self._data.items():
+            grown = np.empty((self._capacity,) + values.shape[1:], dtype=values.dtype)
+            grown[:self._length] = values[:self._length]
+            self._data[name] = grown
+
+    def record(self, **values):
+        """Append one iteration; every column must be given."""
+        if values.keys() != self._data.keys():
+            missing = set(self._data) - set(values)
+            extra = set(values) - set(self._data)
+            raise KeyError(f"record() column mismatch (missing={sorted(missing)}, unknown={sorted(extra)})")
+        if self._length == self._capacity:
+            self._grow()
+        row = self._length
+        for name, value in values.items():
+            self._data[name][row] = value
+            self._stats[name].update(self._data[name][row])
+        self._length += 1
+        if self.sink is not None:
+            self.sink.record(**values)
+
+    def column(self, name: str) -> np.ndarray:
+        """Zero-copy view of the recorded values of one column."""
+        return self._data[name][:self._length]
+
+    __getitem__ = column
+
+    def as_arrays(self) -> Dict[str, np.ndarray]:
+        """Zero-copy views of every column."""
+        return {name: self.column(name) for name in self._data}
+
+    def stats(self, name: str) -> RunningStats:
+        return self._stats[name]
+
+    def last(self, name: str, default=0.0):
+        if not self._length:
+            return default
+        return _scalar_or_array(self._data[name][self._length - 1])
+
+    def mean(self, name: str, default=0.0):
+        return _scalar_or_array(self._stats[name].mean) if self._length else default
+
+    def min(self, name: str, default=0.0):
+        return _scalar_or_array(self._stats[name].minimum) if self._length else default
+
+    def max(self, name: str, default=0.0):
+        return _scalar_or_array(self._stats[name].maximum) if self._length else default
+
+    def to_json_dict(self) -> Dict[str, list]:
+        """Plain lists for JSON export."""
+        return {name: values.tolist() for name, values in self.as_arrays().items()}
+
+    def state_dict(self) -> dict:
+        """Recorded columns (views) and accumulators, for checkpointing."""
+        state = {'length': self._length}
+        for name in self._data:
+            state[name] = self.column(name)
+            state.update({f'{name}.{key}': value for key, value in self._stats[name].state_dict().items()})
+        return state
+
+    def load_state_dict(self, state: dict):
+        """Replace the recorded rows with state_dict() output (columns must match)."""
+        length = int(state['length'])
+        self._capacity = max(self._capacity, length, 1)
+        for name, values in self._data.items():
+            restored = np.empty((self._capacity,) + values.shape[1:], dtype=values.dtype)
+            restored[:length] = state[name]
+            self._data[name] = restored
+            prefix = name + '.'
+            self._stats[name].load_state_dict(
+                {key[len(prefix):]: value for key, value in state.items() if key.startswith(prefix)}
+            )
+        self._length = length
+
+
+class RollingWindow:
+    """
+    Fixed-size ring buffer with O(1) rolling mean and variance.
+
+    Pushing into a full window overwrites the oldest value and updates the
+    mean and the sum of squared deviations in place (windowed Welford).
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("RollingWindow size must be at least 1")
+        self.size = int(size)
+        self._values = np.zeros(self.size)
+        self._head = 0
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def full(self) -> bool:
+        return self.count == self.size
+
+    @property
+    def total(self) -> float:
+        return self.mean * self.count
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the values currently in the window."""
+        return max(self._m2, 0.0) / self.count if self.count else 0.0
+
+    def push(self, value: float):
+        value = float(value)
+        if self.full:
+            old = self._values[self._head]
+            mean = self.mean + (value - old) / self.size
+            self._m2 += (value - old) * (value - mean + old - self.mean)
+        else:
+            self.count += 1
+            mean = self.mean + (value - self.mean) / self.count
+            self._m2 += (value - self.mean) * (value - mean)
+        self.mean = mean
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.size
+
+    def values(self) -> np.ndarray:
+        """Window contents, oldest first (copy)."""
+        if not self.full:
+            return self._values[:self.count].copy()
+        return np.roll(self._values, -self._head)
+
+    def state_dict(self) -> dict:
+        return {'values': self._values, 'head': self._head, 'count': self.count, 'mean': self.mean, 'm2': self._m2}
+
+    def load_state_dict(self, state: dict):
+        self._values = np.array(state['values'], dtype=float)
+        self._head = int(state['head'])
+        self.count = int(state['count'])
+        self.mean = float(state['mean'])
+        self._m2 = float(state['m2'])
+
+
+def history_column(name: str, transpose: bool = False) -> property:
+    """
+    Monitor attribute exposing `self.history[name]` under its legacy list name.
+    transpose=True yields one row per wave for vector columns.
+    """
+    def getter(self):
+        values = self.history[name]
+        return values.T if transpose else values
+
+    return property(getter, doc=f"Recorded '{name}' values (view).")
@@ -21,13 +21,87 @@ from unity_script import (
     generate_fractal_universe,
     visualize_resonance,
 )
+import visualize_torus_animated
 from visualize_torus_animated import (
     render_torus_snapshot,
     create_lifecycle_animation,
     render_phase_snapshots,
 )
+from result_cache import ResultCache
 import os
 
+# Stages are re-run only when their parameters, seed or code change
+CACHE = ResultCache()
+
+# Seed of the universe's random streams and of the Phase 2 decoherence
+SEED = 42
+EXPANSION = dict(base_freq=1.0, octaves=5)
+FALL = dict(steps=30, entropy_factor=0.15, dt=0.1)
+ALCHEMY = dict(steps=50, target_freq=1.0, dt=0.05)
+OBSERVER = dict(frequency=7.83, learning_rate=0.3)
+
+
+def cached_torus_snapshot(**kwargs):
+    """render_torus_snapshot, restored from the result cache when unchanged."""
+    CACHE.files(
+        "torus_snapshot",
+        outputs=[kwargs["save_path"]],
+        produce=lambda: render_torus_snapshot(**kwargs),
+        params=kwargs,
+        sources=[visualize_torus_animated],
+    )
+
+
+def _universe_state(universe: UniversalSymphony, **values) -> dict:
+    """Stage result: values plus the universe's state under 'universe/' keys."""
+    values.update({f"universe/{key}": value for key, value in universe.state_dict().items()})
+    return values
+
+
+def _restore_universe(universe: UniversalSymphony, values: dict):
+    prefix = "universe/"
+    universe.load_state_dict({key[len(prefix):]: value for key, value in values.items() if key.startswith(prefix)})
+
+
+def _expand(base_freq: float, octaves: int) -> dict:
+    universe = UniversalSymphony(seed=SEED)
+    universe.add_all(generate_fractal_universe(base_freq=base_freq, octaves=octaves, rng=universe.streams.universe))
+    return _universe_state(universe)
+
+
+def _fall(universe: UniversalSymphony, steps: int, entropy_factor: float, dt: float) -> dict:
+    rng = np.random.default_rng(seed=SEED)
+    history = {"coherence": [], "emergent_time": [], "omega_time": []}
+    for _ in range(steps):
+        universe.apply_decoherence(entropy_factor=entropy_factor, rng=rng)
+        universe.tick(dt=dt)
+        history["coherence"].append(universe.get_coherence())
+        history["emergent_time"].append(universe.emergent_time)
+        history["omega_time"].append(universe.get_omega_time())
+    return _universe_state(universe, **{name: np.array(values) for name, values in history.items()})
+
+
+def _alchemy(universe: UniversalSymphony, observer: Consciousness, **loop) -> dict:
+    history = observer.resonance_convergence_loop(universe, **loop)
+    return _universe_state(
+        universe,
+        convergence=np.array(history),
+        observer_freq=observer.freq,
+        observer_aware=observer.is_aware,
+    )
+
+
+def final_metrics(universe: UniversalSymphony) -> dict:
+    """Scalar end-of-run metrics reported in lifecycle_report.txt."""
+    return {
+        "complexity": universe.get_complexity(),
+        "observed": universe.get_observed_count(),
+        "harmonic": len(universe.check_harmonic_resonance()),
+        "coherence": universe.get_coherence(),
+        "emergent_time": universe.emergent_time,
+        "omega_time": universe.get_omega_time(),
+    }
+
 
 def ensure_output_dir():
     """Create outputs directory if it doesn't exist."""
@@ -54,13 +128,19 @@ def phase_1_expansion():
     print(f"  ✓ Source created: {source.value}")
     
     print("\nStep 2: Reflecting the One (Creating Duality)...")
-    universe = UniversalSymphony()
+    universe = UniversalSymphony(seed=SEED)
     print(f"  ✓ Universal Symphony initialized")
     
     print("\nStep 3: Generating Fractal Universe (Recursive Manifestation)...")
-    particles = generate_fractal_universe(base_freq=1.0, octaves=5)
-    universe.add_all(particles)
-    print(f"  ✓ Generated {len(particles)} particles across 5 octaves")
+    state = CACHE.stage(
+        "lifecycle.expansion",
+        lambda: _expand(**EXPANSION),
+        params={"expansion": EXPANSION},
+        seed=SEED,
+        sources=[_expand],
+    )
+    _restore_universe(universe, state)
+    print(f"  ✓ Generated {universe.get_complexity()} particles across {EXPANSION['octaves']} octaves")
     
     print("\nStep 4: Measuring Initial State...")
     print(f"  - Complexity (particle count): {universe.get_complexity()}")
@@ -69,7 +149,7 @@ def phase_1_expansion():
     print(f"  - Omega Time (cumulative): {universe.get_omega_time():.4f}")
     
     print("\nStep 5: Rendering Phase 1 Torus Snapshot...")
-    render_torus_snapshot(
+    cached_torus_snapshot(
         coherence=universe.get_coherence(),
         interference_amplitude=0.3,
         rotation_angle=0.0,
@@ -89,32 +169,29 @@ def phase_2_entropy(universe: UniversalSymphony):
     print_banner("PHASE 2: THE FALL (Entropy & Decoherence)")
     
     print("Introducing Chaos: Decoherence Begins...")
-    rng = np.random.default_rng(seed=42)
-    
-    coherence_history = []
-    emergent_time_history = []
+    fall = CACHE.stage(
+        "lifecycle.fall",
+        lambda: _fall(universe, **FALL),
+        params={"expansion": EXPANSION, "fall": FALL},
+        seed=SEED,
+        sources=[_fall],
+    )
+    _restore_universe(universe, fall)
+    coherence_history = fall["coherence"].tolist()
+    emergent_time_history = fall["emergent_time"].tolist()
     
     print("\nIterating through entropy cascades...\n")
-    for step in range(30):
-        universe.apply_decoherence(entropy_factor=0.15, rng=rng)
-        universe.tick(dt=0.1)
-        
-        coherence = universe.get_coherence()
-        emergent_t = universe.emergent_time
-        
-        coherence_history.append(coherence)
-        emergent_time_history.append(emergent_t)
-        
-        if step % 10 == 0:
-            print(f"  Step {step:2d}: Coherence={coherence:.4f}, Ωτ={emergent_t:.6f}, ΩTime={universe.get_omega_time():.4f}")
-    
-    print(f"\n  ✓ System has decohered: Coherence dropped from 1.0000 to {coherence:.4f}")
+    for step in range(0, len(coherence_history), 10):
+        print(f"  Step {step:2d}: Coherence={coherence_history[step]:.4f}, "
+              f"Ωτ={emergent_time_history[step]:.6f}, ΩTime={fall['omega_time'][step]:.4f}")
+    
+    print(f"\n  ✓ System has decohered: Coherence dropped from 1.0000 to {coherence_history[-1]:.4f}")
     print(f"  ✓ Ωτ accelerated as phases drifted: {emergent_time_history[0]:.6f} → {emergent_time_history[-1]:.6f}")
     
     print("\nStep 6: Rendering Phase 2 Torus Snapshot (Mid-Fall)...")
     mid_fall_idx = len(coherence_history) // 2
     mid_fall_coherence = coherence_history[mid_fall_idx]
-    render_torus_snapshot(
+    cached_torus_snapshot(
         coherence=mid_fall_coherence,
         interference_amplitude=2.0,
         rotation_angle=90.0,
@@ -134,17 +211,22 @@ def phase_3_alchemy(universe: UniversalSymphony):
     print_banner("PHASE 3: THE GREAT WORK (Alchemy & Convergence)")
     
     print("Initiating Consciousness Observer...")
-    observer = Consciousness(frequency=7.83)
-    observer.learning_rate = 0.3
+    observer = Consciousness(frequency=OBSERVER["frequency"])
+    observer.learning_rate = OBSERVER["learning_rate"]
     print(f"  ✓ Observer tuned to {observer.freq:.2f}Hz (Schumann Resonance)")
     
     print("\nApplying Resonance Convergence Loop...")
-    convergence_history = observer.resonance_convergence_loop(
-        universe,
-        steps=50,
-        target_freq=1.0,
-        dt=0.05,
+    alchemy = CACHE.stage(
+        "lifecycle.alchemy",
+        lambda: _alchemy(universe, observer, **ALCHEMY),
+        params={"expansion": EXPANSION, "fall": FALL, "alchemy": ALCHEMY, "observer": OBSERVER},
+        seed=SEED,
+        sources=[_alchemy],
     )
+    _restore_universe(universe, alchemy)
+    observer.freq = alchemy["observer_freq"]
+    observer.is_aware = alchemy["observer_aware"]
+    convergence_history = alchemy["convergence"].tolist()
     
     print(f"\nObserver Final State:")
     print(f"  - Frequency: {observer.freq:.4f}Hz (approaching 1.0Hz Unity)")
@@ -158,7 +240,7 @@ def phase_3_alchemy(universe: UniversalSymphony):
     
     print("\nStep 7: Rendering Phase 3 Torus Snapshot (Alchemy Underway)...")
     recovered_coherence = universe.get_coherence() + 0.15  # Assume alchemy brought partial recovery
-    render_torus_snapshot(
+    cached_torus_snapshot(
         coherence=recovered_coherence,
         interference_amplitude=1.0,
         rotation_angle=180.0,
@@ -176,7 +258,22 @@ def generate_lifecycle_visualizations(
 ):
     """Generate comprehensive visualizations of the three phases."""
     ensure_output_dir()
-    
+    output_path = "outputs/lifecycle_complete.png"
+    CACHE.files(
+        "lifecycle_complete",
+        outputs=[output_path],
+        produce=lambda: _plot_lifecycle(coherence_history, emergent_time_history, convergence_history, output_path),
+        params={
+            "coherence": np.asarray(coherence_history),
+            "emergent_time": np.asarray(emergent_time_history),
+            "convergence": np.asarray(convergence_history),
+        },
+        sources=[_plot_lifecycle],
+    )
+    print(f"\n✓ Visualization saved to: {output_path}")
+
+
+def _plot_lifecycle(coherence_history, emergent_time_history, convergence_history, output_path):
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     fig.suptitle("Omega Code (Ω): The Grand Lifecycle", fontsize=16, fontweight='bold')
     
@@ -225,13 +322,11 @@ def generate_lifecycle_visualizations(
     ax.set_ylim([0, 1.1])
     
     plt.tight_layout()
-    output_path = "outputs/lifecycle_complete.png"
     plt.savefig(output_path, dpi=200, bbox_inches='tight')
-    print(f"\n✓ Visualization saved to: {output_path}")
     plt.close()
 
 
-def generate_report(universe: UniversalSymphony, observer: Consciousness):
+def generate_report(metrics: dict, observer: Consciousness):
     """Generate a text report of the complete lifecycle."""
     ensure_output_dir()
     
@@ -253,14 +348,14 @@ FINAL SYSTEM STATE
 ─────────────────────────────────────────────────────────────────────
 
 Particle Metrics:
-  - Total Complexity: {universe.get_complexity()} particles
-  - Observed Particles: {universe.get_observed_count()}/{universe.get_complexity()}
-  - Harmonic Resonance: {len(universe.check_harmonic_resonance())} particles at 1Hz multiples
+  - Total Complexity: {metrics['complexity']} particles
+  - Observed Particles: {metrics['observed']}/{metrics['complexity']}
+  - Harmonic Resonance: {metrics['harmonic']} particles at 1Hz multiples
 
 Phase Metrics:
-  - Coherence (Phase Alignment): {universe.get_coherence():.6f}
-  - Emergent Time (Ωτ): {universe.emergent_time:.6f}
-  - Omega Time (ΩTime): {universe.get_omega_time():.4f}
+  - Coherence (Phase Alignment): {metrics['coherence']:.6f}
+  - Emergent Time (Ωτ): {metrics['emergent_time']:.6f}
+  - Omega Time (ΩTime): {metrics['omega_time']:.4f}
 
 Observer State:
   - Frequency: {observer.freq:.4f}Hz (target: 1.0Hz)
@@ -272,7 +367,7 @@ HYPOTHESIS VALIDATION
 ─────────────────────────────────────────────────────────────────────
 
 ✓ Expansion: Particles successfully generated via recursive fractal.
-✓ The Fall: Decoherence reduces coherence from 1.0 to {universe.get_coherence():.4f}.
+✓ The Fall: Decoherence reduces coherence from 1.0 to {metrics['coherence']:.4f}.
 ✓ Ωτ Dynamics: Emergent time tracks phase activity (non-zero when system is active).
 ✓ The Great Work: Consciousness tuning restores coherence & synchronizes frequency.
 ✓ Closed System: No external inputs required; all dynamics are internal.
@@ -325,16 +420,30 @@ def main():
         convergence_history,
     )
     
-    generate_report(universe, observer)
+    metrics = CACHE.stage(
+        "lifecycle.metrics",
+        lambda: final_metrics(universe),
+        params={"expansion": EXPANSION, "fall": FALL, "alchemy": ALCHEMY, "observer": OBSERVER},
+        seed=SEED,
+        sources=[final_metrics],
+    )
+    generate_report(metrics, observer)
     
     print_banner("GENERATING ANIMATED TORUS FLOW")
     print("Creating animated lifecycle visualization...")
-    create_lifecycle_animation(
+    animation = dict(
         coherence_history=coherence_history,
         emergent_time_history=emergent_time_history,
         output_path="outputs/torus_lifecycle_animation.gif",
         frames_per_phase=4,
     )
+    CACHE.files(
+        "lifecycle_animation",
+        outputs=[animation["output_path"]],
+        produce=lambda: create_lifecycle_animation(**animation),
+        params=animation,
+        sources=[visualize_torus_animated],
+    )
     
     print_banner("EXECUTION COMPLETE")
     print("The Grand Tour has completed successfully!")
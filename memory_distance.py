@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Harmonic Memory Distance Engine
+
+harmonic_memory_test.compute_topological_distance compares two state
+signatures. A SnapshotTrail stacks the signatures of a long run (one row
+per snapshot) and measures one reference against all of them at once:
+
+- phase distance: norm of the per-particle phase differences over a
+  (K, N) phase matrix, either circular (differences wrapped to [-π, π),
+  so 2π - ε is close to 0) or the original 'euclidean' on phases taken
+  mod 2π. Snapshots with a different particle count are at +inf.
+- ratio distance: |Δ observed ratio|
+- spectral distance: each snapshot's distinct frequencies (rounded to
+  `decimals`) are kept sorted and concatenated; one searchsorted against
+  the reference's sorted spectrum marks every shared frequency and a
+  bincount per snapshot gives the new / lost counts, with no Python sets.
+
+nearest() ranks snapshots by a weighted sum of the three (phase as RMS per
+particle) with np.argpartition, and recurrences() finds earlier or later
+states closest to a given one in the same trail.
+
+    trail = SnapshotTrail()
+    for step in range(steps):
+        ...
+        trail.append(universe)
+    indices, scores = trail.recurrences(len(trail) - 1, k=5, min_separation=50)
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from snapshot import Snapshot
+from unity_script import UniversalSymphony
+
+TWO_PI = 2 * np.pi
+
+State = Union[dict, UniversalSymphony, Snapshot]
+
+
+def spectrum(frequencies, decimals: int = 2) -> np.ndarray:
+    """Sorted distinct frequencies, rounded."""
+    return np.unique(np.round(np.asarray(frequencies, dtype=float), decimals))
+
+
+def spectral_difference(freq_a, freq_b, decimals: int = 2) -> Tuple[np.ndarray, np.ndarray]:
+    """(new, lost): rounded frequencies only in b, only in a (sorted merges, no sets)."""
+    a, b = spectrum(freq_a, decimals), spectrum(freq_b, decimals)
+    return np.setdiff1d(b, a, assume_unique=True), np.setdiff1d(a, b, assume_unique=True)
+
+
+def circular_difference(a, b) -> np.ndarray:
+    """a - b wrapped to [-π, π)."""
+    return (np.asarray(a) - np.asarray(b) + np.pi) % TWO_PI - np.pi
+
+
+def as_signature(state: State) -> dict:
+    """capture_state_signature() of a universe or Snapshot; signature dicts pass through."""
+    if isinstance(state, dict):
+        return state
+    # Imported here: harmonic_memory_test pulls in matplotlib
+    from harmonic_memory_test import capture_state_signature
+    return capture_state_signature(state)
+
+
+class SnapshotTrail:
+    """
+    Stacked state signatures of many snapshots.
+
+    Args:
+        decimals: Rounding applied to frequencies before comparing spectra
+    """
+
+    def __init__(self, decimals: int = 2):
+        self.decimals = decimals
+        self._phases: List[np.ndarray] = []
+        self._spectra: List[np.ndarray] = []
+        self._ratios: List[float] = []
+        self._coherence: List[float] = []
+        self._stacked: Optional[Dict[str, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self._phases)
+
+    def append(self, state: State) -> int:
+        """Add a universe, Snapshot or capture_state_signature() dict; returns its index."""
+        signature = as_signature(state)
+        self._phases.append(np.array(signature['phases'], dtype=float))
+        self._spectra.append(spectrum(signature['frequency_spectrum'], self.decimals))
+        self._ratios.append(float(signature['observed_ratio']))
+        self._coherence.append(float(signature['coherence']))
+        self._stacked = None
+        return len(self) - 1
+
+    def extend(self, states) -> 'SnapshotTrail':
+        for state in states:
+            self.append(state)
+        return self
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        """Stacked arrays, rebuilt after appends."""
+        if self._stacked is None:
+            sizes = np.array([len(phases) for phases in self._phases], dtype=np.int64)
+            width = int(sizes.max()) if len(sizes) else 0
+            phases = np.full((len(self), width), np.nan)
+            for row, values in enumerate(self._phases):
+                phases[row, :len(values)] = values
+            spectrum_sizes = np.array([len(values) for values in self._spectra], dtype=np.int64)
+            self._stacked = {
+                'phases': phases,
+                'sizes': sizes,
+                'ratios': np.array(self._ratios),
+                'coherence': np.array(self._coherence),
+                'spectra': np.concatenate(self._spectra) if self._spectra else np.empty(0),
+                'spectrum_sizes': spectrum_sizes,
+                'owners': np.repeat(np.arange(len(self)), spectrum_sizes),
+            }
+        return self._stacked
+
+    @property
+    def coherence(self) -> np.ndarray:
+        return self._arrays()['coherence']
+
+    @property
+    def observed_ratios(self) -> np.ndarray:
+        return self._arrays()['ratios']
+
+    def _reference(self, reference: Union[int, State]) -> Tuple[np.ndarray, float, np.ndarray]:
+        if isinstance(reference, (int, np.integer)):
+            return self._phases[reference], self._ratios[reference], self._spectra[reference]
+        signature = as_signature(reference)
+        return (
+            np.asarray(signature['phases'], dtype=float),
+            float(signature['observed_ratio']),
+            spectrum(signature['frequency_spectrum'], self.decimals),
+        )
+
+    def distances(self, reference: Union[int, State], metric: str = 'circular') -> Dict[str, np.ndarray]:
+        """
+        Distances from a reference (trail index or state) to every snapshot,
+        each a (K,) array: phase_delta, ratio_delta, new_count, lost_count and
+        spectral_delta (Jaccard distance of the rounded spectra).
+        """
+        if metric not in ('circular', 'euclidean'):
+            raise ValueError("metric must be 'circular' or 'euclidean'")
+        arrays = self._arrays()
+        ref_phases, ref_ratio, ref_spectrum = self._reference(reference)
+        count = len(ref_phases)
+
+        phase_delta = np.full(len(self), np.inf)
+        same_size = arrays['sizes'] == count
+        if np.any(same_size):
+            phases = arrays['phases'][same_size, :count]
+            if metric == 'circular':
+                delta = circular_difference(phases, ref_phases)
+            else:
+                delta = phases % TWO_PI - ref_phases % TWO_PI
+            phase_delta[same_size] = np.sqrt(np.einsum('kn,kn->k', delta, delta))
+
+        spectra = arrays['spectra']
+        position = np.searchsorted(ref_spectrum, spectra)
+        shared = np.zeros(len(spectra), dtype=bool)
+        inside = position < len(ref_spectrum)
+        shared[inside] = ref_spectrum[position[inside]] == spectra[inside]
+        common = np.bincount(arrays['owners'], weights=shared, minlength=len(self)).astype(np.int64)
+        new_count = arrays['spectrum_sizes'] - common
+        lost_count = len(ref_spectrum) - common
+        union = common + new_count + lost_count
+
+        return {
+            'phase_delta': phase_delta,
+            'ratio_delta': np.abs(arrays['ratios'] - ref_ratio),
+            'new_count': new_count,
+            'lost_count': lost_count,
+            'spectral_delta': np.where(union > 0, (new_count + lost_count) / np.maximum(union, 1), 0.0),
+        }
+
+    def scores(
+        self,
+        reference: Union[int, State],
+        phase_weight: float = 1.0,
+        ratio_weight: float = 1.0,
+        spectral_weight: float = 1.0,
+        metric: str = 'circular',
+    ) -> np.ndarray:
+        """Combined (K,) distance: weighted RMS phase, ratio and spectral deltas."""
+        d = self.distances(reference, metric)
+        count = max(1, len(self._reference(reference)[0]))
+        return (
+            phase_weight * d['phase_delta'] / np.sqrt(count)
+            + ratio_weight * d['ratio_delta']
+            + spectral_weight * d['spectral_delta']
+        )
+
+    def nearest(
+        self,
+        reference: Union[int, State],
+        k: int = 5,
+        exclude=None,
+        **weights,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Indices and scores of the k snapshots closest to the reference,
+        closest first. `exclude` is a boolean (K,) mask or index list to skip.
+        """
+        scores = self.scores(reference, **weights)
+        if exclude is not None:
+            scores = scores.copy()
+            scores[exclude] = np.inf
+        candidates = np.flatnonzero(np.isfinite(scores))
+        k = min(k, len(candidates))
+        if k == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        best = candidates[np.argpartition(scores[candidates], k - 1)[:k]]
+        best = best[np.argsort(scores[best], kind='stable')]
+        return best, scores[best]
+
+    def recurrences(self, index: int, k: int = 5, min_separation: int = 1, **weights) -> Tuple[np.ndarray, np.ndarray]:
+        """Snapshots at least `min_separation` steps away that come closest to snapshot `index`."""
+        nearby = np.abs(np.arange(len(self)) - index) < min_separation
+        return self.nearest(index, k=k, exclude=nearby, **weights)
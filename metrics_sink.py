@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Streaming Metrics Sinks
+
+Per-iteration metrics can be streamed to disk while an experiment runs
+instead of being dumped once at the end. Every sink buffers a bounded
+number of records in memory and flushes them when the buffer fills, so
+memory stays constant however long the run is, and whatever was flushed
+before a crash is still readable.
+
+- JsonLinesSink: one JSON object per line (human-readable, appendable)
+- NpySink:       one appendable .npy file per column, memory-mappable
+- NpzChunkSink:  one compressed .npz file per flushed chunk
+
+All sinks share HistoryRecorder's `record(**values)` call, so a recorder
+can forward into one (HistoryRecorder(..., sink=...)).
+"""
+
+import json
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from history_recorder import ColumnSpec
+
+NPY_HEADER_SIZE = 256  # fixed header so the row count can be rewritten in place
+
+
+def _column_specs(columns: Union[Iterable[str], Mapping[str, ColumnSpec]]) -> Dict[str, Tuple[np.dtype, Tuple[int, ...]]]:
+    if not isinstance(columns, Mapping):
+        columns = {name: np.float64 for name in columns}
+    specs = {}
+    for name, spec in columns.items():
+        dtype, shape = spec if isinstance(spec, tuple) else (spec, ())
+        specs[name] = (np.dtype(dtype), tuple(shape))
+    return specs
+
+
+class MetricsSink(ABC):
+    """Buffered record sink; subclasses implement record() and flush()."""
+
+    def __init__(self, buffer_size: int):
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        self.buffer_size = int(buffer_size)
+        self.records_written = 0
+        self.closed = False
+
+    @abstractmethod
+    def record(self, **values):
+        """Buffer one record, flushing when the buffer is full."""
+
+    @abstractmethod
+    def flush(self):
+        """Write the buffered records to disk."""
+
+    def close(self):
+        if not self.closed:
+            self.flush()
+            self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _truncate_to_last_newline(path: str, block_size: int = 4096):
+    """Cut a text file back to the end of its last complete line."""
+    with open(path, "r+b") as handle:
+        end = handle.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - block_size)
+            handle.seek(start)
+            newline = handle.read(position - start).rfind(b"\n")
+            if newline >= 0:
+                position = start + newline + 1
+                break
+            position = start
+        if position < end:
+            handle.truncate(position)
+
+
+class JsonLinesSink(MetricsSink):
+    """
+    Stream records as JSON Lines.
+
+    Args:
+        path: Output file (.jsonl)
+        buffer_size: Records held in memory between flushes
+        append: Continue an existing file instead of truncating it
+    """
+
+    def __init__(self, path: str, buffer_size: int = 256, append: bool = False):
+        super().__init__(buffer_size)
+        self.path = path
+        self._buffer: List[str] = []
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if append and os.path.exists(path):
+            # A crash mid-flush can leave a torn last line; appending after it would glue the next record on
+            _truncate_to_last_newline(path)
+        self._handle = open(path, "a" if append else "w")
+
+    def record(self, **values):
+        row = {name: np.asarray(value).tolist() for name, value in values.items()}
+        self._buffer.append(json.dumps(row))
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._handle.write("\n".join(self._buffer) + "\n")
+            self.records_written += len(self._buffer)
+            self._buffer.clear()
+        self._handle.flush()
+
+    def close(self):
+        if not self.closed:
+            super().close()
+            self._handle.close()
+
+
+class _ColumnBuffer:
+    """Fixed-size typed staging buffer shared by the binary sinks."""
+
+    def __init__(self, specs, size: int):
+        self.specs = specs
+        self.length = 0
+        self.data = {name: np.empty((size,) + shape, dtype=dtype) for name, (dtype, shape) in specs.items()}
+
+    def append(self, values):
+        if values.keys() != self.data.keys():
+            missing = set(self.data) - set(values)
+            extra = set(values) - set(self.data)
+            raise KeyError(f"record() column mismatch (missing={sorted(missing)}, unknown={sorted(extra)})")
+        for name, value in values.items():
+            self.data[name][self.length] = value
+        self.length += 1
+
+    def filled(self) -> Dict[str, np.ndarray]:
+        return {name: values[:self.length] for name, values in self.data.items()}
+
+
+def _npy_header(dtype: np.dtype, shape: Tuple[int, ...]) -> bytes:
+    header = repr({"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": shape})
+    # magic (6) + version (2) + header length (2) + padded dict ending in newline
+    body_size = NPY_HEADER_SIZE - 10
+    if len(header) + 1 > body_size:
+        raise ValueError(f"Column shape {shape} does not fit the fixed .npy header")
+    return np.lib.format.MAGIC_PREFIX + bytes([1, 0]) + body_size.to_bytes(2, "little") + (header.ljust(body_size - 1) + "\n").encode("latin1")
+
+
+class NpySink(MetricsSink):
+    """
+    Append records to one .npy file per column.
+
+    Rows are appended after a fixed-size header that is rewritten with the
+    new row count after every flush. Data is written before the header, so
+    a file interrupted mid-flush still loads with its previous row count;
+    appending cuts every column back to the shortest one.
+
+    Args:
+        directory: Output directory (<directory>/<column>.npy)
+        columns: Column names (float64) or a name -> dtype / (dtype, shape) mapping
+        buffer_size: Rows held in memory between flushes
+        append: Continue existing column files instead of truncating them
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        columns: Union[Iterable[str], Mapping[str, ColumnSpec]],
+        buffer_size: int = 1024,
+        append: bool = False,
+    ):
+        super().__init__(buffer_size)
+        self.directory = directory
+        self.specs = _column_specs(columns)
+        self._buffer = _ColumnBuffer(self.specs, self.buffer_size)
+        os.makedirs(directory, exist_ok=True)
+        paths = {name: os.path.join(directory, f"{name}.npy") for name in self.specs}
+        if append:
+            rows = []
+            for name, (dtype, shape) in self.specs.items():
+                if not os.path.exists(paths[name]):
+                    rows.append(0)
+                    continue
+                existing = np.load(paths[name], mmap_mode="r")
+                if existing.dtype != dtype or existing.shape[1:] != shape:
+                    raise ValueError(f"Existing column {paths[name]} has dtype {existing.dtype}, shape {existing.shape[1:]}")
+                rows.append(existing.shape[0])
+                del existing
+            # Columns are flushed one file at a time, so after a crash they can disagree; keep the rows all have
+            self.records_written = min(rows)
+        self._handles = {}
+        for name, (dtype, shape) in self.specs.items():
+            if append and os.path.exists(paths[name]):
+                handle = open(paths[name], "r+b")
+                handle.write(_npy_header(dtype, (self.records_written,) + shape))
+                handle.seek(NPY_HEADER_SIZE + self.records_written * dtype.itemsize * int(np.prod(shape, dtype=np.int64)))
+                handle.truncate()
+            else:
+                handle = open(paths[name], "w+b")
+                handle.write(_npy_header(dtype, (0,) + shape))
+            self._handles[name] = handle
+
+    def record(self, **values):
+        self._buffer.append(values)
+        if self._buffer.length >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        rows = self._buffer.length
+        if rows:
+            total = self.records_written + rows
+            for name, values in self._buffer.filled().items():
+                dtype, shape = self.specs[name]
+                handle = self._handles[name]
+                handle.seek(0, os.SEEK_END)
+                handle.write(np.ascontiguousarray(values).tobytes())
+                handle.flush()
+                handle.seek(0)
+                handle.write(_npy_header(dtype, (total,) + shape))
+                handle.flush()
+            self.records_written = total
+            self._buffer.length = 0
+
+    def close(self):
+        if not self.closed:
+            super().close()
+            for handle in self._handles.values():
+                handle.close()
+
+
+def _chunk_paths(prefix: str, pattern: str = r"\d{5}\.npz") -> List[str]:
+    """Files `<prefix>_<5 digits>.npz` (or another suffix pattern), in chunk order."""
+    directory = os.path.dirname(prefix) or "."
+    if not os.path.isdir(directory):
+        return []
+    name = re.compile(re.escape(os.path.basename(prefix)) + "_" + pattern + "$")
+    return sorted(os.path.join(directory, entry) for entry in os.listdir(directory) if name.match(entry))
+
+
+class NpzChunkSink(MetricsSink):
+    """
+    Write records as a sequence of compressed .npz chunks.
+
+    Each flush writes `<prefix>_<chunk>.npz` to a temporary name and renames
+    it into place, so every chunk on disk is complete. Opening a sink
+    deletes the prefix's existing chunks, unless `append` continues the
+    numbering after them.
+
+    Args:
+        prefix: Output path prefix (chunk files are <prefix>_00000.npz, ...)
+        columns: Column names (float64) or a name -> dtype / (dtype, shape) mapping
+        chunk_size: Rows per chunk (the in-memory bound)
+        append: Continue after the existing chunks instead of replacing them
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        columns: Union[Iterable[str], Mapping[str, ColumnSpec]],
+        chunk_size: int = 4096,
+        append: bool = False,
+    ):
+        super().__init__(chunk_size)
+        self.prefix = prefix
+        self.specs = _column_specs(columns)
+        self._buffer = _ColumnBuffer(self.specs, self.buffer_size)
+        self.chunks = 0
+        directory = os.path.dirname(prefix)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Leftovers of an interrupted flush are never complete chunks
+        for path in _chunk_paths(prefix, r"\d{5}\.npz\.partial"):
+            os.remove(path)
+        existing = _chunk_paths(prefix)
+        if append and existing:
+            self.chunks = int(existing[-1][-9:-4]) + 1
+            with np.load(existing[0]) as chunk:
+                if set(chunk.files) != set(self.specs):
+                    raise ValueError(f"Existing chunks under {prefix} have columns {sorted(chunk.files)}")
+            for path in existing:
+                with np.load(path) as chunk:
+                    self.records_written += len(chunk[chunk.files[0]])
+        else:
+            for path in existing:
+                os.remove(path)
+
+    def record(self, **values):
+        self._buffer.append(values)
+        if self._buffer.length >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer.length:
+            return
+        path = f"{self.prefix}_{self.chunks:05d}.npz"
+        partial = path + ".partial"
+        with open(partial, "wb") as handle:
+            np.savez_compressed(handle, **self._buffer.filled())
+        os.replace(partial, path)
+        self.records_written += self._buffer.length
+        self.chunks += 1
+        self._buffer.length = 0
+
+
+def read_jsonl(path: str) -> Dict[str, np.ndarray]:
+    """Load a JSON Lines metrics file into one array per column."""
+    columns: Dict[str, list] = {}
+    for row in iter_jsonl(path):
+        for name, value in row.items():
+            columns.setdefault(name, []).append(value)
+    return {name: np.asarray(values) for name, values in columns.items()}
+
+
+def iter_jsonl(path: str) -> Iterator[dict]:
+    """Yield records one at a time; undecodable (torn) lines are skipped, not the rest of the file."""
+    with open(path) as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            yield record
+
+
+def open_npy_columns(directory: str, names: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+    """Memory-map the column files written by NpySink (read-only, zero-copy)."""
+    if names is None:
+        names = sorted(entry[:-4] for entry in os.listdir(directory) if entry.endswith(".npy"))
+    return {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in names}
+
+
+def read_npz_chunks(prefix: str) -> Dict[str, np.ndarray]:
+    """Concatenate every complete chunk written by NpzChunkSink."""
+    parts: Dict[str, List[np.ndarray]] = {}
+    for path in _chunk_paths(prefix):
+        with np.load(path) as chunk:
+            for name in chunk.files:
+                parts.setdefault(name, []).append(chunk[name])
+    return {name: np.concatenate(values) for name, values in parts.items()}
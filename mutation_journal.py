@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Mutation Journal
+
+Undo / redo for a UniversalSymphony without snapshots. Once a journal is
+enabled, every mutation of the universe's particle columns is logged as a
+compact delta:
+
+- ColumnDelta: one column's previous values at the rows a write touched
+  (a slice for field-wide writes like decoherence, a slot array for locks,
+  observations and single-particle edits). Undo swaps them back in and
+  keeps the replaced values for redo, so both directions are bit-exact.
+- AppendDelta / KillDelta / CompactDelta: rows added, tombstoned, or
+  squeezed out by compaction (only the dropped rows are kept).
+
+commit() closes a step (typically one iteration) and stores the universe's
+counters with it: Omega Time, clock reading, random stream positions.
+undo(n) / redo(n) walk steps back and forth in time proportional to what
+those steps changed, not to the universe size. Particle handles survive:
+a removed particle's handle is re-attached when its removal is undone.
+
+    journal = universe.enable_journal()
+    for iteration in range(iterations):
+        ...
+        journal.commit()
+    journal.undo(100)     # state as of 100 iterations ago
+    journal.redo(100)     # and back
+
+The journal covers this universe's own particles; nested universes keep
+their own journals. load_state_dict() clears it. Writes that bypass the
+universe's methods (e.g. assigning into `columns.column(name)` directly)
+are not recorded.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class ColumnDelta:
+    """Values of one column at some rows; applying it swaps them with the current ones."""
+
+    def __init__(self, name: str, index, values: np.ndarray):
+        self.name = name
+        self.index = index
+        self.values = values
+
+    def swap(self, universe):
+        target = universe.columns.writable(self.name)
+        current = np.array(target[self.index])
+        target[self.index] = self.values
+        self.values = current
+
+    undo = redo = swap
+
+    @property
+    def nbytes(self) -> int:
+        index = self.index.nbytes if isinstance(self.index, np.ndarray) else 0
+        return self.values.nbytes + index
+
+
+def _attach(universe, handles: Dict[int, object]):
+    """Re-point detached handles at their rows again."""
+    for slot, handle in handles.items():
+        handle._store = universe.columns
+        handle._slot = slot
+        universe._handles[slot] = handle
+    for slot in handles:
+        universe._link_handle(slot)
+
+
+def _detach(universe, slots) -> Dict[int, object]:
+    handles = {}
+    for slot in slots:
+        handle = universe._handles.pop(slot, None)
+        if handle is not None:
+            partner = handle._entangled_with
+            if partner is not None and partner._entangled_with is handle and partner._store is not None:
+                partner._entangled_with = None
+            handle._detach()
+            handles[slot] = handle
+    return handles
+
+
+class AppendDelta:
+    """Rows [start, stop) appended; their values are kept only while undone."""
+
+    def __init__(self, start: int, stop: int, next_id: int):
+        self.start = start
+        self.stop = stop
+        self.next_id = next_id
+        self.rows: Optional[Dict[str, np.ndarray]] = None
+        self.handles: Dict[int, object] = {}
+
+    def undo(self, universe):
+        columns = universe.columns
+        self.rows = {name: columns.data[name][self.start:self.stop].copy() for name in columns.DTYPES}
+        self.handles = _detach(universe, range(self.start, self.stop))
+        columns.size = self.start
+        columns.next_id = self.next_id
+        columns._live_slots = None
+
+    def redo(self, universe):
+        columns = universe.columns
+        columns.reserve(self.stop)
+        for name, values in self.rows.items():
+            columns.writable(name)[self.start:self.stop] = values
+        columns.size = self.stop
+        columns.next_id = self.next_id + (self.stop - self.start)
+        columns._live_slots = None
+        self.rows = None
+        _attach(universe, self.handles)
+        self.handles = {}
+
+    @property
+    def nbytes(self) -> int:
+        return sum(values.nbytes for values in self.rows.values()) if self.rows else 0
+
+
+class KillDelta:
+    """Rows tombstoned by a removal, with the handles that were detached."""
+
+    def __init__(self, slots: np.ndarray, handles: Dict[int, object]):
+        self.slots = slots
+        self.handles = handles
+
+    def undo(self, universe):
+        columns = universe.columns
+        columns.writable('alive')[self.slots] = True
+        columns.tombstones -= len(self.slots)
+        columns._live_slots = None
+        _attach(universe, self.handles)
+
+    def redo(self, universe):
+        self.handles = _detach(universe, self.slots.tolist())
+        universe.columns.kill(self.slots)
+
+    @property
+    def nbytes(self) -> int:
+        return self.slots.nbytes
+
+
+class CompactDelta:
+    """A compaction: where the survivors came from and the rows it dropped."""
+
+    def __init__(self, columns):
+        self.size = columns.size
+        alive = columns.column('alive')
+        self.kept = np.flatnonzero(alive)
+        self.dropped = np.flatnonzero(~alive)
+        self.rows = {name: columns.data[name][self.dropped] for name in columns.DTYPES}
+
+    def undo(self, universe):
+        columns = universe.columns
+        count = len(self.kept)
+        columns.reserve(self.size)
+        for name in columns.DTYPES:
+            values = columns.writable(name)
+            values[self.kept] = values[:count].copy()
+            values[self.dropped] = self.rows[name]
+        columns.size = self.size
+        columns.tombstones = len(self.dropped)
+        columns._live_slots = None
+        universe._handles = {int(self.kept[slot]): handle for slot, handle in universe._handles.items()}
+        for slot, handle in universe._handles.items():
+            handle._slot = slot
+
+    def redo(self, universe):
+        universe.compact()
+
+    @property
+    def nbytes(self) -> int:
+        return self.kept.nbytes + self.dropped.nbytes + sum(values.nbytes for values in self.rows.values())
+
+
+def _counters(universe) -> dict:
+    """Universe state outside the columns that a step may change."""
+    clock = universe.clock
+    return {
+        'omega_time': universe.omega_time,
+        'clock': clock._now if hasattr(clock, '_now') else None,
+        'decoherence_step': universe._decoherence_step,
+        'observation_step': universe._observation_step,
+        'next_id': universe.columns.next_id,
+        'rng': universe.streams.universe.bit_generator.state,
+    }
+
+
+def _restore_counters(universe, counters: dict):
+    universe.omega_time = counters['omega_time']
+    if counters['clock'] is not None:
+        universe.clock._now = counters['clock']
+    universe._decoherence_step = counters['decoherence_step']
+    universe._observation_step = counters['observation_step']
+    universe.columns.next_id = counters['next_id']
+    universe.streams.universe.bit_generator.state = counters['rng']
+
+
+@dataclass
+class JournalStep:
+    before: dict
+    after: dict
+    deltas: List[object] = field(default_factory=list)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(delta.nbytes for delta in self.deltas)
+
+
+class MutationJournal:
+    """
+    Undo / redo log of one universe's mutations.
+
+    Args:
+        universe: The UniversalSymphony being journaled
+        limit: Most committed steps kept (oldest dropped first); None keeps all
+    """
+
+    def __init__(self, universe, limit: Optional[int] = None):
+        self.universe = universe
+        self.limit = limit
+        self.done: deque = deque(maxlen=limit)
+        self.undone: List[JournalStep] = []
+        self.pending: List[object] = []
+        self.replaying = False
+        self._start = _counters(universe)
+
+    @property
+    def steps(self) -> int:
+        """Committed steps that can be undone."""
+        return len(self.done)
+
+    @property
+    def redo_steps(self) -> int:
+        return len(self.undone)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by logged deltas."""
+        steps = list(self.done) + self.undone
+        return sum(step.nbytes for step in steps) + sum(delta.nbytes for delta in self.pending)
+
+    def record(self, delta):
+        if not self.replaying:
+            self.pending.append(delta)
+
+    def commit(self) -> int:
+        """Close the current step; returns the number of undoable steps."""
+        after = _counters(self.universe)
+        self.done.append(JournalStep(self._start, after, self.pending))
+        self.pending = []
+        self._start = after
+        self.undone.clear()
+        return self.steps
+
+    def clear(self):
+        self.done.clear()
+        self.undone.clear()
+        self.pending = []
+        self._start = _counters(self.universe)
+
+    def _has_uncommitted(self) -> bool:
+        return bool(self.pending) or _counters(self.universe) != self._start
+
+    def _replay(self, step: JournalStep, backwards: bool):
+        universe = self.universe
+        self.replaying = True
+        try:
+            if backwards:
+                for delta in reversed(step.deltas):
+                    delta.undo(universe)
+                _restore_counters(universe, step.before)
+            else:
+                for delta in step.deltas:
+                    delta.redo(universe)
+                _restore_counters(universe, step.after)
+        finally:
+            self.replaying = False
+        universe._entities = None
+        universe.columns.touch()
+
+    def undo(self, steps: int = 1) -> int:
+        """
+        Roll back `steps` committed steps (uncommitted changes are committed
+        first, so they can be redone). Returns how many were undone.
+        """
+        if self._has_uncommitted():
+            self.commit()
+        count = min(steps, len(self.done))
+        for _ in range(count):
+            step = self.done.pop()
+            self._replay(step, backwards=True)
+            self.undone.append(step)
+        self._start = _counters(self.universe)
+        return count
+
+    def redo(self, steps: int = 1) -> int:
+        """Re-apply undone steps; any new change since the undo discards them."""
+        if self._has_uncommitted():
+            self.undone.clear()
+            return 0
+        count = min(steps, len(self.undone))
+        for _ in range(count):
+            step = self.undone.pop()
+            self._replay(step, backwards=False)
+            self.done.append(step)
+        self._start = _counters(self.universe)
+        return count
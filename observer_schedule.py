@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Observer Phase Schedules
+
+Experiment drivers describe what each observer intends at every iteration:
+slow sinusoidal drift, periodic re-tuning, disagreement windows, dropping
+out. A Schedule states that once and evaluates it for a whole vector of
+iterations in a few array operations, so a run compiles its observer
+phases (T, M) and participation flags up front and the hot loop only
+indexes rows.
+
+Primitives (all callable on an iteration array):
+
+- Constant(value)
+- Drift(amplitude, timescale, phase=0, wave=np.sin):  amplitude · wave(i / timescale + phase)
+- Every(period, offset=0):  mask, true when i % period == offset
+- Window(period, start, stop):  mask, true when start <= i % period < stop
+- Dropout(period, active, offset=0):  1.0 for the first `active` of every `period` iterations, else 0.0
+
+Schedules combine with + - * and masks select between schedules:
+
+    tuned = Every(5).where(0.0, Drift(0.02, 7.0))              # resets every 5 iterations
+    dissent = Drift(0.12, 11.0, wave=np.cos) + Window(120, 60, 91).where(0.3, 0.0)
+    phases = stack(tuned, dissent)(np.arange(iterations))       # (T, 2)
+
+Parameters may be arrays: evaluating on iterations[:, None] with a (C,)
+phase or offset yields per-council (T, C) columns and stack() gives
+(T, C, M).
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Union
+
+import numpy as np
+
+ScheduleLike = Union['Schedule', float, np.ndarray]
+
+
+def as_schedule(value: ScheduleLike) -> 'Schedule':
+    return value if isinstance(value, Schedule) else Constant(value)
+
+
+class Schedule(ABC):
+    """A function of the iteration index, evaluated on whole arrays of iterations."""
+
+    def __call__(self, iterations) -> np.ndarray:
+        return self.evaluate(np.asarray(iterations))
+
+    @abstractmethod
+    def evaluate(self, iterations: np.ndarray) -> np.ndarray:
+        """Values at the given iteration array."""
+
+    def table(self, iterations) -> np.ndarray:
+        """Evaluate over range(iterations) (an int) or the given iteration array."""
+        if np.isscalar(iterations):
+            iterations = np.arange(int(iterations))
+        return self(iterations)
+
+    def __add__(self, other: ScheduleLike) -> 'Schedule':
+        return Combined(np.add, self, as_schedule(other))
+
+    def __radd__(self, other: ScheduleLike) -> 'Schedule':
+        return Combined(np.add, as_schedule(other), self)
+
+    def __sub__(self, other: ScheduleLike) -> 'Schedule':
+        return Combined(np.subtract, self, as_schedule(other))
+
+    def __rsub__(self, other: ScheduleLike) -> 'Schedule':
+        return Combined(np.subtract, as_schedule(other), self)
+
+    def __mul__(self, other: ScheduleLike) -> 'Schedule':
+        return Combined(np.multiply, self, as_schedule(other))
+
+    def __rmul__(self, other: ScheduleLike) -> 'Schedule':
+        return Combined(np.multiply, as_schedule(other), self)
+
+    def where(self, then: ScheduleLike, otherwise: ScheduleLike) -> 'Schedule':
+        """For a mask schedule: `then` where it holds, `otherwise` elsewhere."""
+        return Select(self, as_schedule(then), as_schedule(otherwise))
+
+    def reset_every(self, period: int, value: ScheduleLike = 0.0, offset: int = 0) -> 'Schedule':
+        """This schedule, replaced by `value` every `period` iterations."""
+        return Every(period, offset).where(value, self)
+
+
+class Constant(Schedule):
+    def __init__(self, value):
+        self.value = value
+
+    def evaluate(self, iterations: np.ndarray) -> np.ndarray:
+        return np.broadcast_to(np.asarray(self.value, dtype=float), np.broadcast(iterations, self.value).shape)
+
+
+class Drift(Schedule):
+    """amplitude · wave(i / timescale + phase)."""
+
+    def __init__(self, amplitude, timescale: float, phase=0.0, wave: Callable = np.sin):
+        self.amplitude = amplitude
+        self.timescale = timescale
+        self.phase = phase
+        self.wave = wave
+
+    def evaluate(self, iterations: np.ndarray) -> np.ndarray:
+        argument = iterations / self.timescale
+        if np.ndim(self.phase) or self.phase:
+            argument = argument + self.phase
+        return self.amplitude * self.wave(argument)
+
+
+class Every(Schedule):
+    """Mask: true when i % period == offset."""
+
+    def __init__(self, period: int, offset=0):
+        self.period = period
+        self.offset = offset
+
+    def evaluate(self, iterations: np.ndarray) -> np.ndarray:
+        return iterations % self.period == self.offset
+
+
+class Window(Schedule):
+    """Mask: true when start <= i % period < stop."""
+
+    def __init__(self, period: int, start: int, stop: int):
+        self.period = period
+        self.start = start
+        self.stop = stop
+
+    def evaluate(self, iterations: np.ndarray) -> np.ndarray:
+        position = iterations % self.period
+        return (position >= self.start) & (position < self.stop)
+
+
+class Dropout(Schedule):
+    """Participation: 1.0 for the first `active` of every `period` iterations (shifted by offset), else 0.0."""
+
+    def __init__(self, period: int, active: int, offset=0):
+        self.period = period
+        self.active = active
+        self.offset = offset
+
+    def evaluate(self, iterations: np.ndarray) -> np.ndarray:
+        return ((iterations + self.offset) % self.period < self.active).astype(float)
+
+
+class Combined(Schedule):
+    def __init__(self, operator: Callable, left: Schedule, right: Schedule):
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+    def evaluate(self, iterations: np.ndarray) -> np.ndarray:
+        return self.operator(self.left.evaluate(iterations), self.right.evaluate(iterations))
+
+
+class Select(Schedule):
+    def __init__(self, mask: Schedule, then: Schedule, otherwise: Schedule):
+        self.mask = mask
+        self.then = then
+        self.otherwise = otherwise
+
+    def evaluate(self, iterations: np.ndarray) -> np.ndarray:
+        return np.where(self.mask.evaluate(iterations), self.then.evaluate(iterations), self.otherwise.evaluate(iterations))
+
+
+class Stack(Schedule):
+    """One schedule per observer; evaluates to (..., M)."""
+
+    def __init__(self, *observers: ScheduleLike):
+        self.observers = [as_schedule(observer) for observer in observers]
+
+    def evaluate(self, iterations: np.ndarray) -> np.ndarray:
+        columns = np.broadcast_arrays(*(observer.evaluate(iterations) for observer in self.observers))
+        return np.stack(columns, axis=-1)
+
+
+def stack(*observers: ScheduleLike) -> Stack:
+    return Stack(*observers)
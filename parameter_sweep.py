@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Parallel Parameter Sweeps
+
+Expands a grid or random search of parameters × seeds, runs every point
+through a target function on a process pool and aggregates the scalar
+metrics into one table.
+
+A target is any importable function `target(**params, seed=seed)` that
+returns a dict of scalar metrics, e.g.
+chronos_dilation_test.chronos_dilation_metrics, or ScenarioTarget wrapping
+a scenario factory from experiment_runner. Tasks are sent to workers in
+chunks so short runs are not dominated by inter-process overhead. Every
+finished chunk is appended to a JSON Lines file, so a sweep that is
+interrupted resumes where it stopped. With a ResultCache every seeded run
+is memoized (result_cache.CachedTarget) on its parameters, seed and the
+target's source, so repeating an unchanged sweep into a fresh results file
+only reads the cache.
+
+Usage:
+  python parameter_sweep.py chronos_dilation_test:chronos_dilation_metrics \\
+      --grid entropy_factor=0.01,0.05,0.1 --seeds 100 --out outputs/chronos_sweep.jsonl
+"""
+
+import argparse
+import importlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from metrics_sink import JsonLinesSink, iter_jsonl
+from result_cache import DEFAULT_CACHE_DIR, CachedTarget, ResultCache
+
+
+def grid(**axes: Sequence) -> List[Dict[str, Any]]:
+    """Cartesian product of parameter values."""
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[name] for name in names))]
+
+
+def random_search(space: Mapping[str, Any], samples: int, seed=None) -> List[Dict[str, Any]]:
+    """
+    Random parameter points. Each entry of `space` is a (low, high) tuple
+    (uniform float), a list (uniform choice) or a callable taking a Generator.
+    """
+    rng = np.random.default_rng(seed)
+    points = []
+    for _ in range(samples):
+        point = {}
+        for name, spec in space.items():
+            if callable(spec):
+                value = spec(rng)
+            elif isinstance(spec, tuple):
+                value = float(rng.uniform(*spec))
+            else:
+                value = spec[int(rng.integers(len(spec)))]
+            point[name] = value.item() if isinstance(value, np.generic) else value
+        points.append(point)
+    return points
+
+
+def task_key(params: Mapping[str, Any], seed) -> str:
+    """Stable identity of one run, used to skip finished runs on resume."""
+    return json.dumps({"params": dict(params), "seed": seed}, sort_keys=True, default=str)
+
+
+def _scalar_metrics(metrics) -> Dict[str, Any]:
+    if is_dataclass(metrics):
+        metrics = asdict(metrics)
+    return {
+        name: value.item() if isinstance(value, np.generic) else value
+        for name, value in metrics.items()
+        if isinstance(value, (bool, int, float, str, np.generic))
+    }
+
+
+class ScenarioTarget:
+    """
+    Sweep target running an experiment_runner scenario factory
+    (factory(**params, seed=seed)) and reporting its monitor's final metrics.
+    """
+
+    def __init__(self, factory: Callable):
+        self.factory = factory
+
+    def __call__(self, seed=None, **params) -> Dict[str, Any]:
+        from experiment_runner import run_scenario
+
+        monitor = run_scenario(self.factory(seed=seed, **params)).monitor
+        return _scalar_metrics(monitor.final_metrics())
+
+
+def _run_chunk(target: Callable, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    rows = []
+    for task in tasks:
+        metrics = _scalar_metrics(target(seed=task["seed"], **task["params"]))
+        rows.append({"params": task["params"], "seed": task["seed"], "metrics": metrics})
+    return rows
+
+
+class SweepTable:
+    """Aggregated sweep results: one row per run, columns for params and metrics."""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self.param_names = sorted({name for row in rows for name in row["params"]})
+        self.metric_names = sorted({name for row in rows for name in row["metrics"]})
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def column(self, name: str) -> np.ndarray:
+        if name == "seed":
+            return np.array([row["seed"] for row in self.rows])
+        source = "params" if name in self.param_names else "metrics"
+        return np.array([row[source].get(name) for row in self.rows])
+
+    def summarize(self, metrics: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Mean, standard deviation and 95% confidence half-width of each metric
+        over seeds, per parameter point.
+        """
+        if metrics is None:
+            metrics = [
+                name for name in self.metric_names
+                if all(isinstance(row["metrics"].get(name, 0.0), (int, float)) for row in self.rows)
+            ]
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for row in self.rows:
+            groups.setdefault(json.dumps(row["params"], sort_keys=True, default=str), []).append(row)
+
+        summary = []
+        for rows in groups.values():
+            entry = dict(rows[0]["params"])
+            entry["runs"] = len(rows)
+            for name in metrics:
+                values = np.array([row["metrics"][name] for row in rows if name in row["metrics"]], dtype=float)
+                std = float(np.std(values, ddof=1)) if len(values) > 1 else 0.0
+                entry[f"{name}_mean"] = float(np.mean(values)) if len(values) else float("nan")
+                entry[f"{name}_std"] = std
+                entry[f"{name}_ci95"] = 1.96 * std / np.sqrt(len(values)) if len(values) else float("nan")
+            summary.append(entry)
+        return summary
+
+
+def run_sweep(
+    target: Callable,
+    points: Sequence[Mapping[str, Any]],
+    seeds: Sequence = (None,),
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    results_path: Optional[str] = None,
+    resume: bool = True,
+    cache: Optional[ResultCache] = None,
+) -> SweepTable:
+    """
+    Run target over every parameter point × seed.
+
+    Args:
+        target: Picklable (module-level) function or ScenarioTarget
+        points: Parameter dicts (see grid / random_search)
+        seeds: Seeds run for every point
+        workers: Process count (None = CPU count, 0 or 1 = run in-process)
+        chunk_size: Runs per worker task (default: spread ~4 chunks per worker)
+        results_path: JSON Lines file receiving rows as chunks finish
+        resume: Keep rows already in results_path and skip those runs
+        cache: ResultCache memoizing seeded runs across sweeps
+    """
+    if cache is not None:
+        target = CachedTarget(target, cache)
+    tasks = [{"params": dict(point), "seed": seed} for point in points for seed in seeds]
+
+    rows: List[Dict[str, Any]] = []
+    if results_path and resume and os.path.exists(results_path):
+        wanted = {task_key(task["params"], task["seed"]) for task in tasks}
+        done = set()
+        for row in iter_jsonl(results_path):
+            key = task_key(row["params"], row["seed"])
+            if key in wanted and key not in done:
+                done.add(key)
+                rows.append(row)
+        tasks = [task for task in tasks if task_key(task["params"], task["seed"]) not in done]
+
+    sink = None
+    if results_path:
+        sink = JsonLinesSink(results_path, buffer_size=max(1, len(tasks)), append=resume)
+
+    def collect(chunk_rows):
+        rows.extend(chunk_rows)
+        if sink is not None:
+            for row in chunk_rows:
+                sink.record(**row)
+            sink.flush()
+
+    workers = os.cpu_count() if workers is None else workers
+    try:
+        if workers <= 1 or len(tasks) <= 1:
+            chunk = chunk_size or max(1, len(tasks))
+            for start in range(0, len(tasks), chunk):
+                collect(_run_chunk(target, tasks[start:start + chunk]))
+        else:
+            chunk = chunk_size or max(1, len(tasks) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_run_chunk, target, tasks[start:start + chunk])
+                    for start in range(0, len(tasks), chunk)
+                ]
+                for future in as_completed(futures):
+                    collect(future.result())
+    finally:
+        if sink is not None:
+            sink.close()
+    return SweepTable(rows)
+
+
+def load_target(path: str) -> Callable:
+    """Resolve 'module:function'; scenario factories are wrapped in ScenarioTarget."""
+    module_name, _, attribute = path.partition(":")
+    target = getattr(importlib.import_module(module_name), attribute)
+    if attribute.endswith("_scenario"):
+        return ScenarioTarget(target)
+    return target
+
+
+def _parse_value(text: str):
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    if text in ("True", "False"):
+        return text == "True"
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Omega Code parameter sweep")
+    parser.add_argument("target", help="module:function (functions named *_scenario run through experiment_runner)")
+    parser.add_argument("--grid", action="append", default=[], help="name=v1,v2,... (repeatable)")
+    parser.add_argument("--seeds", type=int, default=10, help="Seeds 0..N-1 per parameter point")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Runs per worker task")
+    parser.add_argument("--out", default="outputs/sweep.jsonl", help="JSON Lines results file")
+    parser.add_argument("--fresh", action="store_true", help="Ignore previous results in --out")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Result cache for seeded runs")
+    parser.add_argument("--no-cache", action="store_true", help="Recompute every run")
+    args = parser.parse_args()
+
+    axes = {}
+    for entry in args.grid:
+        name, _, values = entry.partition("=")
+        axes[name] = [_parse_value(value) for value in values.split(",")]
+
+    table = run_sweep(
+        load_target(args.target),
+        grid(**axes),
+        seeds=list(range(args.seeds)),
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        results_path=args.out,
+        resume=not args.fresh,
+        cache=None if args.no_cache else ResultCache(args.cache_dir),
+    )
+    print(f"{len(table)} runs")
+    for entry in table.summarize():
+        print(json.dumps(entry, default=float))
+
+
+if __name__ == "__main__":
+    main()
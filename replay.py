@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Event-Log Replay
+
+With seeded random streams a run is a pure function of its seed, its
+per-iteration dynamics (decoherence, then a tick) and the external events
+applied to it. RecordedRun drives a live universe and keeps only that
+description, an EventLog of one small JSON object per event, and Replay
+rebuilds the universe as of any iteration:
+
+- the nearest cached state at or before the iteration is forked
+  (copy-on-write, so cached states share every column they agree on)
+- the gaps between events are covered with UniversalSymphony.advance,
+  which is bit-identical to stepping the loop
+- on the way, a state is cached every `checkpoint_every` iterations, so
+  later queries start close by
+
+Events apply at the start of their iteration, before its dynamics, and
+address particles by stable id, never by handle. state_at(i) is the
+universe after i iterations and the events logged at i:
+
+    run = RecordedRun(seed=7, entropy=0.01, dt=0.05)
+    run.fractal(base_freq=1.0, octaves=6)
+    run.advance(5000)
+    word = run.inject(frequency=5.5)
+    run.advance(1000)
+    run.lock([word], phase=0.0)
+    run.advance(100000)
+    run.log.save('outputs/run.events.json')
+
+    replay = Replay(EventLog.load('outputs/run.events.json'))
+    universe = replay.state_at(5400)
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from unity_script import Consciousness, QuantumParticle, UniversalSymphony, generate_fractal_universe
+
+
+def _ids(universe: UniversalSymphony, ids) -> np.ndarray:
+    """Current `entities` positions of the ids that are still alive."""
+    positions = universe.indices_of(ids)
+    return positions[positions >= 0]
+
+
+def _particles(universe, frequencies, depth=0, observed=False):
+    rng = universe.streams.universe
+    particles = [QuantumParticle(frequency=float(freq), depth=depth, rng=rng) for freq in frequencies]
+    if observed:
+        for particle in particles:
+            particle.observe()
+    universe.add_all(particles)
+    return [particle.particle_id for particle in particles]
+
+
+def _fractal(universe, base_freq=1.0, octaves=6):
+    particles = generate_fractal_universe(base_freq=base_freq, octaves=octaves, rng=universe.streams.universe)
+    universe.add_all(particles)
+    return [particle.particle_id for particle in particles]
+
+
+def _inject(universe, frequency, amplitude=1.0, phase=0.0, depth=0, auto_observe=True, observer=7.83):
+    word = Consciousness(frequency=observer).inject_frequency(
+        symphony=universe,
+        frequency=frequency,
+        amplitude=amplitude,
+        phase=phase,
+        depth=depth,
+        auto_observe=auto_observe,
+    )
+    return word.particle_id
+
+
+def _lock(universe, ids, phase):
+    return universe.lock_phase(_ids(universe, ids), phase)
+
+
+def _observe(universe, ids=None, probability=1.0, band=None):
+    indices = None if ids is None else _ids(universe, ids)
+    return universe.observe(indices=indices, probability=probability, band=None if band is None else tuple(band))
+
+
+def _remove(universe, ids):
+    return universe.remove_many(ids)
+
+
+EVENTS: Dict[str, Callable] = {
+    'particles': _particles,
+    'fractal': _fractal,
+    'inject': _inject,
+    'lock': _lock,
+    'observe': _observe,
+    'remove': _remove,
+}
+
+
+def apply_event(universe: UniversalSymphony, event: dict):
+    """Apply one logged event; returns what the underlying call returns."""
+    args = {key: value for key, value in event.items() if key not in ('iteration', 'kind')}
+    return EVENTS[event['kind']](universe, **args)
+
+
+@dataclass
+class EventLog:
+    """
+    Everything needed to rebuild a run.
+
+    Args:
+        seed: Root seed of the universe's random streams
+        entropy: Decoherence applied every iteration
+        dt: Tick length of every iteration
+        iterations: Iterations the recorded run covers
+        events: {'iteration', 'kind', **args} in the order they were applied
+    """
+    seed: int
+    entropy: float = 0.0
+    dt: float = 1.0
+    iterations: int = 0
+    events: List[dict] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, text: str) -> 'EventLog':
+        return cls(**json.loads(text))
+
+    def save(self, path: str) -> str:
+        with open(path, 'w') as handle:
+            handle.write(self.to_json())
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> 'EventLog':
+        with open(path) as handle:
+            return cls.from_json(handle.read())
+
+
+def _json_value(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [_json_value(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class RecordedRun:
+    """
+    A live universe whose seed, dynamics and events are logged as it runs.
+
+    Args:
+        seed: Root seed (None draws fresh entropy, which is then logged)
+        entropy: Decoherence applied every iteration
+        dt: Tick length of every iteration
+    """
+
+    def __init__(self, seed: Optional[int] = None, entropy: float = 0.0, dt: float = 1.0):
+        seed = int(np.random.SeedSequence(seed).entropy)
+        self.universe = UniversalSymphony(seed=seed)
+        self.log = EventLog(seed=seed, entropy=float(entropy), dt=float(dt))
+
+    @property
+    def iteration(self) -> int:
+        return self.log.iterations
+
+    def apply(self, kind: str, **args):
+        """Apply an event to the universe now and log it."""
+        event = {'iteration': self.iteration, 'kind': kind}
+        event.update({key: _json_value(value) for key, value in args.items()})
+        result = apply_event(self.universe, event)
+        self.log.events.append(event)
+        return result
+
+    def particles(self, frequencies: Sequence[float], depth: int = 0, observed: bool = False) -> List[int]:
+        return self.apply('particles', frequencies=frequencies, depth=depth, observed=observed)
+
+    def fractal(self, base_freq: float = 1.0, octaves: int = 6) -> List[int]:
+        return self.apply('fractal', base_freq=base_freq, octaves=octaves)
+
+    def inject(self, frequency: float, **options) -> int:
+        """Inject a Word (see Consciousness.inject_frequency); returns its id."""
+        return self.apply('inject', frequency=frequency, **options)
+
+    def lock(self, ids, phase: float) -> np.ndarray:
+        return self.apply('lock', ids=ids, phase=phase)
+
+    def observe(self, ids=None, probability: float = 1.0, band=None) -> np.ndarray:
+        return self.apply('observe', ids=ids, probability=probability, band=band)
+
+    def remove(self, ids) -> int:
+        return self.apply('remove', ids=ids)
+
+    def advance(self, steps: int = 1):
+        """Run the per-iteration dynamics for `steps` iterations."""
+        self.universe.advance(steps, self.log.entropy, self.log.dt)
+        self.log.iterations += int(steps)
+
+
+class Replay:
+    """
+    Reconstructs a logged run at any iteration.
+
+    Args:
+        log: The run's EventLog
+        checkpoint_every: Cache the state every this many iterations
+    """
+
+    def __init__(self, log: EventLog, checkpoint_every: int = 1000):
+        self.log = log
+        self.checkpoint_every = int(checkpoint_every)
+        self._event_iterations = np.array([event['iteration'] for event in log.events], dtype=np.int64)
+        # iteration -> (state before that iteration's events, index of its first event)
+        self._checkpoints: Dict[int, Tuple[UniversalSymphony, int]] = {}
+
+    @property
+    def checkpoints(self) -> List[int]:
+        return sorted(self._checkpoints)
+
+    def _start(self, iteration: int) -> Tuple[UniversalSymphony, int, int]:
+        cached = [position for position in self._checkpoints if position <= iteration]
+        if not cached:
+            return UniversalSymphony(seed=self.log.seed), 0, 0
+        position = max(cached)
+        universe, next_event = self._checkpoints[position]
+        return universe.fork(), position, next_event
+
+    def _advance(self, universe: UniversalSymphony, position: int, target: int, next_event: int) -> int:
+        every = self.checkpoint_every
+        while position < target:
+            stop = min(target, (position // every + 1) * every)
+            universe.advance(stop - position, self.log.entropy, self.log.dt)
+            position = stop
+            if position % every == 0 and position not in self._checkpoints:
+                self._checkpoints[position] = (universe.fork(), next_event)
+        return position
+
+    def state_at(self, iteration: int) -> UniversalSymphony:
+        """
+        The universe as the recorded run had it after `iteration` iterations
+        and the events logged at that iteration. The result is a branch of the cached
+        states: changing it does not affect later queries.
+        """
+        if not 0 <= iteration <= self.log.iterations:
+            raise ValueError(f"log covers iterations 0..{self.log.iterations}, got {iteration}")
+        universe, position, next_event = self._start(iteration)
+        events = self.log.events
+        while next_event < len(events) and self._event_iterations[next_event] <= iteration:
+            position = self._advance(universe, position, int(self._event_iterations[next_event]), next_event)
+            while next_event < len(events) and self._event_iterations[next_event] == position:
+                apply_event(universe, events[next_event])
+                next_event += 1
+        self._advance(universe, position, iteration, next_event)
+        return universe
+
+    def final_state(self) -> UniversalSymphony:
+        return self.state_at(self.log.iterations)
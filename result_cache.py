@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Content-Addressed Result Cache
+
+Experiment stages (trajectories, metrics, figures) are keyed on a hash of
+the stage name, its parameters, the seed and the source code they depend
+on. When none of those changed the stored result is returned instead of
+recomputing it; editing a dependency module changes the key, so stale
+results are never served. A module or function source covers its own file
+and, transitively, every project module it imports (anything outside the
+interpreter's stdlib and site-packages), so a figure stage keyed on its
+plotting function is invalidated by a change to the physics it plots.
+
+Entries live under `<root>/<key[:2]>/<key>/`:
+- values.json  JSON-able results
+- arrays.npz   NumPy arrays (loaded without pickle)
+- files/       copies of output files (figures, reports)
+
+The cache is bounded in bytes; least recently used entries are evicted
+first. Each instance keeps a running size estimate (the last full scan
+plus what it stored since) and only rescans the tree when the estimate
+crosses the bound, so a store is not O(entries) of I/O. Several processes
+(sweep workers) may share one cache: entries evicted underneath a reader
+are misses, and a key stored by two workers keeps whichever landed first.
+Stages with seed=None are treated as nondeterministic and always run.
+"""
+
+import ast
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import sys
+import sysconfig
+import tempfile
+import time
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+DEFAULT_CACHE_DIR = os.path.join("outputs", ".cache")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+Source = Union[str, ModuleType, Callable]
+
+_source_digests: Dict[Tuple[str, float, int], str] = {}
+_module_files: Dict[str, Tuple[str, ...]] = {}
+
+_INSTALLED = tuple(
+    os.path.abspath(sysconfig.get_paths()[name]) + os.sep
+    for name in ("stdlib", "platstdlib", "purelib", "platlib")
+)
+
+
+def _project_file(module) -> Optional[str]:
+    path = getattr(module, "__file__", None)
+    if not path or not path.endswith(".py"):
+        return None
+    path = os.path.abspath(path)
+    return None if path.startswith(_INSTALLED) else path
+
+
+def _imported_modules(module: ModuleType) -> Iterable[ModuleType]:
+    """Already-loaded modules named by the import statements in a module's source."""
+    with open(module.__file__, "rb") as handle:
+        tree = ast.parse(handle.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        for name in names:
+            if name in sys.modules:
+                yield sys.modules[name]
+
+
+def _module_closure(module: ModuleType) -> Tuple[str, ...]:
+    """Files of a project module and of every project module it imports, transitively."""
+    if module.__name__ not in _module_files:
+        files, pending, seen = [], [module], {module.__name__}
+        while pending:
+            current = pending.pop()
+            path = _project_file(current)
+            if path is None:
+                continue
+            files.append(path)
+            for imported in _imported_modules(current):
+                if imported.__name__ not in seen:
+                    seen.add(imported.__name__)
+                    pending.append(imported)
+        _module_files[module.__name__] = tuple(sorted(files))
+    return _module_files[module.__name__]
+
+
+def source_files(sources: Iterable[Source]) -> List[str]:
+    """
+    Files the given sources depend on: a path as is, a module, class or
+    function (or an object, via its type) as its module's file plus the
+    project modules it imports.
+    """
+    files = set()
+    for source in sources:
+        if isinstance(source, str):
+            files.add(os.path.abspath(source))
+            continue
+        if not (inspect.ismodule(source) or inspect.isclass(source) or inspect.isroutine(source)):
+            source = type(source)
+        module = source if inspect.ismodule(source) else inspect.getmodule(source)
+        closure = _module_closure(module) if module is not None else ()
+        files.update(closure or [os.path.abspath(inspect.getsourcefile(source))])
+    return sorted(files)
+
+
+def source_hash(sources: Iterable[Source]) -> str:
+    """Digest of the files the given sources depend on (cached by path and mtime)."""
+    digest = hashlib.sha256()
+    for path in source_files(sources):
+        stat = os.stat(path)
+        stamp = (path, stat.st_mtime, stat.st_size)
+        if stamp not in _source_digests:
+            with open(path, "rb") as handle:
+                _source_digests[stamp] = hashlib.sha256(handle.read()).hexdigest()
+        digest.update(os.path.basename(path).encode())
+        digest.update(_source_digests[stamp].encode())
+    return digest.hexdigest()
+
+
+def _tree_size(path: str) -> int:
+    """Bytes under a directory; files removed concurrently count as zero."""
+    total = 0
+    for directory, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.path.getsize(os.path.join(directory, filename))
+            except FileNotFoundError:
+                pass
+    return total
+
+
+def _canonical(value):
+    if isinstance(value, np.ndarray):
+        return {"__array__": hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest(),
+                "dtype": str(value.dtype), "shape": list(value.shape)}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+class ResultCache:
+    """
+    On-disk cache of experiment stage results.
+
+    Args:
+        root: Cache directory
+        max_bytes: Size bound; least recently used entries are evicted past it
+        enabled: False turns every lookup into a miss (and stores nothing)
+    """
+
+    def __init__(self, root: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES, enabled: bool = True):
+        self.root = root
+        self.max_bytes = int(max_bytes)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._usage: Optional[int] = None  # bytes at the last scan plus bytes stored since
+
+    def key(self, stage: str, params: Optional[Dict[str, Any]] = None, seed=None, sources: Sequence[Source] = ()) -> str:
+        payload = json.dumps(
+            {"stage": stage, "params": _canonical(params or {}), "seed": _canonical(seed), "source": source_hash(sources)},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key)
+
+    def _touch(self, entry: str):
+        now = time.time()
+        try:
+            os.utime(entry, (now, now))
+        except FileNotFoundError:
+            pass
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Stored values for key (arrays restored as ndarrays), or None."""
+        entry = self._entry(key)
+        if not self.enabled or not os.path.isdir(entry):
+            return None
+        try:
+            with open(os.path.join(entry, "values.json")) as handle:
+                values = json.load(handle)
+            arrays_path = os.path.join(entry, "arrays.npz")
+            if os.path.exists(arrays_path):
+                with np.load(arrays_path, allow_pickle=False) as arrays:
+                    values.update({name: arrays[name] for name in arrays.files})
+        except FileNotFoundError:
+            return None  # evicted by another process while reading
+        self._touch(entry)
+        return values
+
+    def store(self, key: str, values: Dict[str, Any], files: Sequence[str] = ()):
+        """Store values (ndarrays go to arrays.npz) and copies of output files."""
+        if not self.enabled:
+            return
+        entry = self._entry(key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".staging-", dir=os.path.dirname(entry))
+        try:
+            arrays = {name: value for name, value in values.items() if isinstance(value, np.ndarray)}
+            plain = {name: _canonical(value) for name, value in values.items() if name not in arrays}
+            with open(os.path.join(staging, "values.json"), "w") as handle:
+                json.dump(plain, handle)
+            if arrays:
+                np.savez(os.path.join(staging, "arrays.npz"), **arrays)
+            if files:
+                os.makedirs(os.path.join(staging, "files"))
+                for index, path in enumerate(files):
+                    shutil.copyfile(path, os.path.join(staging, "files", f"{index}"))
+            size = _tree_size(staging)
+            try:
+                os.replace(staging, entry)
+            except OSError:
+                if not os.path.isdir(entry):
+                    raise
+                # Another worker stored this key first; its result is the same one
+                shutil.rmtree(staging, ignore_errors=True)
+                return
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        if self._usage is None or self._usage + size > self.max_bytes:
+            self.evict()
+        else:
+            self._usage += size
+
+    def stage(
+        self,
+        stage: str,
+        compute: Callable[[], Dict[str, Any]],
+        params: Optional[Dict[str, Any]] = None,
+        seed=None,
+        sources: Sequence[Source] = (),
+        deterministic: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """
+        Return compute()'s dict result, from the cache when stage, params, seed
+        and sources are unchanged. Values must be JSON-able or ndarrays.
+        deterministic defaults to `seed is not None`.
+        """
+        if deterministic is None:
+            deterministic = seed is not None
+        if not deterministic:
+            return compute()
+        key = self.key(stage, params, seed, sources)
+        cached = self.load(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        values = compute()
+        self.store(key, values)
+        return values
+
+    def files(
+        self,
+        stage: str,
+        outputs: Sequence[str],
+        produce: Callable[[], Any],
+        params: Optional[Dict[str, Any]] = None,
+        sources: Sequence[Source] = (),
+    ) -> bool:
+        """
+        Produce output files (e.g. figures) unless an identical stage was
+        cached, in which case the stored copies are restored. Returns True on a hit.
+        """
+        key = self.key(stage, dict(params or {}, outputs=list(outputs)), None, sources)
+        entry = self._entry(key)
+        if self.enabled and os.path.isdir(os.path.join(entry, "files")):
+            try:
+                for index, path in enumerate(outputs):
+                    directory = os.path.dirname(path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    shutil.copyfile(os.path.join(entry, "files", f"{index}"), path)
+            except FileNotFoundError:
+                pass  # evicted by another process while copying; produce the files instead
+            else:
+                self._touch(entry)
+                self.hits += 1
+                return True
+        self.misses += 1
+        produce()
+        self.store(key, {"outputs": list(outputs)}, files=outputs)
+        return False
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        if not os.path.isdir(self.root):
+            return entries
+        for shard in os.listdir(self.root):
+            shard_path = os.path.join(self.root, shard)
+            try:
+                names = os.listdir(shard_path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for name in names:
+                entry = os.path.join(shard_path, name)
+                if name.startswith(".staging-"):
+                    continue
+                try:
+                    mtime = os.stat(entry).st_mtime
+                except FileNotFoundError:
+                    continue  # evicted by another process
+                if os.path.isdir(entry):
+                    entries.append((mtime, _tree_size(entry), entry))
+        return entries
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the cache fits max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed += 1
+        self._usage = total
+        return removed
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+        self._usage = 0
+
+
+class CachedTarget:
+    """
+    Memoize a sweep/metrics function `target(**params, seed=seed) -> dict`
+    on (params, seed, source of the target's module and `sources`). Picklable,
+    so parameter_sweep can hand it to worker processes.
+    """
+
+    def __init__(self, target: Callable, cache: Optional[ResultCache] = None, sources: Sequence[Source] = ()):
+        self.target = target
+        self.cache = cache or ResultCache()
+        # A ScenarioTarget is named and hashed by the scenario factory it wraps
+        named = getattr(target, "factory", target)
+        self.sources = source_files([named] + list(sources))
+        self.stage_name = f"{named.__module__}.{named.__qualname__}"
+
+    def __call__(self, seed=None, **params) -> Dict[str, Any]:
+        return self.cache.stage(self.stage_name, lambda: self.target(seed=seed, **params), params, seed, self.sources)
@@ -29,13 +29,19 @@ Date: February 4, 2026
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
 import json
 import numpy as np
 import matplotlib.pyplot as plt
 
-from unity_script import Consciousness, QuantumParticle, UniversalSymphony
+from coherence_metrics import pairwise_wrapped_coherence
+from council_bank import CouncilBank, DutyCycle, NonParticipationDecay, alignment_scores
+from experiment_runner import ScenarioSpec, ScenarioStep, run_scenario
+from history_recorder import HistoryRecorder, history_column
+from observer_schedule import Drift, Window, stack
+from unity_script import QuantumParticle, UniversalSymphony
 
 
 @dataclass
@@ -51,8 +57,14 @@ class RevelationMetrics:
 
 
 class TrustDecayCouncil:
+    """One council whose trust decays while observers sit out (a single-row CouncilBank)."""
+
     def __init__(self, trust_scores: List[float]):
-        self.trust_scores = np.array(trust_scores, dtype=float)
+        self.bank = CouncilBank(trust_scores, floor=0.02, decay=NonParticipationDecay())
+
+    @property
+    def trust_scores(self) -> np.ndarray:
+        return self.bank.trust[0]
 
     def update(
         self,
@@ -61,161 +73,143 @@ class TrustDecayCouncil:
         learning_rate: float = 0.05,
         decay_rate: float = 0.02,
     ):
-        alignments = np.array(alignments, dtype=float)
-        participation = np.array(participation, dtype=float)
-
         # Trust grows with alignment but decays with non-participation
-        growth = learning_rate * alignments
-        decay = decay_rate * (1.0 - participation)
-
-        self.trust_scores = (1.0 - learning_rate) * self.trust_scores + growth - decay
-        self.trust_scores = np.clip(self.trust_scores, 0.02, 1.0)
-        self.trust_scores = self.trust_scores / float(np.sum(self.trust_scores))
+        self.bank.decay.rate = decay_rate
+        self.bank.update(alignments, participation, learning_rate=learning_rate)
 
     def weighted_phase(self, phases: List[float]) -> float:
-        phases = np.array(phases, dtype=float)
-        return float(np.sum(phases * self.trust_scores))
+        return float(self.bank.weighted_phase(phases)[0])
 
 
 class RevelationMonitor:
-    def __init__(self, universe: UniversalSymphony, waves: List[QuantumParticle], mode: str):
+    system_coherence_history = history_column('system_coherence')
+    cross_coherence_history = history_column('cross_coherence')
+    consensus_index_history = history_column('consensus_index')
+    trust_history = history_column('trust')
+    recovery_history = history_column('recovery')
+
+    def __init__(
+        self,
+        universe: UniversalSymphony,
+        waves: List[QuantumParticle],
+        mode: str,
+        observers: int,
+        capacity: Optional[int] = None,
+    ):
         self.universe = universe
         self.waves = waves
         self.mode = mode
 
-        self.system_coherence_history: List[float] = []
-        self.cross_coherence_history: List[float] = []
-        self.consensus_index_history: List[float] = []
-        self.trust_history: List[List[float]] = []
-        self.recovery_history: List[float] = []
+        self.history = HistoryRecorder(
+            {
+                'system_coherence': np.float64,
+                'cross_coherence': np.float64,
+                'consensus_index': np.float64,
+                'trust': (np.float64, (observers,)),
+                'recovery': np.float64,
+            },
+            capacity=capacity,
+        )
         self._last_consensus = None
 
-    @staticmethod
-    def _pairwise_cross_coherence(phases: List[float]) -> float:
-        if len(phases) < 2:
-            return 1.0
-        pair_values = []
-        for i in range(len(phases)):
-            for j in range(i + 1, len(phases)):
-                phase_diff = abs(phases[i] - phases[j])
-                pair_values.append(1.0 - (phase_diff % (2 * np.pi)) / (2 * np.pi))
-        return float(np.mean(pair_values)) if pair_values else 1.0
-
     def record(self, consensus_index: float, trust_scores: List[float]):
-        self.system_coherence_history.append(self.universe.get_coherence())
         phases = [w.phase for w in self.waves]
-        self.cross_coherence_history.append(self._pairwise_cross_coherence(phases))
-        self.consensus_index_history.append(consensus_index)
-        self.trust_history.append(list(trust_scores))
 
         if self._last_consensus is None:
             recovery = 0.0
         else:
             recovery = consensus_index - self._last_consensus
-        self.recovery_history.append(recovery)
         self._last_consensus = consensus_index
 
+        self.history.record(
+            system_coherence=self.universe.get_coherence(),
+            cross_coherence=pairwise_wrapped_coherence(phases),
+            consensus_index=consensus_index,
+            trust=trust_scores,
+            recovery=recovery,
+        )
+
     def final_metrics(self) -> RevelationMetrics:
-        recovery_index = float(np.max(self.recovery_history)) if self.recovery_history else 0.0
+        recovery_index = self.history.max('recovery')
+        history = self.history
         return RevelationMetrics(
             mode=self.mode,
-            system_coherence_avg=float(np.mean(self.system_coherence_history)) if self.system_coherence_history else 0.0,
-            system_coherence_final=float(self.system_coherence_history[-1]) if self.system_coherence_history else 0.0,
-            cross_coherence_avg=float(np.mean(self.cross_coherence_history)) if self.cross_coherence_history else 0.0,
-            cross_coherence_peak=float(np.max(self.cross_coherence_history)) if self.cross_coherence_history else 0.0,
-            consensus_index=float(np.mean(self.consensus_index_history)) if self.consensus_index_history else 0.0,
-            trust_scores_final=self.trust_history[-1] if self.trust_history else [],
+            system_coherence_avg=history.mean('system_coherence'),
+            system_coherence_final=history.last('system_coherence'),
+            cross_coherence_avg=history.mean('cross_coherence'),
+            cross_coherence_peak=history.max('cross_coherence'),
+            consensus_index=history.mean('consensus_index'),
+            trust_scores_final=history.last('trust', default=np.zeros(0)).tolist(),
             recovery_index=recovery_index,
         )
 
 
-def _create_universe() -> UniversalSymphony:
-    universe = UniversalSymphony()
-    for freq in [1.0, 2.0, 3.0, 4.0]:
-        particle = QuantumParticle(frequency=freq, depth=0)
-        particle.observe()
-        universe.add(particle)
-    return universe
-
-
-def _inject_triad(universe: UniversalSymphony) -> List[QuantumParticle]:
-    observer = Consciousness(frequency=7.83)
-    freqs = [8.0, 10.0, 12.0]
-    waves = []
-    for freq in freqs:
-        wave = observer.inject_frequency(
-            symphony=universe,
-            frequency=freq,
-            amplitude=1.0,
-            phase=0.0,
-            auto_observe=True,
-        )
-        waves.append(wave)
-    return waves
-
-
-def _observer_phases(iteration: int) -> Tuple[float, float, float, float]:
+_observer_phases = stack(
     # Two aligned observers
-    phase_a = 0.0 + 0.02 * np.sin(iteration / 10.0)
-    phase_b = 0.0 + 0.02 * np.cos(iteration / 12.0)
+    Drift(0.02, 10.0),
+    Drift(0.02, 12.0, wave=np.cos),
     # Drifting observer (sporadic tuning)
-    phase_c = 0.12 * np.sin(iteration / 8.0)
+    Drift(0.12, 8.0),
     # Adversarial observer (injects dissonance in windows)
-    phase_d = 0.5 if (iteration % 80) < 25 else 0.15 * np.sin(iteration / 6.0)
-    return phase_a, phase_b, phase_c, phase_d
+    Window(80, 0, 25).where(0.5, Drift(0.15, 6.0)),
+)
 
 
-def _participation_flags(iteration: int) -> List[float]:
-    # A, B always active; C sometimes drops; D always active but adversarial
-    active_c = 1.0 if (iteration % 40) < 30 else 0.0
-    return [1.0, 1.0, active_c, 1.0]
+# A, B always active; C sometimes drops; D always active but adversarial
+_participation_flags = DutyCycle(observers=4, intermittent=[2], period=40, active=30)
 
 
-def _alignment_scores(phases: List[float], consensus_phase: float) -> List[float]:
-    scores = []
-    for phase in phases:
-        alignment = 1.0 - min(1.0, abs(phase - consensus_phase) / (2 * np.pi))
-        scores.append(alignment)
-    return scores
+class DecayPolicy:
+    """Per-step consensus through the trust-decay council (or plain mean)."""
 
+    def __init__(self, council: TrustDecayCouncil, trust_decay: bool, iterations: int):
+        self.council = council
+        self.trust_decay = trust_decay
+        # (T, M) participation compiled once for the whole run
+        self.participation = _participation_flags.table(iterations)
 
-def run_council(iterations: int, trust_decay: bool) -> RevelationMonitor:
-    universe = _create_universe()
-    waves = _inject_triad(universe)
-
-    monitor = RevelationMonitor(universe, waves, mode="trust_decay" if trust_decay else "equal")
-    council = TrustDecayCouncil([1.0, 1.0, 1.0, 1.0])
+    def __call__(self, iteration: int, phases: np.ndarray) -> Tuple[float, float]:
+        if self.trust_decay:
+            consensus_phase = self.council.weighted_phase(phases)
+        else:
+            consensus_phase = float(np.mean(phases))
 
-    for iteration in range(iterations):
-        universe.apply_decoherence(entropy_factor=0.002)
+        alignments = alignment_scores(phases, consensus_phase)
+        self.council.update(alignments, self.participation[iteration])
+        return consensus_phase, float(np.mean(alignments))
 
-        phases = list(_observer_phases(iteration))
-        participation = _participation_flags(iteration)
+    def record(self, monitor: RevelationMonitor, step: ScenarioStep):
+        monitor.record(step.alignment, self.council.trust_scores.tolist())
 
-        if trust_decay:
-            consensus_phase = council.weighted_phase(phases)
-        else:
-            consensus_phase = float(np.mean(phases))
 
-        alignments = _alignment_scores(phases, consensus_phase)
-        council.update(alignments, participation)
+def _progress(monitor: RevelationMonitor, step: ScenarioStep) -> str:
+    return (
+        f"  Iteration {step.iteration + 1:4d} ({monitor.mode}): "
+        f"System={monitor.system_coherence_history[-1]:.4f}, "
+        f"Consensus={step.alignment:.4f}"
+    )
 
-        if iteration % 4 == 0:
-            for wave in waves:
-                wave.phase = consensus_phase
-                wave.observe()
 
-        consensus_index = float(np.mean(alignments))
-        monitor.record(consensus_index, council.trust_scores.tolist())
+def council_scenario(iterations: int, trust_decay: bool, seed=None) -> ScenarioSpec:
+    """Four observers (one drifting and dropping out, one adversarial) locking a triad."""
+    mode = "trust_decay" if trust_decay else "equal"
+    policy = DecayPolicy(TrustDecayCouncil([1.0, 1.0, 1.0, 1.0]), trust_decay, iterations)
+    return ScenarioSpec(
+        name=mode,
+        iterations=iterations,
+        monitor=partial(RevelationMonitor, mode=mode, observers=len(policy.council.trust_scores), capacity=iterations),
+        record=policy.record,
+        observer_phases=_observer_phases,
+        policy=policy,
+        lock_every=4,
+        progress=_progress,
+        progress_every=120,
+        seed=seed,
+    )
 
-        if (iteration + 1) % 120 == 0:
-            print(
-                f"  Iteration {iteration + 1:4d} ({monitor.mode}): "
-                f"System={monitor.system_coherence_history[-1]:.4f}, "
-                f"Consensus={consensus_index:.4f}"
-            )
 
-    return monitor
+def run_council(iterations: int, trust_decay: bool) -> RevelationMonitor:
+    return run_scenario(council_scenario(iterations, trust_decay)).monitor
 
 
 def visualize_results(equal: RevelationMonitor, trust: RevelationMonitor):
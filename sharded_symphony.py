@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Sharded Symphony
+
+A UniversalSymphony computes on one core. ShardedSymphony keeps the
+particle columns it needs (freq, phase, observed) in
+multiprocessing.shared_memory and partitions the particles into contiguous
+shards handled by a pool of worker processes. Workers attach to the shared
+columns once, at start-up, so a step sends only (operation, shard bounds)
+over the pipe and never copies particle data:
+
+- apply_decoherence / observe_all: every shard perturbs or collapses its
+  own slice in place
+- get_coherence, tick, get_observed_count, emergent_time: shards return
+  phasor sums, |freq| sums and counts, which the parent adds up
+- render_reality: each shard renders its particles over the whole time
+  axis into its row of a shared (shards, T) buffer; the rows are summed
+
+Shard bounds are multiples of PARTICLE_BLOCK_SIZE and the random draws
+come from the same per-block RandomStreams as UniversalSymphony, so with
+the same seed a sharded run reproduces the serial one bit for bit,
+whatever the number of workers. As in UniversalSymphony, the particles of
+nested universes count towards coherence, Omega Time and rendering but do
+not drift or collapse: only the leading `active` particles (the root's)
+do. observe_all only sets observed flags; superposition collapse and
+entangled partners stay with UniversalSymphony.
+
+    with ShardedSymphony.from_universe(universe, workers=8) as sharded:
+        for _ in range(steps):
+            sharded.apply_decoherence(0.002)
+        field = sharded.render_reality(t)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from unity_script import (
+    STREAM_DECOHERENCE,
+    STREAM_OBSERVATION,
+    QuantumParticle,
+    RandomStreams,
+    UniversalSymphony,
+)
+
+SHARED_COLUMNS = {'freq': np.float64, 'phase': np.float64, 'observed': np.bool_}
+RENDER_CHUNK_ELEMENTS = UniversalSymphony.RENDER_CHUNK_ELEMENTS
+
+# Worker-side state, set by _attach_worker
+_WORKER: Dict[str, object] = {}
+
+
+def _attach(name: str, dtype, shape) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _attach_worker(specs: Dict[str, Tuple[str, str, int]], streams_state: dict):
+    blocks, arrays = [], {}
+    for column, (name, dtype, size) in specs.items():
+        block, arrays[column] = _attach(name, dtype, (size,))
+        blocks.append(block)
+    streams = RandomStreams()
+    streams.load_state_dict(streams_state)
+    _WORKER.update(blocks=blocks, arrays=arrays, streams=streams)
+
+
+def _shard_op(arrays: Dict[str, np.ndarray], streams: RandomStreams, op: str, start: int, stop: int, *args):
+    """One operation on particles [start, stop); shared by workers and the in-process path."""
+    blocks = range(start // streams.block_size, -(-stop // streams.block_size))
+    if op == 'decohere':
+        step, scale, size = args
+        arrays['phase'][start:stop] += streams.normal(STREAM_DECOHERENCE, step, size, scale, blocks=blocks)
+        return None
+    if op == 'observe':
+        step, probability, size = args
+        observed = arrays['observed'][start:stop]
+        hit = ~observed
+        if probability < 1.0:
+            hit &= streams.uniform(STREAM_OBSERVATION, step, size, blocks=blocks) < probability
+        observed |= hit
+        return int(np.count_nonzero(hit))
+    if op == 'reduce':
+        phase = arrays['phase'][start:stop]
+        return (
+            complex(np.sum(np.exp(1j * phase))),
+            float(np.sum(np.abs(arrays['freq'][start:stop]))),
+            float(np.sum(np.abs(phase))),
+            int(np.count_nonzero(arrays['observed'][start:stop])),
+        )
+    if op == 'render':
+        t, out = args
+        freq = arrays['freq'][start:stop]
+        phase = arrays['phase'][start:stop]
+        amp = np.where(arrays['observed'][start:stop], 1.0, 0.1)
+        out[:] = 0.0
+        chunk = max(1, RENDER_CHUNK_ELEMENTS // max(1, t.size))
+        for lo in range(0, len(freq), chunk):
+            hi = lo + chunk
+            out += amp[lo:hi] @ np.sin(2 * np.pi * np.outer(freq[lo:hi], t) + phase[lo:hi, None])
+        return None
+    raise ValueError(f"Unknown shard operation '{op}'")
+
+
+def _worker_op(op: str, start: int, stop: int, *args):
+    arrays, streams = _WORKER['arrays'], _WORKER['streams']
+    if op != 'render':
+        return _shard_op(arrays, streams, op, start, stop, *args)
+    (t_name, t_size), (out_name, row, rows) = args
+    t_block, t = _attach(t_name, np.float64, (t_size,))
+    out_block, out = _attach(out_name, np.float64, (rows, t_size))
+    try:
+        _shard_op(arrays, streams, op, start, stop, t, out[row])
+    finally:
+        del t, out
+        t_block.close()
+        out_block.close()
+
+
+class ShardedSymphony:
+    """
+    Flat particle population sharded across worker processes.
+
+    Args:
+        freq: Particle frequencies (N,)
+        phase: Initial phases (N,), default zeros
+        observed: Initial observed flags (N,), default False
+        workers: Worker processes (default os.cpu_count(); 1 computes in-process)
+        seed: Seed for the random streams (or pass streams)
+        streams: RandomStreams to draw from, e.g. a universe's
+        blocks_per_shard: Shard size in PARTICLE_BLOCK_SIZE blocks (default: one shard per worker)
+        active: Leading particles that decohere and get observed (default all);
+            the rest only count towards the reductions and rendering
+    """
+
+    def __init__(
+        self,
+        freq,
+        phase=None,
+        observed=None,
+        workers: Optional[int] = None,
+        seed=None,
+        streams: Optional[RandomStreams] = None,
+        blocks_per_shard: Optional[int] = None,
+        active: Optional[int] = None,
+    ):
+        freq = np.asarray(freq, dtype=np.float64)
+        size = len(freq)
+        self.active = size if active is None else min(size, int(active))
+        self.streams = streams if streams is not None else RandomStreams(seed)
+        self.workers = max(1, os.cpu_count() or 1) if workers is None else max(1, int(workers))
+        self.omega_time = 0.0
+        self._decoherence_step = 0
+        self._observation_step = 0
+
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self._arrays: Dict[str, np.ndarray] = {}
+        initial = {
+            'freq': freq,
+            'phase': np.zeros(size) if phase is None else phase,
+            'observed': np.zeros(size, dtype=bool) if observed is None else observed,
+        }
+        for column, dtype in SHARED_COLUMNS.items():
+            block = shared_memory.SharedMemory(create=True, size=max(1, size * np.dtype(dtype).itemsize))
+            self._blocks.append(block)
+            self._arrays[column] = np.ndarray((size,), dtype=dtype, buffer=block.buf)
+            self._arrays[column][:] = initial[column]
+
+        block_size = self.streams.block_size
+        blocks = self.streams.block_count(size)
+        per_shard = blocks_per_shard or max(1, -(-blocks // self.workers))
+        self.shards = [
+            (start * block_size, min(size, (start + per_shard) * block_size))
+            for start in range(0, blocks, per_shard)
+        ]
+
+        self._pool = None
+        if self.workers > 1 and len(self.shards) > 1:
+            specs = {
+                column: (block.name, np.dtype(dtype).str, size)
+                for (column, dtype), block in zip(SHARED_COLUMNS.items(), self._blocks)
+            }
+            self._pool = ProcessPoolExecutor(
+                max_workers=min(self.workers, len(self.shards)),
+                initializer=_attach_worker,
+                initargs=(specs, self.streams.state_dict()),
+            )
+
+    @classmethod
+    def from_universe(cls, universe: UniversalSymphony, workers: Optional[int] = None, **options) -> 'ShardedSymphony':
+        """
+        Shard a universe's live particles, nested universes flattened in after
+        the root's. Only the root's particles are `active`, as in the serial
+        universe, and their draws continue its decoherence and observation streams.
+        """
+        universes, pending = [], [universe]
+        while pending:
+            current = pending.pop(0)
+            universes.append(current)
+            pending.extend(current.children)
+        columns = {
+            name: np.concatenate([member._view(name) for member in universes])
+            for name in SHARED_COLUMNS
+        }
+        sharded = cls(
+            workers=workers,
+            streams=universe.streams,
+            active=universe.columns.live_count,
+            **columns,
+            **options,
+        )
+        sharded.omega_time = universe.omega_time
+        sharded._decoherence_step = universe._decoherence_step
+        sharded._observation_step = universe._observation_step
+        return sharded
+
+    def __len__(self) -> int:
+        return len(self._arrays['phase'])
+
+    def __enter__(self) -> 'ShardedSymphony':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Stop the workers and release the shared memory."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self._arrays = {}
+        for block in self._blocks:
+            try:
+                block.close()
+            except BufferError:
+                pass  # a caller still holds a column view; the mapping goes when it does
+            block.unlink()
+        self._blocks = []
+
+    @property
+    def freq(self) -> np.ndarray:
+        return self._arrays['freq']
+
+    @property
+    def phase(self) -> np.ndarray:
+        return self._arrays['phase']
+
+    @property
+    def observed(self) -> np.ndarray:
+        return self._arrays['observed']
+
+    def _map(self, op: str, *args, shards=None) -> list:
+        """Run op on every shard and return the per-shard results in shard order."""
+        shards = self.shards if shards is None else shards
+        if self._pool is None:
+            return [_shard_op(self._arrays, self.streams, op, start, stop, *args) for start, stop in shards]
+        futures = [self._pool.submit(_worker_op, op, start, stop, *args) for start, stop in shards]
+        return [future.result() for future in futures]
+
+    def _active_shards(self) -> List[Tuple[int, int]]:
+        """Shard bounds clipped to the active particles."""
+        return [(start, min(stop, self.active)) for start, stop in self.shards if start < self.active]
+
+    def _reduce(self):
+        phasor, abs_freq, abs_phase, observed = 0j, 0.0, 0.0, 0
+        for shard in self._map('reduce'):
+            phasor += shard[0]
+            abs_freq += shard[1]
+            abs_phase += shard[2]
+            observed += shard[3]
+        return phasor, abs_freq, abs_phase, observed
+
+    def apply_decoherence(self, entropy_factor: float = 0.001):
+        """Phase drift on every active particle (same draws as UniversalSymphony.apply_decoherence)."""
+        if self.active:
+            self._map('decohere', self._decoherence_step, entropy_factor, self.active, shards=self._active_shards())
+            self._decoherence_step += 1
+
+    def observe_all(self, probability: float = 1.0) -> int:
+        """Observe each pending active particle with the given probability; returns how many collapsed."""
+        if self.active == 0 or probability <= 0:
+            return 0
+        probability = min(1.0, probability)
+        count = sum(self._map('observe', self._observation_step, probability, self.active, shards=self._active_shards()))
+        if probability < 1.0:
+            self._observation_step += 1
+        return count
+
+    def lock_phase(self, indices, phase: float):
+        """Set the selected particles' phase and mark them observed (done in place by the parent)."""
+        indices = np.asarray(indices, dtype=np.int64)
+        self.phase[indices] = phase
+        self.observed[indices] = True
+
+    def get_coherence(self) -> float:
+        if len(self) == 0:
+            return 1.0
+        return abs(self._reduce()[0]) / len(self)
+
+    def get_observed_count(self) -> int:
+        return self._reduce()[3]
+
+    @property
+    def emergent_time(self) -> float:
+        """Mean absolute phase."""
+        return self._reduce()[2] / len(self) if len(self) else 0.0
+
+    def tick(self, dt: float = 1.0):
+        self.omega_time += self._reduce()[1] * dt
+
+    def get_omega_time(self) -> float:
+        return self.omega_time
+
+    def render_reality(self, t: np.ndarray) -> np.ndarray:
+        """Interference pattern of all particles, rendered shard by shard and summed."""
+        t = np.asarray(t, dtype=float)
+        flat_t = np.ascontiguousarray(t.reshape(-1))
+        if len(self) == 0:
+            return np.zeros_like(t)
+        if self._pool is None:
+            field = np.zeros_like(flat_t)
+            partial = np.empty_like(flat_t)
+            for start, stop in self.shards:
+                _shard_op(self._arrays, self.streams, 'render', start, stop, flat_t, partial)
+                field += partial
+            return field.reshape(t.shape)
+
+        rows = len(self.shards)
+        t_block = shared_memory.SharedMemory(create=True, size=max(1, flat_t.nbytes))
+        out_block = shared_memory.SharedMemory(create=True, size=max(1, rows * flat_t.nbytes))
+        try:
+            np.ndarray(flat_t.shape, dtype=np.float64, buffer=t_block.buf)[:] = flat_t
+            futures = [
+                self._pool.submit(_worker_op, 'render', start, stop, (t_block.name, flat_t.size), (out_block.name, row, rows))
+                for row, (start, stop) in enumerate(self.shards)
+            ]
+            for future in futures:
+                future.result()
+            out = np.ndarray((rows, flat_t.size), dtype=np.float64, buffer=out_block.buf)
+            field = out.sum(axis=0)
+            del out
+        finally:
+            for block in (t_block, out_block):
+                block.close()
+                block.unlink()
+        return field.reshape(t.shape)
+
+    def to_universe(self) -> UniversalSymphony:
+        """
+        Copy the sharded particles back into an ordinary (flat) UniversalSymphony.
+        The copy continues this symphony's random streams, and the particles'
+        superpositions come from its universe stream rather than global state.
+        """
+        universe = UniversalSymphony()
+        universe.streams.load_state_dict(self.streams.state_dict())
+        universe._decoherence_step = self._decoherence_step
+        universe._observation_step = self._observation_step
+        rng = universe.streams.universe
+        particles = [QuantumParticle(frequency=float(freq), depth=0, rng=rng) for freq in self.freq]
+        for particle, phase, observed in zip(particles, self.phase, self.observed):
+            particle.phase = float(phase)
+            particle.is_observed = bool(observed)
+        universe.add_all(particles)
+        universe.omega_time = self.omega_time
+        return universe
@@ -30,13 +30,18 @@ Date: February 4, 2026
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Dict
+from functools import partial
+from typing import List, Dict, Optional, Tuple
 
 import json
 import numpy as np
 import matplotlib.pyplot as plt
 
-from unity_script import Consciousness, QuantumParticle, UniversalSymphony
+from coherence_metrics import pairwise_wrapped_coherence
+from experiment_runner import ScenarioSpec, ScenarioStep, run_scenario
+from history_recorder import HistoryRecorder, history_column
+from observer_schedule import Drift, stack
+from unity_script import QuantumParticle, UniversalSymphony
 
 
 @dataclass
@@ -52,120 +57,100 @@ class SharedObservationMetrics:
 
 
 class SharedObservationMonitor:
-    def __init__(self, universe: UniversalSymphony, waves: List[QuantumParticle]):
+    system_coherence_history = history_column('system_coherence')
+    cross_coherence_history = history_column('cross_coherence')
+    observer_alignment_history = history_column('observer_alignment')
+    objective_reality_history = history_column('objective_reality')
+    individual_coherence_history = history_column('individual_coherence', transpose=True)
+
+    def __init__(self, universe: UniversalSymphony, waves: List[QuantumParticle], capacity: Optional[int] = None):
         self.universe = universe
         self.waves = waves
 
-        self.system_coherence_history: List[float] = []
-        self.cross_coherence_history: List[float] = []
-        self.observer_alignment_history: List[float] = []
-        self.objective_reality_history: List[float] = []
-        self.individual_coherence_history: List[List[float]] = [[] for _ in waves]
-
-    @staticmethod
-    def _pairwise_cross_coherence(phases: List[float]) -> float:
-        if len(phases) < 2:
-            return 1.0
-        pair_values = []
-        for i in range(len(phases)):
-            for j in range(i + 1, len(phases)):
-                phase_diff = abs(phases[i] - phases[j])
-                pair_values.append(1.0 - (phase_diff % (2 * np.pi)) / (2 * np.pi))
-        return float(np.mean(pair_values)) if pair_values else 1.0
+        self.history = HistoryRecorder(
+            {
+                'system_coherence': np.float64,
+                'cross_coherence': np.float64,
+                'observer_alignment': np.float64,
+                'objective_reality': np.float64,
+                'individual_coherence': (np.float64, (len(waves),)),
+            },
+            capacity=capacity,
+        )
 
     def record(self, observer_alignment: float):
-        for idx, wave in enumerate(self.waves):
-            phase_diff = abs(wave.phase)
-            coherence = max(0.0, 1.0 - phase_diff / (2 * np.pi))
-            self.individual_coherence_history[idx].append(coherence)
+        phases = np.array([w.phase for w in self.waves])
+        individual = np.maximum(0.0, 1.0 - np.abs(phases) / (2 * np.pi))
 
         system_coherence = self.universe.get_coherence()
-        phases = [w.phase for w in self.waves]
-        cross_coherence = self._pairwise_cross_coherence(phases)
-
-        self.system_coherence_history.append(system_coherence)
-        self.cross_coherence_history.append(cross_coherence)
-        self.observer_alignment_history.append(observer_alignment)
+        cross_coherence = pairwise_wrapped_coherence(phases)
 
         objective_reality = (system_coherence + cross_coherence + observer_alignment) / 3.0
-        self.objective_reality_history.append(objective_reality)
+        self.history.record(
+            system_coherence=system_coherence,
+            cross_coherence=cross_coherence,
+            observer_alignment=observer_alignment,
+            objective_reality=objective_reality,
+            individual_coherence=individual,
+        )
 
     def final_metrics(self) -> SharedObservationMetrics:
-        individual_final = [history[-1] if history else 0.0 for history in self.individual_coherence_history]
+        history = self.history
+        individual_final = history.last('individual_coherence', default=np.zeros(len(self.waves))).tolist()
         return SharedObservationMetrics(
-            system_coherence_final=float(self.system_coherence_history[-1]) if self.system_coherence_history else 0.0,
-            system_coherence_avg=float(np.mean(self.system_coherence_history)) if self.system_coherence_history else 0.0,
-            cross_coherence_avg=float(np.mean(self.cross_coherence_history)) if self.cross_coherence_history else 0.0,
-            cross_coherence_peak=float(np.max(self.cross_coherence_history)) if self.cross_coherence_history else 0.0,
-            observer_alignment_avg=float(np.mean(self.observer_alignment_history)) if self.observer_alignment_history else 0.0,
-            observer_alignment_final=float(self.observer_alignment_history[-1]) if self.observer_alignment_history else 0.0,
-            objective_reality_index=float(np.mean(self.objective_reality_history)) if self.objective_reality_history else 0.0,
+            system_coherence_final=history.last('system_coherence'),
+            system_coherence_avg=history.mean('system_coherence'),
+            cross_coherence_avg=history.mean('cross_coherence'),
+            cross_coherence_peak=history.max('cross_coherence'),
+            observer_alignment_avg=history.mean('observer_alignment'),
+            observer_alignment_final=history.last('observer_alignment'),
+            objective_reality_index=history.mean('objective_reality'),
             individual_final=individual_final,
         )
 
 
-def _create_universe() -> UniversalSymphony:
-    universe = UniversalSymphony()
-    for freq in [1.0, 2.0, 3.0, 4.0]:
-        particle = QuantumParticle(frequency=freq, depth=0)
-        particle.observe()
-        universe.add(particle)
-    return universe
-
-
-def _inject_triad(universe: UniversalSymphony) -> List[QuantumParticle]:
-    observer = Consciousness(frequency=7.83)
-    freqs = [8.0, 10.0, 12.0]
-    waves = []
-    for freq in freqs:
-        wave = observer.inject_frequency(
-            symphony=universe,
-            frequency=freq,
-            amplitude=1.0,
-            phase=0.0,
-            auto_observe=True,
-        )
-        waves.append(wave)
-    return waves
+# Simulate observer tuning intents (slight offsets) and convergence
+_observer_phases = stack(0.0, Drift(0.05, 10.0))
 
 
-def run_shared_observation(iterations: int = 500) -> SharedObservationMonitor:
-    print("\n" + "=" * 70)
-    print("TEST: SHARED OBSERVATION (Two Observers, One Triad)")
-    print("=" * 70)
+def _joint_consensus(phases: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Joint locking: average both observers' target phases
+    alignment = 1.0 - np.minimum(1.0, np.abs(phases[:, 0] - phases[:, 1]) / (2 * np.pi))
+    return np.mean(phases, axis=1), alignment
 
-    universe = _create_universe()
-    waves = _inject_triad(universe)
 
-    observer_a = Consciousness(frequency=7.83)
-    observer_b = Consciousness(frequency=7.83)
+def _record(monitor: SharedObservationMonitor, step: ScenarioStep):
+    monitor.record(observer_alignment=step.alignment)
 
-    monitor = SharedObservationMonitor(universe, waves)
 
-    for iteration in range(iterations):
-        universe.apply_decoherence(entropy_factor=0.002)
+def _progress(monitor: SharedObservationMonitor, step: ScenarioStep) -> str:
+    return (
+        f"  Iteration {step.iteration + 1:4d}: System={monitor.system_coherence_history[-1]:.4f}, "
+        f"Cross={monitor.cross_coherence_history[-1]:.4f}, Align={step.alignment:.4f}"
+    )
 
-        # Simulate observer tuning intents (slight offsets) and convergence
-        observer_a_phase = 0.0
-        observer_b_phase = 0.05 * np.sin(iteration / 10.0)
-        alignment = 1.0 - min(1.0, abs(observer_a_phase - observer_b_phase) / (2 * np.pi))
 
-        if iteration % 5 == 0:
-            # Joint locking: average both observers' target phases
-            target_phase = (observer_a_phase + observer_b_phase) / 2.0
-            for wave in waves:
-                wave.phase = target_phase
-                wave.observe()
+def shared_observation_scenario(iterations: int = 500, seed=None) -> ScenarioSpec:
+    """Two observers jointly locking one triad every 5 iterations."""
+    return ScenarioSpec(
+        name="shared_observation",
+        iterations=iterations,
+        monitor=partial(SharedObservationMonitor, capacity=iterations),
+        record=_record,
+        observer_phases=_observer_phases,
+        consensus=_joint_consensus,
+        lock_every=5,
+        progress=_progress,
+        seed=seed,
+    )
 
-        monitor.record(observer_alignment=alignment)
 
-        if (iteration + 1) % 100 == 0:
-            print(
-                f"  Iteration {iteration + 1:4d}: System={monitor.system_coherence_history[-1]:.4f}, "
-                f"Cross={monitor.cross_coherence_history[-1]:.4f}, Align={alignment:.4f}"
-            )
+def run_shared_observation(iterations: int = 500) -> SharedObservationMonitor:
+    print("\n" + "=" * 70)
+    print("TEST: SHARED OBSERVATION (Two Observers, One Triad)")
+    print("=" * 70)
 
-    return monitor
+    return run_scenario(shared_observation_scenario(iterations)).monitor
 
 
 def visualize_results(monitor: SharedObservationMonitor):
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Universe Snapshots
+
+A versioned binary format for persisting a UniversalSymphony:
+
+    magic     8 bytes   b"OMEGASNP"
+    length    8 bytes   little-endian uint64, JSON header size
+    header    JSON      format version, scalars (Omega Time, clock, random
+                        stream positions) and, per universe, the dtype and
+                        byte offset of every particle column
+    padding             to a 64-byte boundary
+    columns             raw little-endian column arrays, each 64-byte aligned
+
+Only live particles are written (tombstones are squeezed out; stable ids are
+kept). Nested universes follow their parent in the same file.
+
+Opening a snapshot maps the columns with np.memmap instead of reading them,
+and load_snapshot builds a universe directly on those maps (copy-on-write)
+without constructing particle objects; handles appear only when a particle
+is looked up. Very large universes therefore open instantly, and
+Snapshot.compare measures two snapshots chunk by chunk without loading
+either into RAM.
+"""
+
+import json
+import os
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from unity_script import ParticleColumns, SimulationClock, UniversalSymphony
+
+SNAPSHOT_MAGIC = b"OMEGASNP"
+SNAPSHOT_VERSION = 1
+ALIGNMENT = 64
+CHUNK_SIZE = 1 << 20  # particles per pass in chunked reductions
+
+_PREFIX = struct.Struct("<8sQ")
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _describe(universe: UniversalSymphony, offset: int, columns: List[np.ndarray]) -> Tuple[Dict[str, Any], int]:
+    """Header node for one universe; appends its column arrays and returns the next free offset."""
+    count = universe.columns.live_count
+    node = {
+        "size": count,
+        "next_id": universe.columns.next_id,
+        "omega_time": universe.omega_time,
+        "clock": universe.clock.now() if isinstance(universe.clock, SimulationClock) else None,
+        "decoherence_step": universe._decoherence_step,
+        "observation_step": universe._observation_step,
+        "streams": universe.streams.state_dict(),
+        "columns": {},
+        "children": [],
+    }
+    for name, dtype in ParticleColumns.DTYPES.items():
+        values = np.ascontiguousarray(universe._view(name), dtype=np.dtype(dtype).newbyteorder("<"))
+        node["columns"][name] = {"dtype": values.dtype.str, "offset": offset}
+        columns.append(values)
+        offset = _aligned(offset + values.nbytes)
+    for child in universe.children:
+        child_node, offset = _describe(child, offset, columns)
+        child_node["shared_clock"] = child.clock is universe.clock
+        node["children"].append(child_node)
+    return node, offset
+
+
+def save_snapshot(universe: UniversalSymphony, path: str) -> str:
+    """Write universe (and its nested universes) to path atomically."""
+    columns: List[np.ndarray] = []
+    root, _ = _describe(universe, 0, columns)
+    header = json.dumps({"format": "omega-snapshot", "version": SNAPSHOT_VERSION, "universe": root}).encode()
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    partial = path + ".partial"
+    with open(partial, "wb") as handle:
+        handle.write(_PREFIX.pack(SNAPSHOT_MAGIC, len(header)))
+        handle.write(header)
+        position = _PREFIX.size + len(header)
+        for values in columns:
+            handle.write(b"\0" * (_aligned(position) - position))
+            position = _aligned(position)
+            values.tofile(handle)
+            position += values.nbytes
+        handle.write(b"\0" * (_aligned(position) - position))
+    os.replace(partial, path)
+    return path
+
+
+def read_header(path: str) -> Dict[str, Any]:
+    """Parsed JSON header (plus 'data_start') of a snapshot file."""
+    with open(path, "rb") as handle:
+        magic, length = _PREFIX.unpack(handle.read(_PREFIX.size))
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not an Omega snapshot")
+        header = json.loads(handle.read(length))
+    if header["version"] > SNAPSHOT_VERSION:
+        raise ValueError(f"Snapshot version {header['version']} is newer than supported ({SNAPSHOT_VERSION})")
+    header["data_start"] = _aligned(_PREFIX.size + length)
+    return header
+
+
+class Snapshot:
+    """
+    Read-only, memory-mapped view of a snapshot file (or of one nested
+    universe in it). Columns are np.memmap arrays over live particles.
+    """
+
+    def __init__(self, path: str, _header: Optional[Dict[str, Any]] = None, _node: Optional[Dict[str, Any]] = None):
+        self.path = path
+        self.header = _header if _header is not None else read_header(path)
+        self.node = _node if _node is not None else self.header["universe"]
+        self._maps: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self.node["size"]
+
+    @property
+    def version(self) -> int:
+        return self.header["version"]
+
+    @property
+    def omega_time(self) -> float:
+        return self.node["omega_time"]
+
+    @property
+    def children(self) -> List["Snapshot"]:
+        return [Snapshot(self.path, self.header, child) for child in self.node["children"]]
+
+    def column(self, name: str, mode: str = "r") -> np.ndarray:
+        """Memory-mapped column (mode 'r' read-only, 'c' copy-on-write)."""
+        if mode == "r" and name in self._maps:
+            return self._maps[name]
+        spec = self.node["columns"][name]
+        dtype = np.dtype(spec["dtype"])
+        if len(self) == 0:
+            return np.empty(0, dtype=dtype)
+        values = np.memmap(self.path, dtype=dtype, mode=mode, offset=self.header["data_start"] + spec["offset"], shape=(len(self),))
+        if mode == "r":
+            self._maps[name] = values
+        return values
+
+    def _chunks(self, *names: str):
+        columns = [self.column(name) for name in names]
+        for start in range(0, len(self), CHUNK_SIZE):
+            yield [values[start:start + CHUNK_SIZE] for values in columns]
+
+    def coherence(self) -> float:
+        """Phase coherence of this universe's own particles, computed chunk by chunk."""
+        if len(self) == 0:
+            return 1.0
+        total = sum(np.sum(np.exp(1j * phase)) for phase, in self._chunks("phase"))
+        return float(np.abs(total / len(self)))
+
+    def observed_ratio(self) -> float:
+        if len(self) == 0:
+            return 0.0
+        return sum(int(np.count_nonzero(observed)) for observed, in self._chunks("observed")) / len(self)
+
+    def frequencies(self, decimals: int = 2) -> np.ndarray:
+        """Distinct frequencies, rounded."""
+        distinct = [np.unique(np.round(freq, decimals)) for freq, in self._chunks("freq")]
+        return np.unique(np.concatenate(distinct)) if distinct else np.empty(0)
+
+    def compare(self, other: "Snapshot") -> Dict[str, Any]:
+        """
+        Topological distance to another snapshot (same measures as
+        harmonic_memory_test.compute_topological_distance), streamed in chunks.
+        """
+        if len(self) == len(other):
+            squared = 0.0
+            for (phase_a,), (phase_b,) in zip(self._chunks("phase"), other._chunks("phase")):
+                squared += float(np.sum((phase_a % (2 * np.pi) - phase_b % (2 * np.pi)) ** 2))
+            phase_delta = float(np.sqrt(squared))
+        else:
+            phase_delta = float("inf")
+        freq_a, freq_b = set(self.frequencies().tolist()), set(other.frequencies().tolist())
+        return {
+            "phase_delta": phase_delta,
+            "ratio_delta": abs(self.observed_ratio() - other.observed_ratio()),
+            "new_frequencies": freq_b - freq_a,
+            "lost_frequencies": freq_a - freq_b,
+            "coherence_a": self.coherence(),
+            "coherence_b": other.coherence(),
+        }
+
+    def load(self, clock: Optional[SimulationClock] = None) -> UniversalSymphony:
+        """
+        Universe backed by copy-on-write maps of the columns: nothing is read
+        until touched, edits stay in memory and the file is never modified.
+        """
+        node = self.node
+        if clock is None:
+            clock = SimulationClock(node["clock"] or 0.0)
+        universe = UniversalSymphony(clock=clock)
+        columns = universe.columns
+        for name, dtype in ParticleColumns.DTYPES.items():
+            values = self.column(name, mode="c") if len(self) else np.empty(1, dtype=dtype)
+            columns.data[name] = values
+        columns.size = len(self)
+        columns.next_id = node["next_id"]
+        columns.tombstones = 0
+        columns.touch()
+        universe._entities = None
+        universe.streams.load_state_dict(node["streams"])
+        universe.omega_time = node["omega_time"]
+        universe._decoherence_step = node["decoherence_step"]
+        universe._observation_step = node["observation_step"]
+        for child in self.children:
+            universe.add_child(child.load(clock if child.node["shared_clock"] else None))
+        return universe
+
+
+def open_snapshot(path: str) -> Snapshot:
+    return Snapshot(path)
+
+
+def load_snapshot(path: str) -> UniversalSymphony:
+    """Open a snapshot as a live UniversalSymphony (zero-copy, copy-on-write)."""
+    return Snapshot(path).load()
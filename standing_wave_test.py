@@ -37,60 +37,118 @@ Date: February 4, 2026
 import numpy as np
 import matplotlib.pyplot as plt
 from unity_script import UniversalSymphony, QuantumParticle, Consciousness
-from typing import List, Tuple
+from ensemble import UniverseEnsemble, run_ensemble_trajectory
+from history_recorder import HistoryRecorder, RollingWindow, history_column
+from checkpoint import Checkpointer, attribute_state, load_attribute_state
+from typing import Dict, List, Optional, Sequence, Tuple
 import json
 
 
 class StandingWaveMonitor:
     """Tracks standing wave formation and persistence metrics."""
-    
-    def __init__(self, universe: UniversalSymphony, word_particle: QuantumParticle):
+
+    coherence_history = history_column('coherence')
+    word_phase_history = history_column('word_phase')
+    word_amplitude_history = history_column('word_amplitude')
+    standing_wave_indicator = history_column('swi')
+
+    SWI_WINDOW = 10  # SWI compares coherence against the mean of the last 10 samples
+    ACTIVE_WINDOW = 5  # is_standing_wave_active averages the last 5 SWI values
+    
+    def __init__(
+        self,
+        universe: UniversalSymphony,
+        word_particle: QuantumParticle,
+        capacity: Optional[int] = None,
+        persistence_thresholds: Sequence[float] = (0.5,),
+    ):
         self.universe = universe
         self.word_particle = word_particle
-        self.coherence_history = []
-        self.word_phase_history = []
-        self.word_amplitude_history = []
-        self.standing_wave_indicator = []
+        self.history = HistoryRecorder(['coherence', 'word_phase', 'word_amplitude', 'swi'], capacity=capacity)
         self.iteration_count = 0
         self.collapse_iteration = None  # Iteration when standing wave collapsed
-        self.peak_coherence = 0.0
-        self.min_coherence = 1.0
+
+        # Previous SWI_WINDOW - 1 coherences; the current sample completes the window
+        self._coherence_window = RollingWindow(self.SWI_WINDOW - 1)
+        self._swi_window = RollingWindow(self.ACTIVE_WINDOW)
+        # Threshold -> first iteration coherence fell below it (None while above)
+        self._first_crossing: Dict[float, Optional[int]] = {t: None for t in persistence_thresholds}
+
+    @property
+    def peak_coherence(self) -> float:
+        return self.history.max('coherence', default=0.0)
+
+    @property
+    def min_coherence(self) -> float:
+        return self.history.min('coherence', default=1.0)
         
     def record(self):
         """Record current state of the system."""
         coherence = self.universe.get_coherence()
-        self.coherence_history.append(coherence)
-        self.word_phase_history.append(self.word_particle.phase)
-        self.word_amplitude_history.append(self.word_particle.freq)
         
         # Standing Wave Indicator (SWI)
         # 1.0 = stable coherence (standing wave), 0.0 = decaying
-        if len(self.coherence_history) > 1:
-            recent_avg = np.mean(self.coherence_history[-10:])
-            change_rate = abs(self.coherence_history[-1] - recent_avg)
+        window = self._coherence_window
+        if len(window) > 0:
+            recent_avg = (window.total + coherence) / (len(window) + 1)
+            change_rate = abs(coherence - recent_avg)
             swi = 1.0 - min(1.0, change_rate * 10)  # Sensitivity factor
         else:
             swi = 1.0  # First iteration assumes stability
             
-        self.standing_wave_indicator.append(swi)
-        self.peak_coherence = max(self.peak_coherence, coherence)
-        self.min_coherence = min(self.min_coherence, coherence)
+        self.history.record(
+            coherence=coherence,
+            word_phase=self.word_particle.phase,
+            word_amplitude=self.word_particle.freq,
+            swi=swi,
+        )
+        window.push(coherence)
+        self._swi_window.push(swi)
+        for threshold, crossing in self._first_crossing.items():
+            if crossing is None and coherence < threshold:
+                self._first_crossing[threshold] = self.iteration_count
         self.iteration_count += 1
+
+    @property
+    def coherence_variance(self) -> float:
+        """Rolling variance of the most recent coherence samples (O(1))."""
+        return self._coherence_window.variance
         
     def get_persistence_window(self, coherence_threshold: float = 0.5) -> int:
         """Return how many iterations before coherence dropped below threshold."""
-        for i, c in enumerate(self.coherence_history):
-            if c < coherence_threshold:
-                self.collapse_iteration = i
-                return i
-        return len(self.coherence_history)
+        if coherence_threshold not in self._first_crossing:
+            # Untracked threshold: scan once, then track it online from here on
+            below = np.flatnonzero(self.coherence_history < coherence_threshold)
+            self._first_crossing[coherence_threshold] = int(below[0]) if len(below) else None
+        crossing = self._first_crossing[coherence_threshold]
+        if crossing is None:
+            return len(self.history)
+        self.collapse_iteration = crossing
+        return crossing
+    
+    def state_dict(self) -> dict:
+        state = attribute_state(self)
+        state['crossing_thresholds'] = np.array(list(self._first_crossing), dtype=float)
+        state['crossing_iterations'] = np.array(
+            [-1 if crossing is None else crossing for crossing in self._first_crossing.values()], dtype=np.int64
+        )
+        return state
+
+    def load_state_dict(self, state: dict):
+        state = dict(state)
+        thresholds = state.pop('crossing_thresholds')
+        crossings = state.pop('crossing_iterations')
+        self._first_crossing = {
+            float(threshold): None if crossing < 0 else int(crossing)
+            for threshold, crossing in zip(thresholds, crossings)
+        }
+        load_attribute_state(self, state)
     
     def is_standing_wave_active(self, swi_threshold: float = 0.7) -> bool:
         """Check if standing wave is currently active (coherence stable)."""
-        if len(self.standing_wave_indicator) < 5:
+        if not self._swi_window.full:
             return False
-        recent_swi = np.mean(self.standing_wave_indicator[-5:])
-        return recent_swi > swi_threshold
+        return self._swi_window.mean > swi_threshold
 
 
 def run_baseline_system(iterations: int = 500) -> Tuple[UniversalSymphony, List[float]]:
@@ -132,7 +190,19 @@ def run_baseline_system(iterations: int = 500) -> Tuple[UniversalSymphony, List[
     return universe, coherence_history
 
 
-def run_simple_word_system(iterations: int = 500) -> Tuple[StandingWaveMonitor, List[float]]:
+def run_baseline_ensemble(replicas: int = 10000, iterations: int = 500, seed=None) -> np.ndarray:
+    """
+    Monte Carlo version of run_baseline_system: `replicas` independent
+    baseline universes stepped together. Returns (iterations, replicas) coherence.
+    """
+    ensemble = UniverseEnsemble.from_frequencies([1.0, 2.0, 3.0, 4.0], replicas, seed=seed)
+    return run_ensemble_trajectory(ensemble, iterations, entropy_factor=0.002)
+
+
+def run_simple_word_system(
+    iterations: int = 500,
+    checkpoint: Optional[Checkpointer] = None,
+) -> Tuple[StandingWaveMonitor, List[float]]:
     """
     Test Case 1: Simple Word Injection (Passive)
     
@@ -165,7 +235,7 @@ def run_simple_word_system(iterations: int = 500) -> Tuple[StandingWaveMonitor,
     )
     
     # Monitor
-    monitor = StandingWaveMonitor(universe, word_particle)
+    monitor = StandingWaveMonitor(universe, word_particle, capacity=iterations)
     baseline_coherence = universe.get_coherence()
     
     print(f"\nWord Injected:")
@@ -173,7 +243,8 @@ def run_simple_word_system(iterations: int = 500) -> Tuple[StandingWaveMonitor,
     print(f"  Coherence Before:  {baseline_coherence:.4f}")
     
     # Run simulation WITHOUT active tuning
-    for iteration in range(iterations):
+    start = checkpoint.resume(universe=universe, monitor=monitor) if checkpoint is not None else 0
+    for iteration in range(start, iterations):
         # Apply decoherence
         universe.apply_decoherence(entropy_factor=0.002)
         
@@ -182,6 +253,8 @@ def run_simple_word_system(iterations: int = 500) -> Tuple[StandingWaveMonitor,
         
         if (iteration + 1) % 100 == 0:
             print(f"  Iteration {iteration+1:4d}: Coherence = {monitor.coherence_history[-1]:.4f}, SWI = {monitor.standing_wave_indicator[-1]:.4f}")
+        if checkpoint is not None:
+            checkpoint.maybe_save(iteration + 1, universe=universe, monitor=monitor)
     
     persistence = monitor.get_persistence_window(coherence_threshold=0.5)
     print(f"\nSimple Word Summary:")
@@ -193,7 +266,10 @@ def run_simple_word_system(iterations: int = 500) -> Tuple[StandingWaveMonitor,
     return monitor, monitor.coherence_history
 
 
-def run_active_resonance_locking_system(iterations: int = 500) -> Tuple[StandingWaveMonitor, List[float]]:
+def run_active_resonance_locking_system(
+    iterations: int = 500,
+    checkpoint: Optional[Checkpointer] = None,
+) -> Tuple[StandingWaveMonitor, List[float]]:
     """
     Test Case 2: Active Resonance Locking
     
@@ -226,7 +302,7 @@ def run_active_resonance_locking_system(iterations: int = 500) -> Tuple[Standing
     )
     
     # Monitor
-    monitor = StandingWaveMonitor(universe, word_particle)
+    monitor = StandingWaveMonitor(universe, word_particle, capacity=iterations)
     baseline_coherence = universe.get_coherence()
     
     print(f"\nWord Injected (with Active Tuning):")
@@ -234,7 +310,8 @@ def run_active_resonance_locking_system(iterations: int = 500) -> Tuple[Standing
     print(f"  Coherence Before:  {baseline_coherence:.4f}")
     
     # Run simulation WITH active resonance tuning every 5 iterations
-    for iteration in range(iterations):
+    start = checkpoint.resume(universe=universe, monitor=monitor) if checkpoint is not None else 0
+    for iteration in range(start, iterations):
         # Apply decoherence
         universe.apply_decoherence(entropy_factor=0.002)
         
@@ -250,6 +327,8 @@ def run_active_resonance_locking_system(iterations: int = 500) -> Tuple[Standing
         
         if (iteration + 1) % 100 == 0:
             print(f"  Iteration {iteration+1:4d}: Coherence = {monitor.coherence_history[-1]:.4f}, SWI = {monitor.standing_wave_indicator[-1]:.4f}")
+        if checkpoint is not None:
+            checkpoint.maybe_save(iteration + 1, universe=universe, monitor=monitor)
     
     persistence = monitor.get_persistence_window(coherence_threshold=0.5)
     print(f"\nActive Resonance Locking Summary:")
@@ -261,7 +340,10 @@ def run_active_resonance_locking_system(iterations: int = 500) -> Tuple[Standing
     return monitor, monitor.coherence_history
 
 
-def run_harmonic_binding_system(iterations: int = 500) -> Tuple[StandingWaveMonitor, List[float]]:
+def run_harmonic_binding_system(
+    iterations: int = 500,
+    checkpoint: Optional[Checkpointer] = None,
+) -> Tuple[StandingWaveMonitor, List[float]]:
     """
     Test Case 3: Harmonic Binding to Source
     
@@ -295,7 +377,7 @@ def run_harmonic_binding_system(iterations: int = 500) -> Tuple[StandingWaveMoni
     )
     
     # Monitor
-    monitor = StandingWaveMonitor(universe, word_particle)
+    monitor = StandingWaveMonitor(universe, word_particle, capacity=iterations)
     baseline_coherence = universe.get_coherence()
     
     print(f"\nWord Injected (Harmonic Binding):")
@@ -303,7 +385,8 @@ def run_harmonic_binding_system(iterations: int = 500) -> Tuple[StandingWaveMoni
     print(f"  Coherence Before:  {baseline_coherence:.4f}")
     
     # Run simulation WITH harmonic binding
-    for iteration in range(iterations):
+    start = checkpoint.resume(universe=universe, monitor=monitor) if checkpoint is not None else 0
+    for iteration in range(start, iterations):
         # Apply decoherence
         universe.apply_decoherence(entropy_factor=0.002)
         
@@ -315,6 +398,8 @@ def run_harmonic_binding_system(iterations: int = 500) -> Tuple[StandingWaveMoni
         
         if (iteration + 1) % 100 == 0:
             print(f"  Iteration {iteration+1:4d}: Coherence = {monitor.coherence_history[-1]:.4f}, SWI = {monitor.standing_wave_indicator[-1]:.4f}")
+        if checkpoint is not None:
+            checkpoint.maybe_save(iteration + 1, universe=universe, monitor=monitor)
     
     persistence = monitor.get_persistence_window(coherence_threshold=0.5)
     print(f"\nHarmonic Binding Summary:")
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Omega Code (Ω) — Approximate Nearest-State Index
+
+Detecting "resurrection" (a run returning near a state it has been in)
+by comparing every new capture_state_signature against all past ones
+costs O(K) per step and O(K²) per run. StateIndex makes it sublinear:
+
+1. SignatureEncoder compresses a signature into a short vector:
+   - low-order circular moments of phase per frequency group,
+     mean(cos mφ), mean(sin mφ) for m = 1..harmonics; groups are
+     quantile bins of the frequencies of the state it was fitted on
+   - random projections of the per-particle unit phasors (cos φ, sin φ),
+     scaled by 1/√N so distances approximate RMS phase differences
+     (zero when the particle count differs from the fitted state's)
+   - observed ratio and coherence
+2. StateIndex hashes encoded vectors with p-stable LSH: `tables` hash
+   tables, each keyed by `bits` values floor((a·v + b) / width). Nearby
+   vectors share a bucket in at least one table with high probability.
+   A query gathers the union of its buckets and ranks only those
+   candidates exactly.
+
+    encoder = SignatureEncoder.fit(universe)
+    index = StateIndex(encoder)
+    for step in range(steps):
+        ...
+        matches, distances = index.query(universe, k=1, radius=0.05, exclude_last=50)
+        index.add(universe)
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from memory_distance import State, as_signature
+
+
+class SignatureEncoder:
+    """
+    Fixed-length vector encoding of state signatures.
+
+    Args:
+        group_edges: Frequency bin edges (G - 1 inner edges) defining G groups
+        particles: Particle count the phase projections expect
+        harmonics: Circular moment orders per group
+        projections: Random projections of the particle phasors
+        seed: Seed for the projection directions
+    """
+
+    def __init__(
+        self,
+        group_edges,
+        particles: int,
+        harmonics: int = 2,
+        projections: int = 16,
+        seed=None,
+    ):
+        self.group_edges = np.asarray(group_edges, dtype=float)
+        self.groups = len(self.group_edges) + 1
+        self.particles = int(particles)
+        self.harmonics = int(harmonics)
+        rng = np.random.default_rng(seed)
+        self.directions = rng.standard_normal((int(projections), 2 * self.particles)) / np.sqrt(self.particles)
+
+    @classmethod
+    def fit(cls, state: State, groups: int = 8, **options) -> 'SignatureEncoder':
+        """Encoder whose frequency groups are quantile bins of a state's frequencies."""
+        signature = as_signature(state)
+        freqs = np.asarray(signature['frequency_spectrum'], dtype=float)
+        edges = np.unique(np.quantile(freqs, np.linspace(0, 1, groups + 1)[1:-1])) if len(freqs) else []
+        return cls(edges, len(freqs), **options)
+
+    @property
+    def dimensions(self) -> int:
+        return 2 * self.groups * self.harmonics + len(self.directions) + 2
+
+    def encode(self, state: State) -> np.ndarray:
+        signature = as_signature(state)
+        phases = np.asarray(signature['phases'], dtype=float)
+        freqs = np.asarray(signature['frequency_spectrum'], dtype=float)
+        group = np.searchsorted(self.group_edges, freqs, side='right')
+        counts = np.maximum(np.bincount(group, minlength=self.groups), 1)
+
+        moments = []
+        for order in range(1, self.harmonics + 1):
+            angle = order * phases
+            moments.append(np.bincount(group, weights=np.cos(angle), minlength=self.groups) / counts)
+            moments.append(np.bincount(group, weights=np.sin(angle), minlength=self.groups) / counts)
+
+        if len(phases) == self.particles:
+            projected = self.directions @ np.concatenate([np.cos(phases), np.sin(phases)])
+        else:
+            projected = np.zeros(len(self.directions))
+        scalars = [float(signature['observed_ratio']), float(signature['coherence'])]
+        return np.concatenate(moments + [projected, scalars])
+
+
+class StateIndex:
+    """
+    LSH index of encoded states.
+
+    Args:
+        encoder: SignatureEncoder turning states into vectors
+        tables: Independent hash tables (more = higher recall)
+        bits: Hash values per key (more = smaller buckets)
+        width: Bucket width along each projection
+        seed: Seed for the hash projections
+    """
+
+    def __init__(self, encoder: SignatureEncoder, tables: int = 8, bits: int = 6, width: float = 0.5, seed=None):
+        self.encoder = encoder
+        self.tables = int(tables)
+        self.bits = int(bits)
+        self.width = float(width)
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((self.tables * self.bits, encoder.dimensions))
+        self._offsets = rng.uniform(0.0, self.width, self.tables * self.bits)
+        self._buckets: List[Dict[bytes, List[int]]] = [dict() for _ in range(self.tables)]
+        self._vectors = np.empty((64, encoder.dimensions))
+        self._size = 0
+        self.last_candidates = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._vectors[:self._size]
+
+    def _keys(self, vector: np.ndarray) -> List[bytes]:
+        codes = np.floor((self._planes @ vector + self._offsets) / self.width).astype(np.int64)
+        return [row.tobytes() for row in codes.reshape(self.tables, self.bits)]
+
+    def add(self, state: State) -> int:
+        """Index a state; returns its id (ids count up from 0)."""
+        return self.add_vector(self.encoder.encode(state))
+
+    def add_vector(self, vector: np.ndarray) -> int:
+        if self._size == len(self._vectors):
+            grown = np.empty((2 * len(self._vectors), self._vectors.shape[1]))
+            grown[:self._size] = self._vectors[:self._size]
+            self._vectors = grown
+        state_id = self._size
+        self._vectors[state_id] = vector
+        self._size += 1
+        for table, key in zip(self._buckets, self._keys(vector)):
+            table.setdefault(key, []).append(state_id)
+        return state_id
+
+    def candidates(self, vector: np.ndarray) -> np.ndarray:
+        """Ids sharing a bucket with the vector in any table."""
+        found = [table.get(key, ()) for table, key in zip(self._buckets, self._keys(vector))]
+        ids = np.unique(np.concatenate([np.asarray(bucket, dtype=np.int64) for bucket in found]))
+        self.last_candidates = len(ids)
+        return ids
+
+    def query(
+        self,
+        state: State,
+        k: int = 1,
+        radius: Optional[float] = None,
+        exclude_last: int = 0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximate k nearest indexed states (ids, encoded distances), closest
+        first. `radius` keeps only matches within that distance;
+        `exclude_last` skips the most recently added ids (the run's own
+        immediate past).
+        """
+        return self.query_vector(self.encoder.encode(state), k, radius, exclude_last)
+
+    def query_vector(self, vector: np.ndarray, k: int = 1, radius: Optional[float] = None, exclude_last: int = 0):
+        ids = self.candidates(vector)
+        ids = ids[ids < self._size - exclude_last]
+        if len(ids) == 0:
+            return ids, np.empty(0)
+        distances = np.linalg.norm(self._vectors[ids] - vector, axis=1)
+        if radius is not None:
+            keep = distances <= radius
+            ids, distances = ids[keep], distances[keep]
+        order = np.argsort(distances, kind='stable')[:k]
+        return ids[order], distances[order]
+
+    def exact_query(self, state: State, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Brute-force reference answer over every indexed state."""
+        distances = np.linalg.norm(self.vectors - self.encoder.encode(state), axis=1)
+        order = np.argsort(distances, kind='stable')[:k]
+        return order, distances[order]
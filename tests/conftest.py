@@ -1,6 +1,19 @@
 import os
 import sys
 
+import pytest
+
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
+
+from result_cache import ResultCache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _isolated_result_cache(monkeypatch, tmp_path):
+    """Scripts' module-level result caches write to a per-test directory, not outputs/."""
+    cache = ResultCache(str(tmp_path / "result-cache"))
+    for module in list(sys.modules.values()):
+        if isinstance(getattr(module, "CACHE", None), ResultCache):
+            monkeypatch.setattr(module, "CACHE", cache)
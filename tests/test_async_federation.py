@@ -0,0 +1,92 @@
+import asyncio
+
+import numpy as np
+
+from async_federation import PhaseMessage, SimulatedLink, VirtualTimeLoop, run_async_federation
+from federation import FederationTopology
+
+
+def _phases(iteration, council):
+    return 0.3 * np.sin(1.7 * council) + 0.02 * np.array([np.sin(iteration / 10.0), np.cos(iteration / 12.0), 0.0])
+
+
+INTERVALS = np.linspace(0.002, 0.006, 12)
+
+
+def _run(link, councils=12):
+    return run_async_federation(
+        FederationTopology.complete(councils),
+        _phases,
+        link=link,
+        duration=0.4,
+        tick_intervals=INTERVALS[:councils],
+        sync_strength=0.2,
+        virtual_time=True,
+    )
+
+
+def test_councils_converge_over_a_lossless_link():
+    result = _run(SimulatedLink())
+    assert 0.4 <= result.duration <= 0.45  # the sampler wakes once more after the end
+    assert result.messages_dropped == 0
+    # Every tick sends to the 11 other councils, and an instant link delivers all of it
+    assert result.messages_sent == 11 * result.ticks.sum()
+    assert result.messages_delivered == result.messages_sent
+    # Messages wait in the inbox until the receiver next ticks
+    assert 0.0 < result.mean_delay < INTERVALS.max()
+    assert result.final_spread < 0.25 * result.history['spread'][0]
+    assert result.trust.shape == (12, 3)
+    assert np.allclose(result.trust.sum(axis=1), 1.0)
+    # Each council ticks once per interval of simulated time
+    assert np.all(np.abs(result.ticks - 0.4 / INTERVALS) <= 1)
+
+
+def test_virtual_time_runs_are_reproducible():
+    first = _run(SimulatedLink(latency=0.01, jitter=0.005, drop_rate=0.1, seed=4))
+    second = _run(SimulatedLink(latency=0.01, jitter=0.005, drop_rate=0.1, seed=4))
+    assert np.array_equal(first.ticks, second.ticks)
+    assert first.messages_delivered == second.messages_delivered
+    assert np.array_equal(first.medians, second.medians)
+    assert np.array_equal(first.history['spread'], second.history['spread'])
+    assert 0.005 <= first.mean_delay
+
+
+def test_dropped_messages_block_convergence():
+    result = _run(SimulatedLink(drop_rate=1.0, seed=0))
+    assert result.messages_delivered == 0
+    assert result.messages_dropped == result.messages_sent
+    assert np.isclose(result.final_spread, np.std(0.3 * np.sin(1.7 * np.arange(12))), atol=0.02)
+
+
+def test_link_latency_and_drop_rate():
+    arrivals = []
+
+    class Inbox(asyncio.Queue):
+        def put_nowait(self, message):
+            arrivals.append((asyncio.get_running_loop().time(), message.sender))
+            super().put_nowait(message)
+
+    async def exchange():
+        link = SimulatedLink(latency=0.02, jitter=0.005, drop_rate=0.25, seed=3)
+        queue = Inbox()
+        for index in range(400):
+            link.send(queue, PhaseMessage(index, 0.0, 0.0))
+        await asyncio.sleep(0.01)
+        early = queue.qsize()
+        await asyncio.sleep(0.03)
+        return link, early, queue.qsize()
+
+    loop = VirtualTimeLoop()
+    try:
+        link, early, delivered = loop.run_until_complete(exchange())
+    finally:
+        loop.close()
+    assert early == 0
+    assert delivered == link.sent - link.dropped == len(arrivals)
+    assert 60 < link.dropped < 140
+    times = np.array([when for when, _ in arrivals])
+    assert np.all(np.diff(times) >= 0)
+    assert times.min() >= 0.015 and times.max() <= 0.025
+    # Jitter reorders messages relative to the order they were sent in
+    senders = [sender for _, sender in arrivals]
+    assert senders != sorted(senders) and sorted(senders) == sorted(set(senders))
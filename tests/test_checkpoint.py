@@ -0,0 +1,103 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from checkpoint import Checkpointer, load_checkpoint, save_checkpoint
+from experiment_runner import run_scenario
+from standing_wave_test import run_simple_word_system
+from trust_weighted_council_test import council_scenario
+from unity_script import QuantumParticle, UniversalSymphony
+
+
+def _universe():
+    universe = UniversalSymphony(seed=21)
+    rng = universe.streams.universe
+    particles = [QuantumParticle(frequency=f, depth=0, rng=rng) for f in (1.0, 2.0, 3.0, 5.0, 8.0)]
+    particles[0].entangle_with(particles[3])
+    universe.add_all(particles)
+    universe.remove(particles[1])
+    child = universe.spawn_child()
+    child.add_all([QuantumParticle(frequency=f, depth=1, rng=child.streams.universe) for f in (13.0, 21.0)])
+    return universe
+
+
+def _step(universe):
+    universe.apply_decoherence(0.01)
+    universe.observe(probability=0.3)
+    universe.children[0].apply_decoherence(0.02)
+    universe.add(QuantumParticle(frequency=float(universe.streams.universe.uniform(1, 9)), rng=universe.streams.universe))
+    universe.tick(0.5)
+
+
+def test_universe_resumes_bit_exactly(tmp_path):
+    reference = _universe()
+    for _ in range(10):
+        _step(reference)
+
+    interrupted = _universe()
+    for _ in range(4):
+        _step(interrupted)
+    path = save_checkpoint(str(tmp_path / "u.npz"), iteration=4, universe=interrupted)
+
+    resumed = UniversalSymphony()
+    assert load_checkpoint(path, universe=resumed)["iteration"] == 4
+    assert resumed.entities[0]._entangled_with is resumed.entities[2]
+    for _ in range(6):
+        _step(resumed)
+
+    for name in reference.columns.DTYPES:
+        assert np.array_equal(reference.columns.column(name), resumed.columns.column(name), equal_nan=name != 'id')
+    child, resumed_child = reference.children[0], resumed.children[0]
+    assert np.array_equal(child._view('phase'), resumed_child._view('phase'))
+    assert resumed_child.clock is resumed.clock
+    assert resumed.omega_time == reference.omega_time
+    assert resumed.clock.now() == reference.clock.now()
+    assert resumed.get_coherence() == reference.get_coherence()
+
+
+def test_restore_keeps_existing_handles(tmp_path):
+    universe = _universe()
+    kept = universe.entities[1]
+    for _ in range(3):
+        _step(universe)
+    phase = kept.phase
+    path = save_checkpoint(str(tmp_path / "u.npz"), universe=universe)
+    for _ in range(3):
+        _step(universe)
+
+    load_checkpoint(path, universe=universe)
+    assert kept.phase == phase
+    assert universe.particle(kept.particle_id) is kept
+
+
+def test_scenario_survives_a_crash(tmp_path):
+    reference = run_scenario(council_scenario(iterations=60, trust_weighted=True, seed=4))
+    crashing = council_scenario(iterations=60, trust_weighted=True, seed=4)
+
+    def crash(monitor, step):
+        crashing.policy.record(monitor, step)
+        if step.iteration == 40:
+            raise RuntimeError("simulated crash")
+
+    checkpoint = Checkpointer(str(tmp_path / "council.npz"), every_iterations=25)
+    with pytest.raises(RuntimeError):
+        run_scenario(dataclasses.replace(crashing, record=crash), checkpoint)
+    resumed = run_scenario(council_scenario(iterations=60, trust_weighted=True, seed=4), checkpoint)
+
+    assert np.array_equal(resumed.monitor.trust_history, reference.monitor.trust_history)
+    assert np.array_equal(resumed.monitor.system_coherence_history, reference.monitor.system_coherence_history)
+    assert np.array_equal(resumed.targets, reference.targets)
+
+
+def test_standing_wave_monitor_round_trip(tmp_path):
+    checkpoint = Checkpointer(str(tmp_path / "word.npz"), every_iterations=20)
+    monitor, _ = run_simple_word_system(iterations=40, checkpoint=checkpoint)
+    restored, _ = run_simple_word_system(iterations=40, checkpoint=checkpoint)
+
+    assert checkpoint.saves == 2
+    assert np.array_equal(restored.coherence_history, monitor.coherence_history)
+    assert restored.peak_coherence == monitor.peak_coherence
+    assert restored.get_persistence_window(0.5) == monitor.get_persistence_window(0.5)
+    assert restored.is_standing_wave_active() == monitor.is_standing_wave_active()
+    assert restored.coherence_variance == monitor.coherence_variance
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from coherence_metrics import (
+    DENSE_LIMIT,
+    pairwise_cross_coherence,
+    pairwise_exp_coherence,
+    pairwise_wrapped_coherence,
+)
+
+
+def _loop_wrapped(phases):
+    values = []
+    for i in range(len(phases)):
+        for j in range(i + 1, len(phases)):
+            values.append(1.0 - (abs(phases[i] - phases[j]) % (2 * np.pi)) / (2 * np.pi))
+    return float(np.mean(values))
+
+
+def _loop_exp(phases):
+    values = []
+    for i in range(len(phases)):
+        for j in range(i + 1, len(phases)):
+            values.append(float(np.exp(-abs(phases[i] - phases[j]))))
+    return float(np.mean(values))
+
+
+@pytest.mark.parametrize("n", [2, 3, DENSE_LIMIT + 1, 300])
+@pytest.mark.parametrize("scale", [0.05, 4.0, 40.0])
+def test_kernels_match_double_loop(n, scale):
+    phases = np.random.default_rng(n).normal(0.0, scale, size=n)
+    assert pairwise_wrapped_coherence(phases) == pytest.approx(_loop_wrapped(phases), abs=1e-9)
+    assert pairwise_exp_coherence(phases) == pytest.approx(_loop_exp(phases), abs=1e-9)
+
+
+def test_wrapped_kernel_handles_tied_phases():
+    phases = np.round(np.random.default_rng(1).normal(0.0, 6.0, size=200), 1)
+    assert pairwise_wrapped_coherence(phases) == pytest.approx(_loop_wrapped(phases), abs=1e-9)
+
+
+def test_degenerate_inputs_and_kernel_choice():
+    assert pairwise_cross_coherence([]) == 1.0
+    assert pairwise_cross_coherence([0.3], kernel="exp") == 1.0
+    assert pairwise_cross_coherence([0.0, 0.0, 0.0], kernel="exp") == 1.0
+    with pytest.raises(ValueError):
+        pairwise_cross_coherence([0.0, 1.0], kernel="cosine")
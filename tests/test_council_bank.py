@@ -0,0 +1,58 @@
+import numpy as np
+
+from council_bank import (
+    CouncilBank,
+    DutyCycle,
+    LaggedTrust,
+    MisalignmentDecay,
+    NonParticipationDecay,
+    alignment_scores,
+    run_council_bank,
+)
+from self_healing_reality_test import TrustDecayCouncil
+from trust_hysteresis_federation_test import TrustHysteresisCouncil
+
+
+def test_bank_rows_match_single_councils():
+    rng = np.random.default_rng(0)
+    initial = rng.uniform(0.2, 1.0, size=(4, 3))
+    initial /= initial.sum(axis=1, keepdims=True)
+    bank = CouncilBank(initial, decay=MisalignmentDecay(), hysteresis=LaggedTrust(0.1))
+    councils = [TrustHysteresisCouncil(row, hysteresis_coeff=0.1) for row in initial]
+
+    for _ in range(50):
+        phases = rng.normal(0.0, 0.3, size=(4, 3))
+        consensus = bank.weighted_phase(phases)
+        bank.update(alignment_scores(phases, consensus))
+        for council, row in zip(councils, phases):
+            council.update(alignment_scores(row, council.weighted_phase(row)))
+
+    assert np.allclose(bank.trust, [c.trust_scores for c in councils], rtol=0, atol=1e-15)
+    assert np.allclose(bank.target, [c.trust_scores_target for c in councils], rtol=0, atol=1e-15)
+    assert np.allclose(bank.trust.sum(axis=1), 1.0)
+
+
+def test_participation_policy_drives_decay():
+    flags = DutyCycle(observers=3, intermittent=[2], period=10, active=5, offsets=[0, 5])
+    assert flags(0).tolist() == [[1, 1, 1], [1, 1, 0]]
+    assert flags(7).tolist() == [[1, 1, 0], [1, 1, 1]]
+
+    bank = CouncilBank.uniform(2, 3, decay=NonParticipationDecay(0.05), participation=flags)
+    run_council_bank(bank, lambda iteration: np.zeros(3), iterations=5)
+    # Council 1's third observer sat out every step, council 0's never did
+    assert bank.trust[1, 2] < bank.trust[0, 2]
+
+    single = TrustDecayCouncil([1.0, 1.0, 1.0])
+    for _ in range(5):
+        single.update([1.0, 1.0, 1.0], [1.0, 1.0, 0.0], decay_rate=0.05)
+    assert single.trust_scores[2] < single.trust_scores[0]
+
+
+def test_many_councils_in_one_call():
+    councils, observers = 10000, 50
+    bank = CouncilBank.uniform(councils, observers, decay=MisalignmentDecay(), hysteresis=LaggedTrust(0.1))
+    offsets = np.linspace(-0.5, 0.5, observers)
+    consensus = run_council_bank(bank, lambda iteration: offsets * np.sin(iteration / 7.0), iterations=5)
+    assert consensus.shape == (5, councils)
+    assert np.allclose(consensus, consensus[:, :1])
+    assert np.allclose(bank.trust.sum(axis=1), 1.0)
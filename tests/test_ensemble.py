@@ -0,0 +1,118 @@
+import time
+
+import numpy as np
+
+from ensemble import UniverseEnsemble, run_ensemble_trajectory
+from standing_wave_test import run_baseline_ensemble
+from unity_script import QuantumParticle, UniversalSymphony
+
+
+def _template():
+    universe = UniversalSymphony(seed=5)
+    particles = [QuantumParticle(frequency=f, depth=0, rng=universe.streams.universe) for f in (1.0, 2.0, 3.0)]
+    particles[0].observe()
+    particles[1].phase = 0.3
+    universe.add_all(particles)
+    return universe
+
+
+def test_replicas_start_from_template_and_diverge():
+    template = _template()
+    ensemble = UniverseEnsemble(template, replicas=4, seed=1)
+    assert ensemble.phase.shape == (4, 3)
+    assert np.allclose(ensemble.get_coherence(), template.get_coherence())
+    assert ensemble.get_observed_count().tolist() == [1, 1, 1, 1]
+
+    ensemble.apply_decoherence(entropy_factor=[0.0, 0.1, 0.1, 0.1])
+    assert np.array_equal(ensemble.phase[0], [0.0, 0.3, 0.0])
+    assert not np.allclose(ensemble.phase[1], ensemble.phase[2])
+
+
+def test_lock_tick_and_materialize():
+    ensemble = UniverseEnsemble(_template(), replicas=3, seed=2)
+    ensemble.apply_decoherence(0.05)
+    ensemble.lock_phase([0, 2], [0.1, 0.2, 0.3])
+    assert np.allclose(ensemble.phase[:, 2], [0.1, 0.2, 0.3])
+    assert ensemble.observed[:, [0, 2]].all()
+
+    ensemble.tick(dt=0.5)
+    assert np.allclose(ensemble.get_omega_time(), 3.0)
+
+    replica = ensemble.replica(1)
+    assert replica.get_coherence() == ensemble.get_coherence()[1]
+    assert replica.emergent_time == ensemble.emergent_time[1]
+    assert replica.get_observed_count() == ensemble.get_observed_count()[1]
+
+
+def test_replica_is_identical_whatever_the_replica_count():
+    runs = {}
+    for replicas, first in ((2, 0), (3, 0), (1, 2)):
+        ensemble = UniverseEnsemble(_template(), replicas=replicas, seed=7, first_replica=first)
+        for _ in range(3):
+            ensemble.apply_decoherence(0.05)
+            ensemble.observe(probability=0.5)
+        runs[replicas, first] = ensemble
+    assert np.array_equal(runs[2, 0].phase[0], runs[3, 0].phase[0])
+    assert np.array_equal(runs[2, 0].observed, runs[3, 0].observed[:2])
+    # A batch starting at replica 2 reproduces replica 2 of the full run
+    assert np.array_equal(runs[1, 2].phase[0], runs[3, 0].phase[2])
+    assert np.array_equal(runs[1, 2].observed[0], runs[3, 0].observed[2])
+
+
+def test_from_frequencies_uses_separate_template_and_ensemble_streams():
+    ensemble = UniverseEnsemble.from_frequencies([1.0, 2.0], replicas=2, observed=False, seed=9)
+    again = UniverseEnsemble.from_frequencies([1.0, 2.0], replicas=2, observed=False, seed=9)
+    assert np.array_equal(ensemble.superposition, again.superposition)
+    assert ensemble.streams.seed_sequence.spawn_key != UniversalSymphony(seed=9).streams.seed_sequence.spawn_key
+
+
+def test_per_replica_frequencies_drive_omega_time():
+    triads = np.array([8.0, 10.0, 12.0]) + 0.1 * np.arange(2)[:, None]
+    ensemble = UniverseEnsemble.from_frequencies(triads, replicas=2, seed=9)
+    ensemble.tick(dt=1.0)
+    assert np.allclose(ensemble.get_omega_time(), [30.0, 30.3])
+    assert np.allclose(ensemble.replica(1)._view('freq'), [8.1, 10.1, 12.1])
+
+
+def test_ensemble_matches_serial_decoherence_statistics():
+    coherence = run_baseline_ensemble(replicas=2000, iterations=200, seed=3)
+    assert coherence.shape == (200, 2000)
+
+    serial = []
+    for seed in range(200):
+        universe = UniversalSymphony(seed=seed)
+        universe.add_all([QuantumParticle(frequency=f, depth=0) for f in (1.0, 2.0, 3.0, 4.0)])
+        for _ in range(200):
+            universe.apply_decoherence(entropy_factor=0.002)
+        serial.append(universe.get_coherence())
+    # Same process, so the final coherence distributions agree
+    assert abs(np.mean(serial) - coherence[-1].mean()) < 5e-5
+
+
+def _serial_baseline(seed, iterations):
+    universe = UniversalSymphony(seed=seed)
+    universe.add_all([QuantumParticle(frequency=f, depth=0) for f in (1.0, 2.0, 3.0, 4.0)])
+    for _ in range(iterations):
+        universe.apply_decoherence(entropy_factor=0.002)
+        universe.get_coherence()
+
+
+def test_ten_thousand_replicas_cost_a_few_dozen_serial_runs():
+    serial = []
+    for seed in range(3):
+        start = time.perf_counter()
+        _serial_baseline(seed, 500)
+        serial.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    coherence = run_baseline_ensemble(replicas=10000, iterations=500, seed=1)
+    elapsed = time.perf_counter() - start
+    assert coherence.shape == (500, 10000)
+    # About 60 serial runs here; the bound leaves room for noisy machines
+    assert elapsed < 250 * min(serial)
+
+
+def test_self_locking_keeps_words_together():
+    ensemble = UniverseEnsemble.from_frequencies([8.0, 10.0, 12.0], replicas=50, seed=4)
+    coherence = run_ensemble_trajectory(ensemble, 100, entropy_factor=0.01, lock_indices=[0, 1, 2], lock_every=5)
+    assert np.allclose(coherence[::5], 1.0)
@@ -0,0 +1,91 @@
+import numpy as np
+
+from experiment_runner import ScenarioSpec, mean_consensus, run_cached_scenario, run_scenario
+from result_cache import ResultCache
+from trust_weighted_council_test import council_scenario
+from unity_script import QuantumParticle, UniversalSymphony
+
+
+class PhaseLog:
+    def __init__(self, universe, waves):
+        self.universe = universe
+        self.waves = waves
+        self.phases = []
+        self.targets = []
+
+    def record(self, step):
+        self.phases.append([wave.phase for wave in self.waves])
+        self.targets.append(step.target)
+
+
+def _spec(**overrides):
+    spec = dict(
+        name="probe",
+        iterations=40,
+        monitor=PhaseLog,
+        record=lambda monitor, step: monitor.record(step),
+        observer_phases=lambda t: np.stack([np.sin(t / 5.0), np.cos(t / 7.0)], axis=1),
+        lock_every=4,
+        seed=11,
+    )
+    spec.update(overrides)
+    return ScenarioSpec(**spec)
+
+
+def test_lock_phase_matches_per_particle_locking():
+    universe = UniversalSymphony(seed=1)
+    universe.add_all([QuantumParticle(frequency=f, depth=0) for f in (1.0, 2.0, 3.0, 4.0)])
+    universe.remove(universe.entities[0])
+    universe.lock_phase([0, 2], 0.25)
+
+    phases = [p.phase for p in universe.entities]
+    assert phases == [0.25, 0.0, 0.25]
+    assert [p.is_observed for p in universe.entities] == [True, False, True]
+
+
+def test_seeded_scenarios_replay_and_lock_to_consensus():
+    first = run_scenario(_spec())
+    second = run_scenario(_spec())
+    assert np.array_equal(first.monitor.phases, second.monitor.phases)
+
+    targets, _ = mean_consensus(np.stack([np.sin(np.arange(40) / 5.0), np.cos(np.arange(40) / 7.0)], axis=1))
+    assert np.allclose(first.targets, targets)
+    # Right after a lock every Word sits on the consensus phase
+    assert np.allclose(first.monitor.phases[8], targets[8])
+
+
+def test_policy_and_lock_to_waves():
+    calls = []
+
+    def policy(iteration, phases):
+        calls.append(iteration)
+        return 0.5, 1.0
+
+    result = run_scenario(_spec(policy=policy, entropy=lambda t: np.where(t < 10, 0.0, 0.01)))
+    assert calls == list(range(40))
+    # No decoherence for the first 10 steps, so locks pin the Words to 0.5 exactly
+    assert result.monitor.phases[4] == [0.5, 0.5, 0.5]
+
+    drifting = run_scenario(_spec(lock_to_waves=True, lock_every=5))
+    row = drifting.monitor.phases[10]
+    assert np.allclose(row, row[0])
+
+
+def test_cached_scenario_restores_the_final_state(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    params = {"iterations": 30, "trust_weighted": True}
+    ran = run_cached_scenario(council_scenario(30, True, seed=5), cache, params)
+    restored = run_cached_scenario(council_scenario(30, True, seed=5), cache, params)
+    assert (cache.misses, cache.hits) == (1, 1)
+
+    assert np.array_equal(restored.monitor.trust_history, ran.monitor.trust_history)
+    assert np.array_equal(restored.monitor.system_coherence_history, ran.monitor.system_coherence_history)
+    assert np.array_equal(restored.universe._view("phase"), ran.universe._view("phase"))
+    assert [wave.phase for wave in restored.waves] == [wave.phase for wave in ran.waves]
+    assert np.array_equal(restored.spec.policy.council.trust_scores, ran.spec.policy.council.trust_scores)
+    assert np.array_equal(restored.targets, ran.targets)
+
+    # Both continue identically
+    for result in (ran, restored):
+        result.universe.apply_decoherence(0.01)
+    assert np.array_equal(restored.universe._view("phase"), ran.universe._view("phase"))
@@ -0,0 +1,75 @@
+import numpy as np
+
+from federation import FederationTopology, NWayFederation
+from trust_hysteresis_federation_test import FederationProtocol, run_federated_councils, run_federation
+
+
+def _neighbours(topology, council):
+    return set(topology.indices[topology.indptr[council]:topology.indptr[council + 1]].tolist())
+
+
+def test_topologies():
+    assert _neighbours(FederationTopology.complete(4), 2) == {0, 1, 3}
+    ring = FederationTopology.ring(10, reach=2)
+    assert _neighbours(ring, 0) == {1, 2, 8, 9}
+    tree = FederationTopology.tree(7, branching=2)
+    assert _neighbours(tree, 0) == {1, 2}
+    assert _neighbours(tree, 1) == {0, 3, 4}
+    assert _neighbours(tree, 6) == {2}
+    gossip = FederationTopology.gossip(50, degree=3, seed=1)
+    assert np.all(gossip.degree() >= 3)
+    assert all(council not in _neighbours(gossip, council) for council in range(50))
+    # Symmetric: every listener is also heard by its speaker
+    assert all(council in _neighbours(gossip, other) for council in range(50) for other in _neighbours(gossip, council))
+
+
+def test_reconcile_matches_per_council_loop():
+    rng = np.random.default_rng(3)
+    phases = rng.normal(0.0, 0.5, size=(30, 5))
+    topology = FederationTopology.gossip(30, degree=3, seed=2)
+    corrected = NWayFederation(topology, sync_strength=0.1).reconcile(phases)
+
+    medians = np.median(phases, axis=1)
+    for council in range(30):
+        heard = sorted(_neighbours(topology, council))
+        expected = phases[council] + 0.1 * (np.mean(medians[heard]) - medians[council])
+        assert np.allclose(corrected[council], expected)
+
+
+def test_two_council_protocol_unchanged():
+    protocol = FederationProtocol(sync_strength=0.02)
+    corrected_a, corrected_b = protocol.reconcile_phases([0.1, 0.3, 0.2], [0.5, 0.4, 0.9])
+    assert np.array_equal(corrected_a, np.array([0.1, 0.3, 0.2]) + 0.02 * (0.5 - 0.2))
+    assert np.array_equal(corrected_b, np.array([0.5, 0.4, 0.9]) + 0.02 * (0.2 - 0.5))
+    assert protocol.federation_sync_history == [float(np.exp(-0.3))]
+
+
+def _spread(topology, phases, rounds=200):
+    federation = NWayFederation(topology, sync_strength=0.5, persistent=True)
+    for _ in range(rounds):
+        federation.reconcile(phases)
+    return federation.history['spread']
+
+
+def test_persistent_federation_converges_at_scale():
+    councils = 300
+    phases = np.tile(np.linspace(-1.0, 1.0, councils)[:, None], (1, 3))
+    gossip = _spread(FederationTopology.gossip(councils, degree=4, seed=5), phases)
+    ring = _spread(FederationTopology.ring(councils, reach=3), phases)
+
+    assert gossip[-1] < 0.01 * gossip[0]
+    assert np.all(np.diff(ring) <= 1e-12)
+    # A sparse ring mixes far more slowly than a random gossip graph
+    assert ring[-1] > 10 * gossip[-1]
+
+
+def test_hundreds_of_councils():
+    metrics = run_federation(200, iterations=40, topology=FederationTopology.tree(200, branching=4), verbose=False)
+    assert metrics.councils == 200
+    assert metrics.topology == "tree"
+    assert len(metrics.trust_scores_final) == 200
+    assert 0.0 < metrics.federation_sync_index <= 1.0
+
+    pair = run_federated_councils(iterations=40)
+    assert pair.councils == 2
+    assert np.allclose(np.sum(pair.trust_scores_final, axis=1), 1.0)
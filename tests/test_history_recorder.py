@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from history_recorder import HistoryRecorder, RollingWindow, history_column
+
+
+def test_growth_preserves_values_and_stats():
+    history = HistoryRecorder(['a', 'b'], capacity=2)
+    values = np.linspace(-1.0, 3.0, 37)
+    for value in values:
+        history.record(a=value, b=2 * value)
+
+    assert len(history) == len(values)
+    assert np.array_equal(history['a'], values)
+    assert history.mean('b') == pytest.approx(2 * values.mean())
+    assert history.min('a') == values.min()
+    assert history.max('a') == values.max()
+    assert history.last('b') == 2 * values[-1]
+
+
+def test_vector_columns_and_empty_defaults():
+    history = HistoryRecorder({'trust': (np.float64, (3,))})
+    assert history.last('trust', default=None) is None
+    assert history.mean('trust') == 0.0
+
+    history.record(trust=[1.0, 2.0, 3.0])
+    history.record(trust=[3.0, 2.0, 1.0])
+    assert history['trust'].shape == (2, 3)
+    assert np.allclose(history.mean('trust'), [2.0, 2.0, 2.0])
+    assert np.allclose(history.last('trust'), [3.0, 2.0, 1.0])
+
+
+def test_record_requires_every_column():
+    history = HistoryRecorder(['a', 'b'])
+    with pytest.raises(KeyError):
+        history.record(a=1.0)
+    with pytest.raises(KeyError):
+        history.record(a=1.0, b=2.0, c=3.0)
+    assert len(history) == 0
+
+
+def test_history_column_exposes_views():
+    class Monitor:
+        coherence_history = history_column('coherence')
+        phase_history = history_column('phase', transpose=True)
+
+        def __init__(self):
+            self.history = HistoryRecorder({'coherence': np.float64, 'phase': (np.float64, (2,))})
+
+    monitor = Monitor()
+    monitor.history.record(coherence=0.5, phase=[0.1, 0.2])
+    monitor.history.record(coherence=0.7, phase=[0.3, 0.4])
+
+    assert monitor.coherence_history.tolist() == [0.5, 0.7]
+    assert monitor.phase_history[1].tolist() == [0.2, 0.4]
+    assert monitor.history.to_json_dict()['coherence'] == [0.5, 0.7]
+
+
+def test_rolling_window_matches_slice_statistics():
+    rng = np.random.default_rng(3)
+    samples = rng.normal(0.6, 0.2, 200)
+    window = RollingWindow(9)
+    for n, value in enumerate(samples, start=1):
+        window.push(value)
+        recent = samples[max(0, n - 9):n]
+        assert window.mean == pytest.approx(recent.mean())
+        assert window.variance == pytest.approx(recent.var(), abs=1e-12)
+    assert window.full
+    assert np.allclose(window.values(), samples[-9:])
@@ -0,0 +1,62 @@
+import numpy as np
+
+from harmonic_memory_test import compute_topological_distance
+from memory_distance import SnapshotTrail, circular_difference
+from unity_script import QuantumParticle, UniversalSymphony
+
+
+def _signature(phases, freqs, observed_ratio=0.5):
+    return {
+        'phases': np.asarray(phases, dtype=float),
+        'observed_ratio': observed_ratio,
+        'coherence': float(np.abs(np.mean(np.exp(1j * np.asarray(phases))))),
+        'frequency_spectrum': np.asarray(freqs, dtype=float),
+        'total_particles': len(phases),
+    }
+
+
+def test_distances_match_pairwise_comparison():
+    rng = np.random.default_rng(1)
+    states = [
+        _signature(rng.normal(0, 2, 40), rng.choice([1.0, 2.0, 3.0, 5.0, 8.0, 13.0], size=40), rng.random())
+        for _ in range(30)
+    ]
+    states.append(_signature(rng.normal(0, 2, 41), [1.0] * 41))
+    trail = SnapshotTrail().extend(states)
+    reference = states[3]
+    d = trail.distances(reference, metric='euclidean')
+
+    for index, state in enumerate(states):
+        expected = compute_topological_distance(reference, state)
+        assert np.isclose(d['phase_delta'][index], expected['phase_delta']) or np.isinf(expected['phase_delta'])
+        assert np.isinf(d['phase_delta'][index]) == np.isinf(expected['phase_delta'])
+        assert np.isclose(d['ratio_delta'][index], expected['ratio_delta'])
+        assert d['new_count'][index] == len(expected['new_frequencies'])
+        assert d['lost_count'][index] == len(expected['lost_frequencies'])
+
+
+def test_circular_phase_distance_wraps():
+    assert np.isclose(circular_difference(2 * np.pi - 0.01, 0.0), -0.01)
+    trail = SnapshotTrail().extend([_signature([0.0, 0.0], [1.0, 2.0]), _signature([2 * np.pi - 0.01, 0.0], [1.0, 2.0])])
+    assert np.isclose(trail.distances(0)['phase_delta'][1], 0.01)
+    assert trail.distances(0, metric='euclidean')['phase_delta'][1] > 6.0
+
+
+def test_recurrences_find_a_revisited_state():
+    universe = UniversalSymphony(seed=3)
+    rng = universe.streams.universe
+    universe.add_all([QuantumParticle(frequency=f, depth=0, rng=rng) for f in (1.0, 2.0, 3.0, 4.0)])
+    trail = SnapshotTrail()
+    for step in range(60):
+        universe.apply_decoherence(0.3)
+        if step == 10:
+            remembered = universe._view('phase').copy()
+        if step == 50:
+            universe.columns.column('phase')[:] = remembered
+            universe.columns.touch()
+        trail.append(universe)
+
+    indices, scores = trail.recurrences(50, k=3, min_separation=5)
+    assert indices[0] == 10 and np.isclose(scores[0], 0.0)
+    assert np.all(np.diff(scores) >= 0)
+    assert np.all(np.abs(indices - 50) >= 5)
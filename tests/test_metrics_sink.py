@@ -0,0 +1,159 @@
+import json
+
+import numpy as np
+import pytest
+
+from history_recorder import HistoryRecorder
+from metrics_sink import (
+    JsonLinesSink,
+    MetricsSink,
+    NpySink,
+    NpzChunkSink,
+    open_npy_columns,
+    read_jsonl,
+    read_npz_chunks,
+)
+
+COLUMNS = {'coherence': np.float64, 'trust': (np.float64, (3,))}
+
+
+def _rows(n):
+    for i in range(n):
+        yield {'coherence': i / 10.0, 'trust': np.array([i, i + 1.0, i + 2.0])}
+
+
+def test_jsonl_flushes_in_bounded_batches(tmp_path):
+    path = tmp_path / "run.jsonl"
+    sink = JsonLinesSink(str(path), buffer_size=4)
+    for row in _rows(6):
+        sink.record(**row)
+    # Only full batches reach disk before close
+    assert len(path.read_text().splitlines()) == 4
+    sink.close()
+
+    loaded = read_jsonl(str(path))
+    assert loaded['coherence'].tolist() == [i / 10.0 for i in range(6)]
+    assert loaded['trust'].shape == (6, 3)
+
+
+def test_jsonl_reader_skips_truncated_tail(tmp_path):
+    path = tmp_path / "run.jsonl"
+    path.write_text(json.dumps({'a': 1.0}) + "\n" + '{"a": 2.')
+    assert read_jsonl(str(path))['a'].tolist() == [1.0]
+
+
+def test_jsonl_append_after_torn_write_keeps_every_record(tmp_path):
+    path = tmp_path / "run.jsonl"
+    with JsonLinesSink(str(path)) as sink:
+        for i in range(3):
+            sink.record(i=i)
+    # Crash in the middle of writing record 3
+    with open(path, "a") as handle:
+        handle.write('{"i": 3')
+    with JsonLinesSink(str(path), append=True) as sink:
+        for i in range(4, 8):
+            sink.record(i=i)
+    assert read_jsonl(str(path))['i'].tolist() == [0, 1, 2, 4, 5, 6, 7]
+
+
+def test_jsonl_reader_skips_torn_lines_in_the_middle(tmp_path):
+    path = tmp_path / "run.jsonl"
+    path.write_text('{"a": 1.0}\n{"a": 2.{"a": 3.0}\n{"a": 4.0}\n')
+    assert read_jsonl(str(path))['a'].tolist() == [1.0, 4.0]
+
+
+def test_npy_sink_memory_maps_and_appends(tmp_path):
+    with NpySink(str(tmp_path), COLUMNS, buffer_size=3) as sink:
+        for row in _rows(7):
+            sink.record(**row)
+        # Flushed rows are readable while the run is still going
+        assert open_npy_columns(str(tmp_path))['coherence'].shape == (6,)
+
+    columns = open_npy_columns(str(tmp_path))
+    assert isinstance(columns['trust'], np.memmap)
+    assert columns['trust'].shape == (7, 3)
+    assert np.allclose(columns['coherence'], np.arange(7) / 10.0)
+    del columns
+
+    with NpySink(str(tmp_path), COLUMNS, append=True) as sink:
+        sink.record(coherence=9.0, trust=[0.0, 0.0, 0.0])
+    assert np.load(tmp_path / "coherence.npy")[-1] == 9.0
+    assert len(np.load(tmp_path / "trust.npy")) == 8
+
+
+def test_npy_append_reconciles_columns_of_a_torn_flush(tmp_path):
+    with NpySink(str(tmp_path), COLUMNS, buffer_size=2) as sink:
+        for row in _rows(4):
+            sink.record(**row)
+    # Crash after 'coherence' got its third flush but before 'trust' did
+    with NpySink(str(tmp_path), ['coherence'], append=True) as sink:
+        sink.record(coherence=0.4)
+        sink.record(coherence=0.5)
+    assert len(np.load(tmp_path / "coherence.npy")) == 6
+
+    with NpySink(str(tmp_path), COLUMNS, append=True) as sink:
+        assert sink.records_written == 4
+        sink.record(coherence=9.0, trust=[9.0, 9.0, 9.0])
+    columns = open_npy_columns(str(tmp_path))
+    assert columns['coherence'].tolist() == [0.0, 0.1, 0.2, 0.3, 9.0]
+    assert columns['trust'][:, 0].tolist() == [0.0, 1.0, 2.0, 3.0, 9.0]
+
+
+def test_npz_chunks_round_trip(tmp_path):
+    prefix = str(tmp_path / "sweep")
+    sink = NpzChunkSink(prefix, COLUMNS, chunk_size=4)
+    for row in _rows(10):
+        sink.record(**row)
+    sink.close()
+
+    assert sink.chunks == 3
+    loaded = read_npz_chunks(prefix)
+    assert loaded['trust'][:, 0].tolist() == list(range(10))
+
+
+def test_npz_chunks_replace_or_append_to_previous_run(tmp_path):
+    prefix = str(tmp_path / "sweep")
+    with NpzChunkSink(prefix, ['a'], chunk_size=2) as sink:
+        for value in range(6):
+            sink.record(a=value)
+    (tmp_path / "sweep_00003.npz.partial").write_bytes(b"torn")
+    # Another prefix sharing the stem is left alone
+    with NpzChunkSink(str(tmp_path / "sweep_b"), ['a']) as other:
+        other.record(a=-1)
+
+    with NpzChunkSink(prefix, ['a'], chunk_size=2) as sink:
+        sink.record(a=100)
+        sink.record(a=101)
+    assert read_npz_chunks(prefix)['a'].tolist() == [100, 101]
+    assert not (tmp_path / "sweep_00003.npz.partial").exists()
+
+    with NpzChunkSink(prefix, ['a'], chunk_size=2, append=True) as sink:
+        assert sink.chunks == 1 and sink.records_written == 2
+        for value in (102, 103, 104):
+            sink.record(a=value)
+    assert read_npz_chunks(prefix)['a'].tolist() == [100, 101, 102, 103, 104]
+    assert read_npz_chunks(str(tmp_path / "sweep_b"))['a'].tolist() == [-1]
+
+
+def test_recorder_forwards_to_sink(tmp_path):
+    path = tmp_path / "history.jsonl"
+    with JsonLinesSink(str(path)) as sink:
+        history = HistoryRecorder(['a'], sink=sink)
+        history.record(a=1.5)
+        history.record(a=2.5)
+    assert read_jsonl(str(path))['a'].tolist() == [1.5, 2.5]
+
+
+def test_binary_sink_rejects_unknown_columns(tmp_path):
+    sink = NpzChunkSink(str(tmp_path / "x"), ['a'])
+    with pytest.raises(KeyError):
+        sink.record(b=1.0)
+
+
+def test_incomplete_sink_fails_at_construction():
+    class RecordOnly(MetricsSink):
+        def record(self, **values):
+            pass
+
+    with pytest.raises(TypeError):
+        RecordOnly(buffer_size=4)
@@ -0,0 +1,112 @@
+import numpy as np
+
+from unity_script import Consciousness, QuantumParticle, UniversalSymphony, generate_fractal_universe
+
+
+def _universe(seed=11):
+    universe = UniversalSymphony(seed=seed)
+    particles = generate_fractal_universe(base_freq=1.0, octaves=4, rng=universe.streams.universe)
+    particles[1].entangle_with(particles[6])
+    universe.add_all(particles)
+    return universe
+
+
+def _state(universe):
+    columns = universe.columns
+    state = {name: columns.column(name)[columns.live()].copy() for name in columns.DTYPES}
+    state.update(
+        omega_time=universe.omega_time,
+        clock=universe.clock.now(),
+        next_id=columns.next_id,
+        rng=universe.streams.universe.bit_generator.state,
+        steps=(universe._decoherence_step, universe._observation_step),
+    )
+    return state
+
+
+def _assert_same(a, b):
+    assert a.keys() == b.keys()
+    for key, value in a.items():
+        if isinstance(value, np.ndarray):
+            assert np.array_equal(value, b[key], equal_nan=value.dtype.kind == 'f'), key
+        else:
+            assert value == b[key], key
+
+
+def _step(universe, iteration):
+    rng = universe.streams.universe
+    universe.apply_decoherence(0.05)
+    universe.observe(probability=0.3)
+    if iteration % 3 == 0:
+        universe.add(QuantumParticle(frequency=float(rng.uniform(1, 9)), rng=rng))
+    if iteration % 4 == 1:
+        universe.remove_many(universe.entities[2:7])
+    if iteration % 5 == 2:
+        universe.lock_phase([0, 1], 0.25)
+        universe.entities[3].freq = 4.5
+    if iteration % 7 == 3:
+        Consciousness().inject_frequency(universe, frequency=5.5, auto_observe=True)
+    universe.tick(0.1)
+
+
+def test_undo_and_redo_restore_every_step_exactly():
+    universe = _universe()
+    journal = universe.enable_journal()
+    states = [_state(universe)]
+    for iteration in range(20):
+        _step(universe, iteration)
+        journal.commit()
+        states.append(_state(universe))
+
+    assert journal.undo(5) == 5
+    _assert_same(_state(universe), states[15])
+    assert journal.undo(100) == 15
+    _assert_same(_state(universe), states[0])
+    assert journal.redo(12) == 12
+    _assert_same(_state(universe), states[12])
+    assert journal.redo(8) == 8
+    _assert_same(_state(universe), states[20])
+
+    # Resuming after an undo replays the same future
+    journal.undo(6)
+    for iteration in range(14, 20):
+        _step(universe, iteration)
+        journal.commit()
+    _assert_same(_state(universe), states[20])
+    assert journal.redo_steps == 0
+
+
+def test_handles_survive_undone_removals_and_appends():
+    universe = _universe()
+    journal = universe.enable_journal()
+    kept = universe.entities[4]
+    universe.remove(kept)
+    journal.commit()
+    assert kept._store is None
+    word = Consciousness().inject_frequency(universe, frequency=5.5)
+    journal.commit()
+
+    journal.undo(2)
+    assert kept._store is universe.columns and kept in universe.entities
+    assert word._store is None and word not in universe.entities
+    journal.redo(2)
+    assert kept._store is None
+    assert word._store is universe.columns and universe.entities[-1] is word
+    assert universe.entities[1]._entangled_with is universe.entities[5]
+
+
+def test_journal_size_follows_the_changes():
+    universe = UniversalSymphony(seed=1)
+    universe.add_all([QuantumParticle(frequency=float(f)) for f in range(1, 20001)])
+    journal = universe.enable_journal(limit=50)
+    for iteration in range(100):
+        universe.lock_phase([iteration], 1.0)
+        universe.tick(0.1)
+        journal.commit()
+    assert journal.steps == 50
+    assert journal.nbytes < 50 * 64
+    phases = universe._view('phase').copy()
+    journal.undo(50)
+    assert np.count_nonzero(universe._view('phase')) == 50
+    assert np.isclose(universe.clock.now(), 5.0)
+    assert np.all(phases[50:100] == 1.0)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from council_bank import DutyCycle
+from observer_schedule import Constant, Drift, Dropout, Every, Schedule, Window, stack
+
+
+def test_primitives_match_scalar_evaluation():
+    schedule = stack(
+        Drift(0.02, 7.0).reset_every(5),
+        Every(7).where(Drift(0.1, 9.0), Drift(0.12, 11.0, wave=np.cos)) + Window(120, 60, 91).where(0.3, 0.0),
+        2.0 * Dropout(40, 30) - 1.0,
+    )
+    table = schedule.table(300)
+    assert table.shape == (300, 3)
+    for i in (0, 5, 7, 59, 60, 90, 91, 210, 299):
+        a = 0.0 if i % 5 == 0 else 0.02 * np.sin(i / 7.0)
+        b = 0.1 * np.sin(i / 9.0) if i % 7 == 0 else 0.12 * np.cos(i / 11.0)
+        b += 0.3 if 60 <= i % 120 <= 90 else 0.0
+        c = 1.0 if i % 40 < 30 else -1.0
+        assert np.allclose(table[i], [a, b, c])
+
+
+def test_per_council_parameters_broadcast():
+    councils = 5
+    schedule = stack(Constant(0.1 * np.arange(councils)) + Drift(0.02, 10.0), Drift(0.08, 8.0, 0.5 * np.arange(councils)))
+    table = schedule.table(np.arange(50)[:, None])
+    assert table.shape == (50, councils, 2)
+    assert np.allclose(table[12, 3], [0.3 + 0.02 * np.sin(1.2), 0.08 * np.sin(1.5 + 1.5)])
+    # A scalar iteration gives one (C, M) row
+    assert np.array_equal(schedule(12), table[12])
+
+
+def test_duty_cycle_compiles_to_a_table():
+    flags = DutyCycle(observers=4, intermittent=[2], period=40, active=30)
+    table = flags.table(100)
+    assert table.shape == (100, 4)
+    assert all(np.array_equal(table[i], flags(i)) for i in range(100))
+
+    shifted = DutyCycle(observers=3, intermittent=[0, 2], period=10, active=4, offsets=[0, 5])
+    table = shifted.table(20)
+    assert table.shape == (20, 2, 3)
+    assert all(np.array_equal(table[i], shifted(i)) for i in range(20))
+    assert np.array_equal(table[6, 1], [1.0, 1.0, 1.0]) and np.array_equal(table[6, 0], [0.0, 1.0, 0.0])
+
+
+def test_schedule_without_evaluate_fails_at_construction():
+    class Unfinished(Schedule):
+        pass
+
+    with pytest.raises(TypeError):
+        Unfinished()
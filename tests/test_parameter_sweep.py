@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from chronos_dilation_test import chronos_dilation_metrics
+from parameter_sweep import ScenarioTarget, grid, random_search, run_sweep
+from result_cache import ResultCache
+from trust_weighted_council_test import council_scenario
+
+CALLS = []
+
+
+def _quadratic(x, scale=1.0, seed=None):
+    CALLS.append((x, seed))
+    noise = np.random.default_rng(seed).normal() * 0.01
+    return {"value": scale * x * x + noise, "label": "ok", "ignored": [1, 2]}
+
+
+def test_grid_and_random_search():
+    points = grid(x=[1, 2], scale=[0.5, 1.0, 2.0])
+    assert len(points) == 6
+    assert points[0] == {"x": 1, "scale": 0.5}
+
+    samples = random_search({"x": (0.0, 1.0), "mode": ["a", "b"]}, samples=20, seed=4)
+    assert samples == random_search({"x": (0.0, 1.0), "mode": ["a", "b"]}, samples=20, seed=4)
+    assert all(0.0 <= s["x"] <= 1.0 and s["mode"] in ("a", "b") for s in samples)
+
+
+def test_summary_and_resume(tmp_path):
+    path = str(tmp_path / "sweep.jsonl")
+    CALLS.clear()
+    first = run_sweep(_quadratic, grid(x=[1.0, 2.0]), seeds=[0, 1, 2], workers=0, results_path=path)
+    assert len(first) == 6
+    assert "ignored" not in first.metric_names
+
+    summary = {entry["x"]: entry for entry in first.summarize(["value"])}
+    assert summary[2.0]["runs"] == 3
+    assert summary[2.0]["value_mean"] == pytest.approx(4.0, abs=0.05)
+    assert summary[2.0]["value_ci95"] > 0.0
+
+    # Extending the sweep only runs the new seed
+    CALLS.clear()
+    resumed = run_sweep(_quadratic, grid(x=[1.0, 2.0]), seeds=[0, 1, 2, 3], workers=0, results_path=path)
+    assert sorted(CALLS) == [(1.0, 3), (2.0, 3)]
+    assert len(resumed) == 8
+    assert np.array_equal(resumed.column("value")[:6], first.column("value"))
+
+
+def test_resume_after_torn_write_reruns_only_the_torn_row(tmp_path):
+    path = tmp_path / "sweep.jsonl"
+    run_sweep(_quadratic, grid(x=[1.0, 2.0]), seeds=[0, 1, 2], workers=0, results_path=str(path))
+    # Crash in the middle of flushing the last row
+    text = path.read_text()
+    path.write_text(text[:-20])
+
+    CALLS.clear()
+    resumed = run_sweep(_quadratic, grid(x=[1.0, 2.0]), seeds=[0, 1, 2, 3], workers=0, results_path=str(path))
+    assert sorted(CALLS) == [(1.0, 3), (2.0, 2), (2.0, 3)]
+    assert len(resumed) == 8
+
+    # The rows written after the tear are readable, so a second resume has nothing left to run
+    CALLS.clear()
+    again = run_sweep(_quadratic, grid(x=[1.0, 2.0]), seeds=[0, 1, 2, 3], workers=0, results_path=str(path))
+    assert CALLS == []
+    assert len(again) == 8
+    assert len(path.read_text().splitlines()) == 8
+
+
+def test_cached_sweep_skips_unchanged_seeded_runs(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    CALLS.clear()
+    first = run_sweep(_quadratic, grid(x=[1.0, 2.0]), seeds=[0, 1, None], workers=0, cache=cache)
+    assert len(CALLS) == 6
+
+    # A fresh sweep (no results file to resume from) reruns only the unseeded points
+    CALLS.clear()
+    second = run_sweep(_quadratic, grid(x=[1.0, 2.0]), seeds=[0, 1, None], workers=0, cache=cache)
+    assert sorted(CALLS) == [(1.0, None), (2.0, None)]
+    seeded = [index for index, row in enumerate(first.rows) if row["seed"] is not None]
+    assert np.array_equal(second.column("value")[seeded], first.column("value")[seeded])
+
+
+def test_process_pool_matches_serial_run():
+    points = grid(steps=[5], entropy_factor=[0.01, 0.05])
+    serial = run_sweep(chronos_dilation_metrics, points, seeds=[1, 2], workers=0)
+    pooled = run_sweep(chronos_dilation_metrics, points, seeds=[1, 2], workers=2, chunk_size=1)
+
+    def by_key(table):
+        return {(row["params"]["entropy_factor"], row["seed"]): row["metrics"] for row in table.rows}
+
+    assert by_key(serial) == by_key(pooled)
+
+
+def test_scenario_target_reports_final_metrics():
+    target = ScenarioTarget(council_scenario)
+    metrics = target(seed=3, iterations=20, trust_weighted=True)
+    assert metrics["mode"] == "trust"
+    assert "trust_scores_final" not in metrics
+    assert metrics == target(seed=3, iterations=20, trust_weighted=True)
@@ -0,0 +1,141 @@
+import os
+import shutil
+
+import numpy as np
+
+import result_cache
+from result_cache import CachedTarget, ResultCache, source_files, source_hash
+
+
+def _metrics(x, seed=None):
+    _metrics.calls += 1
+    return {"value": x * 2.0, "trace": np.arange(4) * x}
+
+
+_metrics.calls = 0
+
+
+def test_stage_hits_until_params_or_source_change(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    module = tmp_path / "stage_source.py"
+    module.write_text("VERSION = 1\n")
+
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"trace": np.linspace(0, 1, 5), "label": "run"}
+
+    first = cache.stage("sim", compute, params={"n": 5}, seed=1, sources=[str(module)])
+    second = cache.stage("sim", compute, params={"n": 5}, seed=1, sources=[str(module)])
+    assert len(calls) == 1
+    assert np.array_equal(first["trace"], second["trace"])
+    assert second["label"] == "run"
+
+    cache.stage("sim", compute, params={"n": 6}, seed=1, sources=[str(module)])
+    module.write_text("VERSION = 2\n")
+    cache.stage("sim", compute, params={"n": 5}, seed=1, sources=[str(module)])
+    assert len(calls) == 3
+
+    # Unseeded stages are not cached
+    cache.stage("sim", compute, params={"n": 5})
+    assert len(calls) == 4
+
+
+def test_file_stage_restores_outputs(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    output = tmp_path / "figure.txt"
+    produced = []
+
+    def produce():
+        produced.append(1)
+        output.write_text("plot")
+
+    assert cache.files("figure", [str(output)], produce, params={"coherence": 0.5}) is False
+    output.unlink()
+    assert cache.files("figure", [str(output)], produce, params={"coherence": 0.5}) is True
+    assert output.read_text() == "plot"
+    assert produced == [1]
+
+
+def test_lru_eviction_keeps_recent_entries(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"), max_bytes=10 ** 9)
+    keys = []
+    for index in range(4):
+        key = cache.key("blob", {"index": index})
+        cache.store(key, {"data": np.zeros(2000)})
+        os.utime(cache._entry(key), (index, index))
+        keys.append(key)
+    cache.load(keys[0])  # most recently used now
+
+    entry_size = cache.size() // 4
+    cache.max_bytes = 2 * entry_size + entry_size // 2
+    assert cache.evict() == 2
+    assert cache.load(keys[0]) is not None
+    assert cache.load(keys[3]) is not None
+    assert cache.load(keys[1]) is None and cache.load(keys[2]) is None
+
+
+def test_store_rescans_only_when_the_size_estimate_crosses_the_bound(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path / "cache"), max_bytes=10 ** 9)
+    scans = []
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or entries())
+    keys = [cache.key("blob", {"index": index}) for index in range(6)]
+    for key in keys[:5]:
+        cache.store(key, {"data": np.zeros(2000)})
+    assert len(scans) == 1
+
+    cache.max_bytes = cache.size() + 100
+    scans.clear()
+    cache.store(keys[5], {"data": np.zeros(2000)})
+    assert len(scans) == 1
+    assert cache.size() <= cache.max_bytes
+
+
+def test_concurrent_workers_tolerate_each_other(tmp_path, monkeypatch):
+    root = str(tmp_path / "cache")
+    first, second = ResultCache(root), ResultCache(root)
+    key = first.key("blob", {"index": 0})
+    first.store(key, {"value": 1.0})
+    # A second worker finishing the same key keeps the entry that landed first
+    second.store(key, {"value": 1.0, "late": True})
+    assert second.load(key) == {"value": 1.0}
+
+    other = first.key("blob", {"index": 1})
+    first.store(other, {"data": np.zeros(100)})
+    getsize = os.path.getsize
+
+    def evicted_meanwhile(path):
+        # Another worker's eviction removes the entry while this one is measuring it
+        shutil.rmtree(first._entry(other), ignore_errors=True)
+        return getsize(path)
+
+    monkeypatch.setattr(result_cache.os.path, "getsize", evicted_meanwhile)
+    assert second.evict() == 0
+    assert second.load(other) is None
+
+
+def test_cached_target_memoizes_per_seed(tmp_path):
+    target = CachedTarget(_metrics, ResultCache(str(tmp_path / "cache")))
+    _metrics.calls = 0
+    assert target(seed=1, x=2.0)["value"] == 4.0
+    assert np.array_equal(target(seed=1, x=2.0)["trace"], [0.0, 2.0, 4.0, 6.0])
+    target(seed=2, x=2.0)
+    assert _metrics.calls == 2
+
+
+def test_source_hash_covers_imported_project_modules(tmp_path, monkeypatch):
+    (tmp_path / "cache_physics.py").write_text("SCALE = 1.0\n")
+    (tmp_path / "cache_figure.py").write_text(
+        "import numpy as np\nfrom cache_physics import SCALE\n\n\ndef plot():\n    return SCALE\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import cache_figure
+
+    files = [os.path.basename(path) for path in source_files([cache_figure.plot])]
+    assert files == ["cache_figure.py", "cache_physics.py"]
+
+    before = source_hash([cache_figure.plot])
+    (tmp_path / "cache_physics.py").write_text("SCALE = 2.0  # retuned\n")
+    assert source_hash([cache_figure.plot]) != before
@@ -0,0 +1,90 @@
+import numpy as np
+
+from sharded_symphony import ShardedSymphony
+from unity_script import QuantumParticle, UniversalSymphony
+
+
+def _universe(n=9000):
+    universe = UniversalSymphony(seed=5)
+    rng = universe.streams.universe
+    universe.add_all([QuantumParticle(frequency=float(f), depth=0, rng=rng) for f in rng.uniform(1.0, 20.0, n)])
+    return universe
+
+
+def _step(universe):
+    universe.apply_decoherence(0.05)
+    universe.observe_all(0.3)
+    universe.tick(0.5)
+
+
+def test_sharded_run_matches_serial_bit_for_bit():
+    serial = _universe()
+    with ShardedSymphony.from_universe(_universe(), workers=2, blocks_per_shard=1) as sharded:
+        assert len(sharded.shards) == 3
+        for _ in range(4):
+            _step(serial)
+            _step(sharded)
+
+        assert np.array_equal(sharded.phase, serial._view('phase'))
+        assert np.array_equal(sharded.observed, serial._view('observed'))
+        assert sharded.get_observed_count() == serial.get_observed_count()
+        assert np.isclose(sharded.get_coherence(), serial.get_coherence(), rtol=1e-12)
+        assert np.isclose(sharded.omega_time, serial.omega_time, rtol=1e-12)
+        assert np.isclose(sharded.emergent_time, serial.emergent_time, rtol=1e-12)
+
+        t = np.linspace(0.0, 1.0, 300)
+        assert np.allclose(sharded.render_reality(t), serial.render_reality(t))
+
+
+def test_worker_count_does_not_change_results():
+    phases = []
+    for workers in (1, 3):
+        with ShardedSymphony(np.linspace(1.0, 5.0, 10000), workers=workers, seed=2, blocks_per_shard=1) as sharded:
+            sharded.apply_decoherence(0.1)
+            sharded.lock_phase([0, 5000], 0.0)
+            phases.append(sharded.phase.copy())
+            universe = sharded.to_universe()
+            assert universe.get_observed_count() == 2
+    assert np.array_equal(phases[0], phases[1])
+
+
+def test_to_universe_draws_superpositions_from_the_seeded_streams():
+    copies = []
+    for global_seed in (0, 1):
+        np.random.seed(global_seed)
+        with ShardedSymphony(np.linspace(1.0, 5.0, 50), workers=1, seed=3) as sharded:
+            sharded.apply_decoherence(0.1)
+            copies.append(sharded.to_universe())
+    assert np.array_equal(copies[0]._view('superposition'), copies[1]._view('superposition'))
+    # The copy's decoherence continues the sharded run's streams
+    assert copies[0]._decoherence_step == 1
+
+
+def _nested_universe():
+    universe = _universe(5000)
+    for n in (3000, 700):
+        child = universe.spawn_child()
+        rng = child.streams.universe
+        child.add_all([QuantumParticle(frequency=float(f), depth=1, rng=rng) for f in rng.uniform(1.0, 20.0, n)])
+    return universe
+
+
+def test_nested_universes_match_serial_bit_for_bit():
+    serial = _nested_universe()
+    with ShardedSymphony.from_universe(_nested_universe(), workers=2, blocks_per_shard=1) as sharded:
+        assert len(sharded) == 8700 and sharded.active == 5000
+        for _ in range(4):
+            _step(serial)
+            _step(sharded)
+
+        members = [serial] + serial.children
+        for name in ('phase', 'observed'):
+            expected = np.concatenate([member._view(name) for member in members])
+            assert np.array_equal(getattr(sharded, name), expected)
+        assert not sharded.observed[5000:].any()
+        assert sharded.get_observed_count() == serial.get_observed_count()
+        assert np.isclose(sharded.get_coherence(), serial.get_coherence(), rtol=1e-12)
+        assert np.isclose(sharded.omega_time, serial.omega_time, rtol=1e-12)
+
+        t = np.linspace(0.0, 1.0, 300)
+        assert np.allclose(sharded.render_reality(t), serial.render_reality(t))
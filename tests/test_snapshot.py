@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from harmonic_memory_test import capture_state_signature, compute_topological_distance
+from snapshot import Snapshot, load_snapshot, open_snapshot, save_snapshot
+from unity_script import QuantumParticle, UniversalSymphony
+
+
+def _universe():
+    universe = UniversalSymphony(seed=8)
+    rng = universe.streams.universe
+    particles = [QuantumParticle(frequency=f, depth=0, rng=rng) for f in (1.0, 2.0, 3.0, 4.0, 6.0)]
+    particles[0].entangle_with(particles[4])
+    universe.add_all(particles)
+    universe.remove(particles[2])
+    universe.observe(indices=[0, 1])
+    universe.apply_decoherence(0.2)
+    universe.tick(1.0)
+    child = universe.spawn_child()
+    child.add_all([QuantumParticle(frequency=9.0, rng=child.streams.universe)])
+    return universe
+
+
+def test_round_trip_is_zero_copy_and_continues_identically(tmp_path):
+    universe = _universe()
+    path = save_snapshot(universe, str(tmp_path / "u.omega"))
+    loaded = load_snapshot(path)
+
+    assert isinstance(loaded.columns.data['phase'], np.memmap)
+    assert loaded._handles == {}
+    assert np.array_equal(loaded._view('id'), universe._view('id'))
+    assert loaded.omega_time == universe.omega_time
+    assert loaded.get_coherence() == universe.get_coherence()
+    assert loaded.children[0].clock is loaded.clock
+
+    entities = loaded.entities
+    assert [p.freq for p in entities] == [1.0, 2.0, 4.0, 6.0]
+    assert entities[0]._entangled_with is entities[3]
+
+    for u in (universe, loaded):
+        u.apply_decoherence(0.1)
+        u.add(QuantumParticle(frequency=5.0))
+    assert np.array_equal(loaded._view('phase'), universe._view('phase'))
+    # Copy-on-write: the file still holds the saved state
+    assert np.array_equal(open_snapshot(path).column('phase'), load_snapshot(path)._view('phase'))
+
+
+def test_snapshot_measures_and_signatures(tmp_path):
+    universe = _universe()
+    before = save_snapshot(universe, str(tmp_path / "a.omega"))
+    signature_before = capture_state_signature(universe)
+    universe.apply_decoherence(0.5)
+    after = save_snapshot(universe, str(tmp_path / "b.omega"))
+
+    a, b = open_snapshot(before), open_snapshot(after)
+    assert len(a) == 4 and a.version == 1
+    assert np.array_equal(a.column('phase'), signature_before['phases'])
+    assert a.coherence() == pytest.approx(float(np.abs(np.mean(np.exp(1j * signature_before['phases'])))))
+    expected = compute_topological_distance(capture_state_signature(a), capture_state_signature(b))
+    streamed = a.compare(b)
+    assert streamed['phase_delta'] == pytest.approx(expected['phase_delta'])
+    assert streamed['ratio_delta'] == expected['ratio_delta']
+    assert streamed['new_frequencies'] == streamed['lost_frequencies'] == set()
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "bogus.omega"
+    path.write_bytes(b"not a snapshot at all")
+    with pytest.raises(ValueError):
+        Snapshot(str(path))
@@ -0,0 +1,66 @@
+import numpy as np
+
+from state_index import SignatureEncoder, StateIndex
+
+
+def _signature(phases, freqs, observed_ratio=0.5):
+    return {
+        'phases': np.asarray(phases, dtype=float),
+        'observed_ratio': observed_ratio,
+        'coherence': float(np.abs(np.mean(np.exp(1j * np.asarray(phases))))),
+        'frequency_spectrum': np.asarray(freqs, dtype=float),
+        'total_particles': len(phases),
+    }
+
+
+def _random_walk(steps, particles=64, seed=0):
+    rng = np.random.default_rng(seed)
+    freqs = rng.choice([1.0, 2.0, 3.0, 5.0, 8.0, 13.0], size=particles)
+    phases = rng.uniform(0, 2 * np.pi, particles)
+    states = []
+    for _ in range(steps):
+        phases = phases + rng.normal(0, 0.6, particles)
+        states.append(_signature(phases % (2 * np.pi), freqs, rng.random()))
+    return freqs, states
+
+
+def test_encoder_is_fixed_length_and_wrap_invariant():
+    freqs, states = _random_walk(3)
+    encoder = SignatureEncoder.fit(states[0], groups=4, seed=0)
+    vector = encoder.encode(states[0])
+    assert vector.shape == (encoder.dimensions,)
+    wrapped = dict(states[0], phases=states[0]['phases'] + 2 * np.pi)
+    assert np.allclose(encoder.encode(wrapped), vector)
+    assert not np.allclose(encoder.encode(states[1]), vector)
+    # A different particle count still encodes (projections become zero)
+    other = encoder.encode(_signature(np.zeros(10), np.ones(10)))
+    assert other.shape == vector.shape
+
+
+def test_resurrection_found_among_few_candidates():
+    freqs, states = _random_walk(2000, seed=1)
+    encoder = SignatureEncoder.fit(states[0], seed=2)
+    index = StateIndex(encoder, seed=3)
+    for state in states:
+        index.add(state)
+
+    rng = np.random.default_rng(4)
+    for target in (17, 900, 1999):
+        revisit = dict(states[target], phases=states[target]['phases'] + rng.normal(0, 0.02, len(freqs)))
+        ids, distances = index.query(revisit, k=1)
+        assert ids.tolist() == [target]
+        assert ids.tolist() == index.exact_query(revisit)[0].tolist()
+        assert index.last_candidates < len(index) // 10
+
+
+def test_radius_and_exclude_last():
+    freqs, states = _random_walk(200, seed=5)
+    index = StateIndex(SignatureEncoder.fit(states[0], seed=0), seed=0)
+    for state in states:
+        index.add(state)
+    ids, _ = index.query(states[-1], k=3, exclude_last=0)
+    assert ids[0] == len(states) - 1
+    ids, _ = index.query(states[-1], k=3, exclude_last=1)
+    assert len(states) - 1 not in ids.tolist()
+    ids, distances = index.query(states[-1], k=3, radius=1e-9)
+    assert ids.tolist() == [len(states) - 1] and distances[0] == 0.0
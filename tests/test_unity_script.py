@@ -6,6 +6,9 @@ from unity_script import (
     QuantumParticle,
     Consciousness,
     UniversalSymphony,
+    RandomStreams,
+    SimulationClock,
+    WallClock,
     generate_fractal_universe,
 )
 
@@ -217,3 +220,245 @@ def test_inject_frequency_coherent_vs_potential():
     
     assert coherent.is_observed is True
     assert potential.is_observed is False
+
+
+def test_particles_follow_symphony_clock():
+    universe = UniversalSymphony()
+    p = QuantumParticle(1.0, decoherence_time=0.5)
+    universe.add(p)
+
+    assert p.clock is universe.clock
+    universe.tick(dt=0.25)
+    assert universe.decohere_expired() == 0
+    universe.tick(dt=0.25)
+    assert universe.decohere_expired() == 1
+    assert p.is_observed is True
+
+
+def test_injected_particle_born_at_current_clock_time():
+    universe = UniversalSymphony(clock=SimulationClock(start=10.0))
+    universe.tick(dt=2.0)
+    word = Consciousness().inject_frequency(universe, frequency=5.5, auto_observe=False)
+    assert word._created_at == 12.0
+
+
+def test_wall_clock_ignores_ticks():
+    universe = UniversalSymphony(clock=WallClock())
+    before = universe.clock.now()
+    universe.tick(dt=100.0)
+    assert universe.clock.now() - before < 100.0
+
+
+def test_seeded_symphonies_replay_identically():
+    def run(seed):
+        universe = UniversalSymphony(seed=seed)
+        universe.add_all(generate_fractal_universe(octaves=4, rng=universe.streams.universe))
+        for _ in range(5):
+            universe.apply_decoherence(entropy_factor=0.1)
+        universe.observe_all(probability=0.5)
+        return [(p.phase, p.is_observed) for p in universe.entities]
+
+    assert run(99) == run(99)
+    assert run(99) != run(100)
+
+
+def test_random_streams_independent_of_chunking():
+    streams = RandomStreams(seed=5, block_size=8)
+    serial = streams.normal(1, 0, 30, scale=0.1)
+    # Two "workers" each produce a disjoint subset of blocks
+    worker_a = streams.normal(1, 0, 30, scale=0.1, blocks=[0, 2])
+    worker_b = streams.normal(1, 0, 30, scale=0.1, blocks=[1, 3])
+    recombined = np.concatenate([worker_a[:8], worker_b[:8], worker_a[8:], worker_b[8:]])
+    assert np.array_equal(serial, recombined)
+
+
+def test_bulk_observe_indices_returns_collapsed_values():
+    universe = UniversalSymphony(seed=3)
+    particles = [QuantumParticle(float(i + 1), rng=universe.streams.universe) for i in range(10)]
+    universe.add_all(particles)
+
+    values = universe.observe(indices=[1, 4, 7])
+    expected = [1.0 if particles[i]._superposition_value > 0.5 else 0.0 for i in (1, 4, 7)]
+    assert values.tolist() == expected
+    assert [p.is_observed for p in particles].count(True) == 3
+
+
+def test_bulk_observe_probability_vector_and_band():
+    universe = UniversalSymphony(seed=4)
+    universe.add_all([QuantumParticle(float(f)) for f in range(1, 9)])
+
+    # Only the 3-6 Hz band is eligible, and within it only certainties collapse
+    chance = np.array([1.0, 0.0, 1.0, 0.0])
+    values = universe.observe(band=(3.0, 6.0), probability=chance)
+    assert len(values) == 2
+    observed = [p.freq for p in universe.entities if p.is_observed]
+    assert observed == [3.0, 5.0]
+
+
+def test_bulk_observe_collapses_entangled_partner():
+    universe = UniversalSymphony()
+    p1, p2, p3 = QuantumParticle(1.0), QuantumParticle(2.0), QuantumParticle(3.0)
+    universe.add_all([p1, p2, p3])
+    p1.entangle_with(p3)
+
+    universe.observe(indices=[0])
+    assert p3.is_observed is True
+    assert p2.is_observed is False
+
+
+def test_remove_keeps_stable_ids_across_compaction():
+    universe = UniversalSymphony()
+    particles = [QuantumParticle(float(i + 1)) for i in range(10)]
+    universe.add_all(particles)
+    ids = [p.particle_id for p in particles]
+
+    assert universe.remove(particles[0]) is True
+    assert universe.remove_many([ids[1], ids[2], particles[3], particles[4], ids[5]]) == 5
+    # More than half the rows were tombstones, so the store compacted itself
+    assert universe.columns.tombstones == 0
+    assert universe.get_complexity() == 4
+    assert [p.freq for p in universe.entities] == [7.0, 8.0, 9.0, 10.0]
+    assert universe.particle(ids[8]) is particles[8]
+    assert universe.indices_of([ids[7], ids[0]]).tolist() == [1, -1]
+    # Removed particles keep their state as free particles
+    assert particles[0].particle_id is None
+    assert particles[0].freq == 1.0
+
+
+def test_removed_rows_are_excluded_from_field_operations():
+    universe = UniversalSymphony()
+    particles = [QuantumParticle(1.0) for _ in range(4)]
+    universe.add_all(particles)
+    particles[1].phase = np.pi
+
+    universe.remove(particles[1])
+    assert universe.columns.tombstones == 1
+    assert universe.get_coherence() == 1.0
+    assert universe.observe_all(probability=1.0) == 3
+    assert particles[1].is_observed is False
+
+
+def test_entanglement_survives_compaction():
+    universe = UniversalSymphony()
+    particles = [QuantumParticle(float(i + 1)) for i in range(6)]
+    universe.add_all(particles)
+    particles[4].entangle_with(particles[5])
+
+    universe.remove_many(particles[:4])
+    universe.observe(indices=[0])
+    assert particles[5].is_observed is True
+
+
+def _nested_and_flat(seed=8):
+    root = UniversalSymphony(seed=seed)
+    flat = UniversalSymphony()
+    for child_index in range(3):
+        child = root.spawn_child()
+        particles = generate_fractal_universe(base_freq=1.0 + child_index, octaves=3)
+        for i, p in enumerate(particles):
+            p.phase = 0.1 * i * (child_index + 1)
+            if i % 3 == 0:
+                p.observe()
+        child.add_all(particles)
+        twins = [QuantumParticle(p.freq) for p in particles]
+        for twin, p in zip(twins, particles):
+            twin.phase = p.phase
+            twin.is_observed = p.is_observed
+        flat.add_all(twins)
+    return root, flat
+
+
+def test_nested_universe_measures_match_flat_universe():
+    root, flat = _nested_and_flat()
+    t = np.linspace(0, 1, 200)
+
+    assert root.get_complexity() == flat.get_complexity()
+    assert root.get_observed_count() == flat.get_observed_count()
+    assert np.isclose(root.get_coherence(), flat.get_coherence())
+    assert np.isclose(root.emergent_time, flat.emergent_time)
+    assert np.allclose(root.render_reality(t), flat.render_reality(t))
+
+    root.tick(dt=0.5)
+    flat.tick(dt=0.5)
+    assert np.isclose(root.get_omega_time(), flat.get_omega_time())
+    assert root.clock.now() == 0.5
+
+
+def test_child_summary_recomputed_only_when_dirty():
+    root, _ = _nested_and_flat()
+    first = root.summary()
+    clean_child, dirty_child = root.children[0], root.children[1]
+    clean_summary = clean_child.summary()
+    assert root.summary() is first
+
+    dirty_child.entities[0].phase += 1.0
+    refreshed = root.summary()
+    assert refreshed is not first
+    assert clean_child.summary() is clean_summary
+
+
+def _seeded_universe(seed=5):
+    universe = UniversalSymphony(seed=seed)
+    particles = generate_fractal_universe(base_freq=1.0, octaves=4, rng=universe.streams.universe)
+    particles[0].entangle_with(particles[5])
+    universe.add_all(particles)
+    universe.spawn_child().add_all([QuantumParticle(frequency=f, rng=universe.streams.universe) for f in (13.0, 21.0)])
+    return universe
+
+
+def _evolve(universe, steps=5):
+    for _ in range(steps):
+        universe.apply_decoherence(0.05)
+        universe.observe(probability=0.2)
+        universe.children[0].apply_decoherence(0.05)
+        universe.tick(0.1)
+
+
+def test_fork_shares_columns_until_written():
+    base = _seeded_universe()
+    branch = base.fork()
+    for name in base.columns.DTYPES:
+        assert np.shares_memory(base.columns.data[name], branch.columns.data[name])
+
+    branch.apply_decoherence(0.1)
+    assert not np.shares_memory(base.columns.data['phase'], branch.columns.data['phase'])
+    assert np.shares_memory(base.columns.data['freq'], branch.columns.data['freq'])
+    assert np.all(base._view('phase') == 0.0)
+    with pytest.raises(ValueError):
+        base.columns.column('freq')[0] = 2.0
+
+    base.entities[1].freq = 9.0
+    assert base.entities[1].freq == 9.0
+    assert branch.entities[1].freq != 9.0
+
+
+def test_unchanged_fork_evolves_like_the_original():
+    reference = _seeded_universe()
+    base = _seeded_universe()
+    _evolve(reference, 3)
+    _evolve(base, 3)
+    branch = base.fork()
+    _evolve(reference)
+    _evolve(branch)
+
+    for name in reference.columns.DTYPES:
+        assert np.array_equal(reference.columns.column(name), branch.columns.column(name), equal_nan=name != 'id')
+    assert np.array_equal(reference.children[0]._view('phase'), branch.children[0]._view('phase'))
+    assert branch.children[0].clock is branch.clock and branch.clock is not base.clock
+    assert branch.omega_time == reference.omega_time
+    assert branch.entities[0]._entangled_with is branch.entities[5]
+    assert np.isclose(base.clock.now(), 0.3)
+
+
+def test_fork_branches_diverge_independently():
+    base = _seeded_universe()
+    plain, injected = base.fork(), base.fork()
+    Consciousness().inject_frequency(injected, frequency=5.5, auto_observe=True)
+    assert injected.get_complexity() == base.get_complexity() + 1
+    assert plain.get_complexity() == base.get_complexity()
+    injected.remove(injected.entities[2])
+    assert len(base.entities) == len(plain.entities)
+    reseeded = base.fork(seed=99)
+    reseeded.apply_decoherence(0.1)
+    plain.apply_decoherence(0.1)
+    assert not np.array_equal(reseeded._view('phase'), plain._view('phase'))
@@ -31,13 +31,17 @@ Date: February 4, 2026
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
 import json
 import numpy as np
 import matplotlib.pyplot as plt
 
-from unity_script import Consciousness, QuantumParticle, UniversalSymphony
+from coherence_metrics import pairwise_wrapped_coherence
+from experiment_runner import ScenarioSpec, ScenarioStep, run_scenario
+from history_recorder import HistoryRecorder, history_column
+from unity_script import QuantumParticle, UniversalSymphony
 
 
 @dataclass
@@ -55,29 +59,38 @@ class PolyphonyMetrics:
 class PolyphonyMonitor:
     """Tracks multi-wave coherence and interaction metrics."""
 
-    def __init__(self, universe: UniversalSymphony, waves: List[QuantumParticle], mode: str):
+    system_coherence_history = history_column('system_coherence')
+    cross_coherence_history = history_column('cross_coherence')
+    individual_coherence_history = history_column('individual_coherence', transpose=True)
+    phase_history = history_column('phase', transpose=True)
+
+    def __init__(
+        self,
+        universe: UniversalSymphony,
+        waves: List[QuantumParticle],
+        mode: str,
+        capacity: Optional[int] = None,
+    ):
         self.universe = universe
         self.waves = waves
         self.mode = mode
 
-        self.system_coherence_history: List[float] = []
-        self.cross_coherence_history: List[float] = []
-        self.individual_coherence_history: List[List[float]] = [[] for _ in waves]
-        self.phase_history: List[List[float]] = [[] for _ in waves]
+        wave_shape = (np.float64, (len(waves),))
+        self.history = HistoryRecorder(
+            {
+                'system_coherence': np.float64,
+                'cross_coherence': np.float64,
+                'individual_coherence': wave_shape,
+                'phase': wave_shape,
+            },
+            capacity=capacity,
+        )
 
         self.harmonic_depth = 0.0
         self.solidification_index = 0.0
 
     def _pairwise_cross_coherence(self) -> float:
-        phases = [w.phase for w in self.waves]
-        if len(phases) < 2:
-            return 1.0
-        pair_values = []
-        for i in range(len(phases)):
-            for j in range(i + 1, len(phases)):
-                phase_diff = abs(phases[i] - phases[j])
-                pair_values.append(1.0 - (phase_diff % (2 * np.pi)) / (2 * np.pi))
-        return float(np.mean(pair_values)) if pair_values else 1.0
+        return pairwise_wrapped_coherence([w.phase for w in self.waves])
 
     def _harmonic_depth(self) -> float:
         freqs = [w.freq for w in self.waves if w.freq > 0]
@@ -95,62 +108,56 @@ class PolyphonyMonitor:
 
     def record(self):
         # Individual coherence approximated by phase stability
-        for idx, wave in enumerate(self.waves):
-            phase_diff = abs(wave.phase)
-            coherence = max(0.0, 1.0 - phase_diff / (2 * np.pi))
-            self.individual_coherence_history[idx].append(coherence)
-            self.phase_history[idx].append(wave.phase)
+        phases = np.array([wave.phase for wave in self.waves])
+        individual = np.maximum(0.0, 1.0 - np.abs(phases) / (2 * np.pi))
 
         system_coherence = self.universe.get_coherence()
         cross_coherence = self._pairwise_cross_coherence()
         harmonic_depth = self._harmonic_depth()
 
-        self.system_coherence_history.append(system_coherence)
-        self.cross_coherence_history.append(cross_coherence)
+        self.history.record(
+            system_coherence=system_coherence,
+            cross_coherence=cross_coherence,
+            individual_coherence=individual,
+            phase=phases,
+        )
 
         self.harmonic_depth = harmonic_depth
         self.solidification_index = (system_coherence + cross_coherence + harmonic_depth) / 3.0
 
     def final_metrics(self) -> PolyphonyMetrics:
-        individual_final = [history[-1] if history else 0.0 for history in self.individual_coherence_history]
+        individual_final = self.history.last('individual_coherence', default=np.zeros(len(self.waves))).tolist()
         return PolyphonyMetrics(
             mode=self.mode,
-            system_coherence_final=float(self.system_coherence_history[-1]) if self.system_coherence_history else 0.0,
-            system_coherence_avg=float(np.mean(self.system_coherence_history)) if self.system_coherence_history else 0.0,
-            cross_coherence_avg=float(np.mean(self.cross_coherence_history)) if self.cross_coherence_history else 0.0,
-            cross_coherence_peak=float(np.max(self.cross_coherence_history)) if self.cross_coherence_history else 0.0,
+            system_coherence_final=self.history.last('system_coherence'),
+            system_coherence_avg=self.history.mean('system_coherence'),
+            cross_coherence_avg=self.history.mean('cross_coherence'),
+            cross_coherence_peak=self.history.max('cross_coherence'),
             harmonic_depth=float(self.harmonic_depth),
             solidification_index=float(self.solidification_index),
             individual_final=individual_final,
         )
 
 
-def _create_universe() -> UniversalSymphony:
-    universe = UniversalSymphony()
-    for freq in [1.0, 2.0, 3.0, 4.0]:
-        particle = QuantumParticle(frequency=freq, depth=0)
-        particle.observe()
-        universe.add(particle)
-    return universe
-
-
-def _inject_waves(
-    universe: UniversalSymphony,
-    frequencies: List[float],
-    phase: float = 0.0,
-) -> List[QuantumParticle]:
-    observer = Consciousness(frequency=7.83)
-    waves = []
-    for freq in frequencies:
-        wave = observer.inject_frequency(
-            symphony=universe,
-            frequency=freq,
-            amplitude=1.0,
-            phase=phase,
-            auto_observe=True,
-        )
-        waves.append(wave)
-    return waves
+def _progress(monitor: PolyphonyMonitor, step: ScenarioStep) -> str:
+    return (
+        f"  Iteration {step.iteration + 1:4d}: System={monitor.system_coherence_history[-1]:.4f}, "
+        f"Cross={monitor.cross_coherence_history[-1]:.4f}"
+    )
+
+
+def polyphony_scenario(frequencies: List[float], mode: str, iterations: int = 500, seed=None) -> ScenarioSpec:
+    """Injected waves locked to their own mean phase every 5 iterations."""
+    return ScenarioSpec(
+        name=mode,
+        iterations=iterations,
+        monitor=partial(PolyphonyMonitor, mode=mode, capacity=iterations),
+        word_frequencies=frequencies,
+        lock_every=5,
+        lock_to_waves=True,
+        progress=_progress,
+        seed=seed,
+    )
 
 
 def run_dyad_test(iterations: int = 500) -> PolyphonyMonitor:
@@ -159,25 +166,7 @@ def run_dyad_test(iterations: int = 500) -> PolyphonyMonitor:
     print("TEST 1: DYAD (Root + Fifth) — 8 Hz + 12 Hz")
     print("=" * 70)
 
-    universe = _create_universe()
-    waves = _inject_waves(universe, [8.0, 12.0])
-    monitor = PolyphonyMonitor(universe, waves, mode="dyad")
-
-    for iteration in range(iterations):
-        universe.apply_decoherence(entropy_factor=0.002)
-        if iteration % 5 == 0:
-            avg_phase = float(np.mean([w.phase for w in waves]))
-            for wave in waves:
-                wave.phase = avg_phase
-                wave.observe()
-        monitor.record()
-        if (iteration + 1) % 100 == 0:
-            print(
-                f"  Iteration {iteration + 1:4d}: System={monitor.system_coherence_history[-1]:.4f}, "
-                f"Cross={monitor.cross_coherence_history[-1]:.4f}"
-            )
-
-    return monitor
+    return run_scenario(polyphony_scenario([8.0, 12.0], "dyad", iterations)).monitor
 
 
 def run_triad_test(iterations: int = 500) -> PolyphonyMonitor:
@@ -186,25 +175,7 @@ def run_triad_test(iterations: int = 500) -> PolyphonyMonitor:
     print("TEST 2: TRIAD (Root + Third + Fifth) — 8 Hz + 10 Hz + 12 Hz")
     print("=" * 70)
 
-    universe = _create_universe()
-    waves = _inject_waves(universe, [8.0, 10.0, 12.0])
-    monitor = PolyphonyMonitor(universe, waves, mode="triad")
-
-    for iteration in range(iterations):
-        universe.apply_decoherence(entropy_factor=0.002)
-        if iteration % 5 == 0:
-            avg_phase = float(np.mean([w.phase for w in waves]))
-            for wave in waves:
-                wave.phase = avg_phase
-                wave.observe()
-        monitor.record()
-        if (iteration + 1) % 100 == 0:
-            print(
-                f"  Iteration {iteration + 1:4d}: System={monitor.system_coherence_history[-1]:.4f}, "
-                f"Cross={monitor.cross_coherence_history[-1]:.4f}"
-            )
-
-    return monitor
+    return run_scenario(polyphony_scenario([8.0, 10.0, 12.0], "triad", iterations)).monitor
 
 
 def visualize_results(dyad: PolyphonyMonitor, triad: PolyphonyMonitor):
@@ -21,6 +21,10 @@ Implementation:
 5. Compare:
    - Independent councils (baseline)
    - Federated councils (with hysteresis)
+6. The same run scales to hundreds of councils over any federation
+   topology (complete, ring, tree, gossip; see federation.py)
+7. Asynchronous councils exchanging medians over a simulated network
+   with latency, jitter and drops (see async_federation.py)
 
 Author: Gregory Ward with Lumen
 Date: February 5, 2026
@@ -28,26 +32,31 @@ Date: February 5, 2026
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from dataclasses import asdict, dataclass
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 import json
 import numpy as np
 import matplotlib.pyplot as plt
 
-from unity_script import QuantumParticle, UniversalSymphony
+from coherence_metrics import pairwise_exp_coherence
+from async_federation import SimulatedLink, run_async_federation
+from council_bank import CouncilBank, LaggedTrust, MisalignmentDecay, alignment_scores
+from ensemble import UniverseEnsemble
+from federation import FederationTopology, NWayFederation
+from history_recorder import HistoryRecorder, history_column
+from observer_schedule import Constant, Drift, Schedule, stack
+from result_cache import ResultCache
+from unity_script import UniversalSymphony
 
 
-def _create_universe(offset: float = 0.0) -> Tuple[UniversalSymphony, List[QuantumParticle]]:
-    """Create a universe with a triad of frequencies."""
-    universe = UniversalSymphony()
-    waves = []
-    for freq in [8.0 + offset, 10.0 + offset, 12.0 + offset]:
-        wave = QuantumParticle(frequency=freq, depth=0)
-        wave.observe()
-        universe.add(wave)
-        waves.append(wave)
-    return universe, waves
+TRIAD = np.array([8.0, 10.0, 12.0])
+TRIAD_OFFSET = 0.1  # each council's universe is detuned from the previous one, for autonomy
+INITIAL_TRUST = [0.333, 0.333, 0.334]
+
+# Seeded federation runs are restored from the cache while their code is unchanged
+CACHE = ResultCache()
+SEED = 42
 
 
 @dataclass
@@ -62,15 +71,33 @@ class HierarchyMetrics:
     consensus_index: float
     trust_scores_final: List[List[float]]
     federation_sync_index: float
+    councils: int = 2
+    topology: str = "complete"
+    federation_spread_final: float = 0.0
 
 
 class TrustHysteresisCouncil:
-    """Council with hysteresis-lagged trust updates."""
+    """Council with hysteresis-lagged trust updates (a single-row CouncilBank)."""
 
     def __init__(self, trust_scores: List[float], hysteresis_coeff: float = 0.1):
-        self.trust_scores = np.array(trust_scores, dtype=float)
-        self.trust_scores_target = np.array(trust_scores, dtype=float)
-        self.hysteresis_coeff = hysteresis_coeff
+        self.bank = CouncilBank(
+            trust_scores,
+            floor=0.02,
+            decay=MisalignmentDecay(),
+            hysteresis=LaggedTrust(hysteresis_coeff),
+        )
+
+    @property
+    def trust_scores(self) -> np.ndarray:
+        return self.bank.trust[0]
+
+    @property
+    def trust_scores_target(self) -> np.ndarray:
+        return self.bank.target[0]
+
+    @property
+    def hysteresis_coeff(self) -> float:
+        return self.bank.hysteresis.coeff
 
     def update(
         self,
@@ -79,39 +106,26 @@ class TrustHysteresisCouncil:
         decay_rate: float = 0.02,
     ):
         """Update trust target, then apply hysteresis lag."""
-        alignments = np.array(alignments, dtype=float)
-
-        # Calculate target trust (without hysteresis)
-        growth = learning_rate * alignments
-        decay = decay_rate * (1.0 - alignments)
-
-        self.trust_scores_target = (
-            (1.0 - learning_rate) * self.trust_scores_target + growth - decay
-        )
-        self.trust_scores_target = np.clip(self.trust_scores_target, 0.02, 1.0)
-        self.trust_scores_target = self.trust_scores_target / float(
-            np.sum(self.trust_scores_target)
-        )
-
-        # Apply hysteresis: actual weights lag behind target
-        self.trust_scores = (
-            (1.0 - self.hysteresis_coeff) * self.trust_scores
-            + self.hysteresis_coeff * self.trust_scores_target
-        )
-        self.trust_scores = np.clip(self.trust_scores, 0.02, 1.0)
-        self.trust_scores = self.trust_scores / float(np.sum(self.trust_scores))
+        self.bank.decay.rate = decay_rate
+        self.bank.update(alignments, learning_rate=learning_rate)
 
     def weighted_phase(self, phases: List[float]) -> float:
-        phases = np.array(phases, dtype=float)
-        return float(np.sum(phases * self.trust_scores))
+        return float(self.bank.weighted_phase(phases)[0])
 
 
 class FederationProtocol:
-    """Manages phase alignment between two councils."""
+    """Manages phase alignment between two councils (a two-council NWayFederation)."""
 
     def __init__(self, sync_strength: float = 0.02):
-        self.sync_strength = sync_strength
-        self.federation_sync_history: List[float] = []
+        self.federation = NWayFederation(FederationTopology.complete(2), sync_strength)
+
+    @property
+    def sync_strength(self) -> float:
+        return self.federation.sync_strength
+
+    @property
+    def federation_sync_history(self) -> List[float]:
+        return self.federation.history['sync'].tolist()
 
     def reconcile_phases(
         self,
@@ -119,261 +133,254 @@ class FederationProtocol:
         phases_b: List[float],
     ) -> Tuple[List[float], List[float]]:
         """Apply federation synchronization to bring phases closer."""
-        phases_a = np.array(phases_a, dtype=float)
-        phases_b = np.array(phases_b, dtype=float)
-
-        # Federation: nudge each council toward the other's median phase
-        median_a = float(np.median(phases_a))
-        median_b = float(np.median(phases_b))
-
-        # Correction: each council moves partially toward the other's median
-        corrected_a = phases_a + self.sync_strength * (median_b - median_a)
-        corrected_b = phases_b + self.sync_strength * (median_a - median_b)
+        corrected_a, corrected_b = self.federation.reconcile([phases_a, phases_b])
+        return list(corrected_a), list(corrected_b)
 
-        # Measure federation sync: coherence of the two medians
-        phase_diff = abs(median_a - median_b)
-        sync_score = float(np.exp(-phase_diff))
-        self.federation_sync_history.append(sync_score)
 
-        return list(corrected_a), list(corrected_b)
+def _council_coherence(phases: np.ndarray) -> np.ndarray:
+    """pairwise_exp_coherence of every council's observers at once, shape (C,)."""
+    observers = phases.shape[1]
+    if observers < 2:
+        return np.ones(len(phases))
+    rows, cols = np.triu_indices(observers, k=1)
+    return np.sum(np.exp(-np.abs(phases[:, rows] - phases[:, cols])), axis=1) / len(rows)
 
 
 class HierarchyMonitor:
-    def __init__(self, universe_a: UniversalSymphony, universe_b: UniversalSymphony, mode: str):
-        self.universe_a = universe_a
-        self.universe_b = universe_b
-        self.mode = mode
-
-        self.system_coherence_a_history: List[float] = []
-        self.system_coherence_b_history: List[float] = []
-        self.council_cross_coherence_history: List[float] = []
-        self.cross_federation_coherence_history: List[float] = []
-        self.consensus_index_history: List[float] = []
-        self.autonomy_index_history: List[float] = []
-
-    @staticmethod
-    def _pairwise_cross_coherence(phases: List[float]) -> float:
-        """Calculate mean pairwise phase coherence."""
-        if len(phases) < 2:
-            return 1.0
-        pair_values = []
-        for i in range(len(phases)):
-            for j in range(i + 1, len(phases)):
-                phase_diff = abs(phases[i] - phases[j])
-                coherence = float(np.exp(-phase_diff))
-                pair_values.append(coherence)
-        return float(np.mean(pair_values)) if pair_values else 1.0
-
-    def record_state(
+    """
+    Per-iteration metrics of C federated councils.
+
+    Args:
+        universes: One universe per council, or a UniverseEnsemble whose
+            replicas are the councils' universes
+        mode: Label for the run
+        capacity: Expected number of iterations
+    """
+
+    system_coherence_history = history_column('system_coherence', transpose=True)
+    council_cross_coherence_history = history_column('council_cross_coherence')
+    cross_federation_coherence_history = history_column('cross_federation_coherence')
+    consensus_index_history = history_column('consensus_index')
+    autonomy_index_history = history_column('autonomy_index')
+
+    def __init__(
         self,
-        phases_a: List[float],
-        phases_b: List[float],
-        alignment_a: float,
-        alignment_b: float,
+        universes: Union[Sequence[UniversalSymphony], UniverseEnsemble],
+        mode: str,
+        capacity: Optional[int] = None,
     ):
-        """Record system state at this iteration."""
-        # Coherence within each universe
-        coh_a = float(self.universe_a.get_coherence())
-        coh_b = float(self.universe_b.get_coherence())
-        self.system_coherence_a_history.append(coh_a)
-        self.system_coherence_b_history.append(coh_b)
-
-        # Within-council cross-coherence
-        council_coh = (self._pairwise_cross_coherence(phases_a) + self._pairwise_cross_coherence(phases_b)) / 2.0
-        self.council_cross_coherence_history.append(council_coh)
-
-        # Cross-federation coherence (between the two universes' phases)
-        all_phases = phases_a + phases_b
-        cross_fed_coh = self._pairwise_cross_coherence(all_phases)
-        self.cross_federation_coherence_history.append(cross_fed_coh)
-
-        # Consensus index: how aligned are observers within their councils?
-        consensus_index = (alignment_a + alignment_b) / 2.0
-        self.consensus_index_history.append(consensus_index)
-
-        # Autonomy index: how divergent are the two councils?
-        # Higher autonomy = lower cross-council coherence
-        autonomy = 1.0 - cross_fed_coh
-        self.autonomy_index_history.append(autonomy)
-
-    def finalize(
-        self,
-        council_a: TrustHysteresisCouncil,
-        council_b: TrustHysteresisCouncil,
-        federation: FederationProtocol,
-    ) -> HierarchyMetrics:
+        self.universes = universes
+        self.mode = mode
+        councils = universes.replicas if isinstance(universes, UniverseEnsemble) else len(universes)
+
+        self.history = HistoryRecorder(
+            {
+                'system_coherence': (np.float64, (councils,)),
+                'council_cross_coherence': np.float64,
+                'cross_federation_coherence': np.float64,
+                'consensus_index': np.float64,
+                'autonomy_index': np.float64,
+            },
+            capacity=capacity,
+        )
+
+    @property
+    def system_coherence_a_history(self) -> np.ndarray:
+        return self.system_coherence_history[0]
+
+    @property
+    def system_coherence_b_history(self) -> np.ndarray:
+        return self.system_coherence_history[-1]
+
+    def _system_coherence(self) -> np.ndarray:
+        if isinstance(self.universes, UniverseEnsemble):
+            return self.universes.get_coherence()
+        return np.array([universe.get_coherence() for universe in self.universes], dtype=float)
+
+    def record_state(self, phases, alignments):
+        """Record system state for (C, M) observer phases and (C,) mean alignments."""
+        phases = np.asarray(phases, dtype=float)
+
+        # Cross-federation coherence (between all councils' phases)
+        cross_fed_coh = pairwise_exp_coherence(phases)
+
+        self.history.record(
+            system_coherence=self._system_coherence(),
+            # Within-council cross-coherence
+            council_cross_coherence=float(np.mean(_council_coherence(phases))),
+            cross_federation_coherence=cross_fed_coh,
+            # Consensus index: how aligned are observers within their councils?
+            consensus_index=float(np.mean(alignments)),
+            # Autonomy index: higher autonomy = lower cross-council coherence
+            autonomy_index=1.0 - cross_fed_coh,
+        )
+
+    def finalize(self, councils: CouncilBank, federation: NWayFederation) -> HierarchyMetrics:
         """Compute final metrics."""
+        coherence = self.history.mean('system_coherence')
         return HierarchyMetrics(
             mode=self.mode,
-            system_coherence_a_avg=float(np.mean(self.system_coherence_a_history)),
-            system_coherence_b_avg=float(np.mean(self.system_coherence_b_history)),
-            system_coherence_avg=float(
-                (np.mean(self.system_coherence_a_history) + np.mean(self.system_coherence_b_history)) / 2.0
-            ),
-            council_cross_coherence_avg=float(np.mean(self.council_cross_coherence_history)),
-            cross_federation_coherence_avg=float(np.mean(self.cross_federation_coherence_history)),
-            autonomy_index=float(np.mean(self.autonomy_index_history)),
-            consensus_index=float(np.mean(self.consensus_index_history)),
-            trust_scores_final=[
-                list(council_a.trust_scores),
-                list(council_b.trust_scores),
-            ],
-            federation_sync_index=float(np.mean(federation.federation_sync_history)) if federation.federation_sync_history else 0.0,
+            system_coherence_a_avg=float(coherence[0]),
+            system_coherence_b_avg=float(coherence[-1]),
+            system_coherence_avg=float(np.mean(coherence)),
+            council_cross_coherence_avg=self.history.mean('council_cross_coherence'),
+            cross_federation_coherence_avg=self.history.mean('cross_federation_coherence'),
+            autonomy_index=self.history.mean('autonomy_index'),
+            consensus_index=self.history.mean('consensus_index'),
+            trust_scores_final=councils.trust.tolist(),
+            federation_sync_index=federation.sync_index,
+            councils=councils.councils,
+            topology=federation.topology.name,
+            federation_spread_final=federation.history.last('spread'),
         )
 
 
-def _observer_phases_independent(iteration: int, council: int) -> Tuple[float, float, float]:
-    """Generate observer phases for independent council (no coupling)."""
-    if council == 0:
-        phase_a = 0.0 + 0.02 * np.sin(iteration / 10.0)
-        phase_b = 0.0 + 0.02 * np.cos(iteration / 12.0)
-        phase_c = 0.08 * np.sin(iteration / 8.0)
-    else:
-        # Slightly offset independent council
-        phase_a = 0.1 + 0.02 * np.sin(iteration / 10.0)
-        phase_b = 0.1 + 0.02 * np.cos(iteration / 12.0)
-        phase_c = 0.1 + 0.08 * np.sin(iteration / 8.0)
-    return phase_a, phase_b, phase_c
-
-
-def _observer_phases_federated(iteration: int, council: int) -> Tuple[float, float, float]:
-    """Generate observer phases for federated council (with cross-council coupling)."""
-    # Both councils oscillate around central tendency
-    base_phase = 0.03 * np.sin(iteration / 20.0)
-    
-    if council == 0:
-        phase_a = base_phase + 0.02 * np.sin(iteration / 10.0)
-        phase_b = base_phase + 0.02 * np.cos(iteration / 12.0)
-        phase_c = base_phase + 0.08 * np.sin(iteration / 8.0)
-    else:
-        phase_a = base_phase + 0.02 * np.sin(iteration / 10.0 + 0.5)
-        phase_b = base_phase + 0.02 * np.cos(iteration / 12.0 + 0.5)
-        phase_c = base_phase + 0.08 * np.sin(iteration / 8.0 + 0.5)
-    return phase_a, phase_b, phase_c
-
-
-def _alignment_scores(phases: List[float], consensus_phase: float) -> float:
-    """Compute mean alignment score."""
-    scores = []
-    for phase in phases:
-        alignment = 1.0 - min(1.0, abs(phase - consensus_phase) / (2 * np.pi))
-        scores.append(alignment)
-    return float(np.mean(scores))
-
-
-def run_independent_councils(iterations: int = 500) -> HierarchyMetrics:
-    """Independent councils: no federation, no synchronization."""
-    universe_a, waves_a = _create_universe(offset=0.0)
-    universe_b, waves_b = _create_universe(offset=0.1)
-
-    council_a = TrustHysteresisCouncil([0.333, 0.333, 0.334], hysteresis_coeff=0.1)
-    council_b = TrustHysteresisCouncil([0.333, 0.333, 0.334], hysteresis_coeff=0.1)
-
-    # No federation for independent mode
-    federation = FederationProtocol(sync_strength=0.0)
-
-    monitor = HierarchyMonitor(universe_a, universe_b, "independent")
+def _observer_phases_independent(councils: int) -> Schedule:
+    """Observer phases of independent councils (no coupling); (T, C, 3) on iterations[:, None]."""
+    # Each council is offset by 0.1 from the previous one
+    offset = Constant(0.1 * np.arange(councils))
+    return stack(
+        offset + Drift(0.02, 10.0),
+        offset + Drift(0.02, 12.0, wave=np.cos),
+        offset + Drift(0.08, 8.0),
+    )
+
+
+def _observer_phases_federated(councils: int) -> Schedule:
+    """Observer phases of federated councils (with cross-council coupling); (T, C, 3) on iterations[:, None]."""
+    # All councils oscillate around a central tendency, each 0.5 rad further along
+    base_phase = Drift(0.03, 20.0)
+    shift = 0.5 * np.arange(councils)
+    return stack(
+        base_phase + Drift(0.02, 10.0, shift),
+        base_phase + Drift(0.02, 12.0, shift, wave=np.cos),
+        base_phase + Drift(0.08, 8.0, shift),
+    )
+
+
+def _council_observer_phases(iteration: int, council: int) -> np.ndarray:
+    """One council's federated observer phases, shape (3,)."""
+    return _observer_phases_federated(council + 1)(iteration)[council]
+
+
+def run_federation(
+    councils: int = 2,
+    iterations: int = 500,
+    topology: Optional[FederationTopology] = None,
+    sync_strength: float = 0.02,
+    reconcile_every: int = 8,
+    observer_phases: Callable[[int], Schedule] = _observer_phases_federated,
+    mode: str = "federated",
+    persistent: bool = False,
+    verbose: bool = True,
+    seed=SEED,
+) -> HierarchyMetrics:
+    """
+    C councils with hysteresis, each governing its own triad universe (one
+    replica of a UniverseEnsemble), reconciled over `topology` (complete by
+    default) every `reconcile_every` iterations. persistent=True carries
+    each council's federation corrections forward (see federation.py).
+    observer_phases(councils) is compiled to a (T, C, M) table up front.
+    Seeded runs are restored from CACHE when nothing they depend on changed.
+    """
+    topology = topology or FederationTopology.complete(councils)
+    params = {
+        "councils": councils,
+        "iterations": iterations,
+        "topology": [topology.name, topology.indptr, topology.indices],
+        "sync_strength": sync_strength,
+        "reconcile_every": reconcile_every,
+        "observer_phases": observer_phases.__qualname__,
+        "mode": mode,
+        "persistent": persistent,
+    }
+    metrics = CACHE.stage(
+        "trust_hysteresis_federation.run_federation",
+        lambda: asdict(_simulate_federation(
+            councils, iterations, topology, sync_strength, reconcile_every,
+            observer_phases, mode, persistent, verbose, seed,
+        )),
+        params,
+        seed,
+        sources=[_simulate_federation],
+    )
+    return HierarchyMetrics(**metrics)
+
+
+def _simulate_federation(
+    councils: int,
+    iterations: int,
+    topology: FederationTopology,
+    sync_strength: float,
+    reconcile_every: int,
+    observer_phases: Callable[[int], Schedule],
+    mode: str,
+    persistent: bool,
+    verbose: bool,
+    seed,
+) -> HierarchyMetrics:
+    triads = TRIAD + TRIAD_OFFSET * np.arange(councils)[:, None]
+    universes = UniverseEnsemble.from_frequencies(triads, replicas=councils, seed=seed)
+    bank = CouncilBank(
+        INITIAL_TRUST,
+        councils=councils,
+        learning_rate=0.05,
+        floor=0.02,
+        decay=MisalignmentDecay(0.02),
+        hysteresis=LaggedTrust(0.1),
+    )
+    federation = NWayFederation(topology, sync_strength, capacity=iterations, persistent=persistent)
+    monitor = HierarchyMonitor(universes, mode, capacity=iterations)
+    waves = np.arange(universes.size)
+    schedule = observer_phases(councils).table(np.arange(iterations)[:, None])
 
     for iteration in range(iterations):
-        # Apply decoherence
-        universe_a.apply_decoherence(entropy_factor=0.002)
-        universe_b.apply_decoherence(entropy_factor=0.002)
-
-        # Observer phases for both councils
-        phases_a = list(_observer_phases_independent(iteration, 0))
-        phases_b = list(_observer_phases_independent(iteration, 1))
+        universes.apply_decoherence(entropy_factor=0.002)
+        phases = schedule[iteration]
 
-        # No federation synchronization for independent mode
-        _ = federation.reconcile_phases(phases_a, phases_b)
+        if iteration % reconcile_every == 0:
+            phases = federation.reconcile(phases)
+        else:
+            phases = federation.apply(phases)
 
-        # Compute consensus phases
-        consensus_a = council_a.weighted_phase(phases_a)
-        consensus_b = council_b.weighted_phase(phases_b)
-
-        # Compute alignments
-        alignment_a = _alignment_scores(phases_a, consensus_a)
-        alignment_b = _alignment_scores(phases_b, consensus_b)
-
-        # Update trust with hysteresis
-        alignments_normalized_a = [min(1.0, max(0.0, 1.0 - abs(p - consensus_a) / (2 * np.pi))) for p in phases_a]
-        alignments_normalized_b = [min(1.0, max(0.0, 1.0 - abs(p - consensus_b) / (2 * np.pi))) for p in phases_b]
-        council_a.update(alignments_normalized_a, learning_rate=0.05, decay_rate=0.02)
-        council_b.update(alignments_normalized_b, learning_rate=0.05, decay_rate=0.02)
+        # Consensus, alignments and hysteresis trust update for every council
+        consensus = bank.weighted_phase(phases)
+        alignments = alignment_scores(phases, consensus)
+        bank.update(alignments)
 
         # Reinforce consensus phases
         if iteration % 4 == 0:
-            for wave in waves_a:
-                wave.phase = consensus_a
-                wave.observe()
-            for wave in waves_b:
-                wave.phase = consensus_b
-                wave.observe()
+            universes.lock_phase(waves, consensus)
 
-        # Record state
-        monitor.record_state(phases_a, phases_b, alignment_a, alignment_b)
+        monitor.record_state(phases, np.mean(alignments, axis=1))
 
-        if (iteration + 1) % 100 == 0:
-            print(f"  Independent - Iteration {iteration+1:4d}: Coh_A={monitor.system_coherence_a_history[-1]:.4f}, Coh_B={monitor.system_coherence_b_history[-1]:.4f}")
+        if verbose and (iteration + 1) % 100 == 0:
+            coherence = monitor.system_coherence_history[:, -1]
+            print(f"  {mode.capitalize()} - Iteration {iteration+1:4d}: Coh_A={coherence[0]:.4f}, Coh_B={coherence[-1]:.4f}")
 
-    return monitor.finalize(council_a, council_b, federation)
+    return monitor.finalize(bank, federation)
 
 
-def run_federated_councils(iterations: int = 500) -> HierarchyMetrics:
+def run_independent_councils(iterations: int = 500, councils: int = 2) -> HierarchyMetrics:
+    """Independent councils: no federation, no synchronization."""
+    # sync_strength 0 reconciles every iteration only to measure the sync index
+    return run_federation(
+        councils,
+        iterations,
+        sync_strength=0.0,
+        reconcile_every=1,
+        observer_phases=_observer_phases_independent,
+        mode="independent",
+    )
+
+
+def run_federated_councils(
+    iterations: int = 500,
+    councils: int = 2,
+    topology: Optional[FederationTopology] = None,
+) -> HierarchyMetrics:
     """Federated councils: active synchronization with hysteresis."""
-    universe_a, waves_a = _create_universe(offset=0.0)
-    universe_b, waves_b = _create_universe(offset=0.1)
-
-    council_a = TrustHysteresisCouncil([0.333, 0.333, 0.334], hysteresis_coeff=0.1)
-    council_b = TrustHysteresisCouncil([0.333, 0.333, 0.334], hysteresis_coeff=0.1)
-
-    # Federation with synchronization
-    federation = FederationProtocol(sync_strength=0.02)
-
-    monitor = HierarchyMonitor(universe_a, universe_b, "federated")
-
-    for iteration in range(iterations):
-        # Apply decoherence
-        universe_a.apply_decoherence(entropy_factor=0.002)
-        universe_b.apply_decoherence(entropy_factor=0.002)
-
-        # Observer phases for both councils
-        phases_a = list(_observer_phases_federated(iteration, 0))
-        phases_b = list(_observer_phases_federated(iteration, 1))
-
-        # Federation synchronization (every 8 iterations)
-        if iteration % 8 == 0:
-            phases_a, phases_b = federation.reconcile_phases(phases_a, phases_b)
-
-        # Compute consensus phases
-        consensus_a = council_a.weighted_phase(phases_a)
-        consensus_b = council_b.weighted_phase(phases_b)
-
-        # Compute alignments
-        alignment_a = _alignment_scores(phases_a, consensus_a)
-        alignment_b = _alignment_scores(phases_b, consensus_b)
-
-        # Update trust with hysteresis
-        alignments_normalized_a = [min(1.0, max(0.0, 1.0 - abs(p - consensus_a) / (2 * np.pi))) for p in phases_a]
-        alignments_normalized_b = [min(1.0, max(0.0, 1.0 - abs(p - consensus_b) / (2 * np.pi))) for p in phases_b]
-        council_a.update(alignments_normalized_a, learning_rate=0.05, decay_rate=0.02)
-        council_b.update(alignments_normalized_b, learning_rate=0.05, decay_rate=0.02)
-
-        # Reinforce consensus phases
-        if iteration % 4 == 0:
-            for wave in waves_a:
-                wave.phase = consensus_a
-                wave.observe()
-            for wave in waves_b:
-                wave.phase = consensus_b
-                wave.observe()
-
-        # Record state
-        monitor.record_state(phases_a, phases_b, alignment_a, alignment_b)
-
-        if (iteration + 1) % 100 == 0:
-            print(f"  Federated - Iteration {iteration+1:4d}: Coh_A={monitor.system_coherence_a_history[-1]:.4f}, Coh_B={monitor.system_coherence_b_history[-1]:.4f}")
-
-    return monitor.finalize(council_a, council_b, federation)
+    return run_federation(councils, iterations, topology=topology)
 
 
 def main():
@@ -400,6 +407,36 @@ def main():
     print(f"  Federation Sync Index: {federated_metrics.federation_sync_index:.4f}")
     print()
 
+    print("Federation convergence at scale (200 councils, persistent, sync 0.2)...")
+    for topology in (
+        FederationTopology.complete(200),
+        FederationTopology.ring(200, reach=2),
+        FederationTopology.tree(200, branching=3),
+        FederationTopology.gossip(200, degree=4, seed=42),
+    ):
+        scaled = run_federation(200, iterations=500, topology=topology, sync_strength=0.2, reconcile_every=1,
+                                persistent=True, verbose=False)
+        print(f"  {topology.name:>8}: sync={scaled.federation_sync_index:.4f}, "
+              f"median spread={scaled.federation_spread_final:.4f}, "
+              f"cross-federation={scaled.cross_federation_coherence_avg:.4f}")
+    print()
+
+    print("Asynchronous federation under network delay (20 councils, ring, 1 s each)...")
+    for latency, jitter, drop_rate in ((0.0, 0.0, 0.0), (0.01, 0.005, 0.0), (0.05, 0.02, 0.1), (0.05, 0.02, 0.5)):
+        link = SimulatedLink(latency=latency, jitter=jitter, drop_rate=drop_rate, seed=42)
+        result = run_async_federation(
+            FederationTopology.ring(20),
+            _council_observer_phases,
+            link=link,
+            duration=1.0,
+            tick_intervals=np.linspace(0.002, 0.01, 20),
+            sync_strength=0.2,
+        )
+        print(f"  latency={latency:.3f}s jitter={jitter:.3f}s drop={drop_rate:.1f}: "
+              f"spread={result.final_spread:.4f}, sync={result.history.mean('sync'):.4f}, "
+              f"throughput={result.throughput:.0f} ticks/s, delay={1000 * result.mean_delay:.1f} ms")
+    print()
+
     # Prepare visualization
     fig, axes = plt.subplots(2, 3, figsize=(14, 8))
     fig.suptitle("v1.1 Hierophant Phase: Trust Hysteresis & Federation", fontsize=14, fontweight="bold")
@@ -28,13 +28,24 @@ Date: February 4, 2026
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
 import json
 import numpy as np
 import matplotlib.pyplot as plt
 
-from unity_script import Consciousness, QuantumParticle, UniversalSymphony
+from coherence_metrics import pairwise_wrapped_coherence
+from council_bank import CouncilBank, alignment_scores
+from experiment_runner import ScenarioSpec, ScenarioStep, run_cached_scenario
+from history_recorder import HistoryRecorder, history_column
+from observer_schedule import Drift, Window, stack
+from result_cache import ResultCache
+from unity_script import QuantumParticle, UniversalSymphony
+
+# Seeded councils are restored from the cache while their code is unchanged
+CACHE = ResultCache()
+SEED = 42
 
 
 @dataclass
@@ -49,141 +60,132 @@ class CouncilMetrics:
 
 
 class TrustWeightedCouncil:
+    """One trust-weighted council (a single-row CouncilBank)."""
+
     def __init__(self, trust_scores: List[float]):
-        self.trust_scores = np.array(trust_scores, dtype=float)
+        self.bank = CouncilBank(trust_scores, floor=0.05)
+
+    @property
+    def trust_scores(self) -> np.ndarray:
+        return self.bank.trust[0]
 
     def update(self, alignments: List[float], learning_rate: float = 0.05):
-        alignments = np.array(alignments, dtype=float)
-        self.trust_scores = (1.0 - learning_rate) * self.trust_scores + learning_rate * alignments
-        self.trust_scores = np.clip(self.trust_scores, 0.05, 1.0)
-        self.trust_scores = self.trust_scores / float(np.sum(self.trust_scores))
+        self.bank.update(alignments, learning_rate=learning_rate)
 
     def weighted_phase(self, phases: List[float]) -> float:
-        phases = np.array(phases, dtype=float)
-        return float(np.sum(phases * self.trust_scores))
+        return float(self.bank.weighted_phase(phases)[0])
 
 
 class CouncilMonitor:
-    def __init__(self, universe: UniversalSymphony, waves: List[QuantumParticle], mode: str):
+    system_coherence_history = history_column('system_coherence')
+    cross_coherence_history = history_column('cross_coherence')
+    consensus_index_history = history_column('consensus_index')
+    trust_history = history_column('trust')
+
+    def __init__(
+        self,
+        universe: UniversalSymphony,
+        waves: List[QuantumParticle],
+        mode: str,
+        observers: int,
+        capacity: Optional[int] = None,
+    ):
         self.universe = universe
         self.waves = waves
         self.mode = mode
 
-        self.system_coherence_history: List[float] = []
-        self.cross_coherence_history: List[float] = []
-        self.consensus_index_history: List[float] = []
-        self.trust_history: List[List[float]] = []
-
-    @staticmethod
-    def _pairwise_cross_coherence(phases: List[float]) -> float:
-        if len(phases) < 2:
-            return 1.0
-        pair_values = []
-        for i in range(len(phases)):
-            for j in range(i + 1, len(phases)):
-                phase_diff = abs(phases[i] - phases[j])
-                pair_values.append(1.0 - (phase_diff % (2 * np.pi)) / (2 * np.pi))
-        return float(np.mean(pair_values)) if pair_values else 1.0
+        self.history = HistoryRecorder(
+            {
+                'system_coherence': np.float64,
+                'cross_coherence': np.float64,
+                'consensus_index': np.float64,
+                'trust': (np.float64, (observers,)),
+            },
+            capacity=capacity,
+        )
 
     def record(self, consensus_index: float, trust_scores: List[float]):
-        self.system_coherence_history.append(self.universe.get_coherence())
         phases = [w.phase for w in self.waves]
-        self.cross_coherence_history.append(self._pairwise_cross_coherence(phases))
-        self.consensus_index_history.append(consensus_index)
-        self.trust_history.append(list(trust_scores))
+        self.history.record(
+            system_coherence=self.universe.get_coherence(),
+            cross_coherence=pairwise_wrapped_coherence(phases),
+            consensus_index=consensus_index,
+            trust=trust_scores,
+        )
 
     def final_metrics(self) -> CouncilMetrics:
+        history = self.history
         return CouncilMetrics(
             mode=self.mode,
-            system_coherence_avg=float(np.mean(self.system_coherence_history)) if self.system_coherence_history else 0.0,
-            system_coherence_final=float(self.system_coherence_history[-1]) if self.system_coherence_history else 0.0,
-            cross_coherence_avg=float(np.mean(self.cross_coherence_history)) if self.cross_coherence_history else 0.0,
-            cross_coherence_peak=float(np.max(self.cross_coherence_history)) if self.cross_coherence_history else 0.0,
-            consensus_index=float(np.mean(self.consensus_index_history)) if self.consensus_index_history else 0.0,
-            trust_scores_final=self.trust_history[-1] if self.trust_history else [],
-        )
-
-
-def _create_universe() -> UniversalSymphony:
-    universe = UniversalSymphony()
-    for freq in [1.0, 2.0, 3.0, 4.0]:
-        particle = QuantumParticle(frequency=freq, depth=0)
-        particle.observe()
-        universe.add(particle)
-    return universe
-
-
-def _inject_triad(universe: UniversalSymphony) -> List[QuantumParticle]:
-    observer = Consciousness(frequency=7.83)
-    freqs = [8.0, 10.0, 12.0]
-    waves = []
-    for freq in freqs:
-        wave = observer.inject_frequency(
-            symphony=universe,
-            frequency=freq,
-            amplitude=1.0,
-            phase=0.0,
-            auto_observe=True,
+            system_coherence_avg=history.mean('system_coherence'),
+            system_coherence_final=history.last('system_coherence'),
+            cross_coherence_avg=history.mean('cross_coherence'),
+            cross_coherence_peak=history.max('cross_coherence'),
+            consensus_index=history.mean('consensus_index'),
+            trust_scores_final=history.last('trust', default=np.zeros(0)).tolist(),
         )
-        waves.append(wave)
-    return waves
 
 
-def _observer_phases(iteration: int) -> Tuple[float, float, float]:
+_observer_phases = stack(
     # Two aligned observers
-    phase_a = 0.0 + 0.02 * np.sin(iteration / 9.0)
-    phase_b = 0.0 + 0.02 * np.cos(iteration / 11.0)
+    Drift(0.02, 9.0),
+    Drift(0.02, 11.0, wave=np.cos),
     # Adversarial observer injects discord every 60 iterations
-    phase_c = 0.4 if (iteration % 60) < 20 else 0.1 * np.sin(iteration / 5.0)
-    return phase_a, phase_b, phase_c
+    Window(60, 0, 20).where(0.4, Drift(0.1, 5.0)),
+)
 
 
-def _alignment_scores(phases: List[float], consensus_phase: float) -> List[float]:
-    scores = []
-    for phase in phases:
-        alignment = 1.0 - min(1.0, abs(phase - consensus_phase) / (2 * np.pi))
-        scores.append(alignment)
-    return scores
+class CouncilPolicy:
+    """Per-step consensus through the council (trust-weighted or plain mean)."""
 
+    def __init__(self, council: TrustWeightedCouncil, trust_weighted: bool):
+        self.council = council
+        self.trust_weighted = trust_weighted
 
-def run_council(iterations: int, trust_weighted: bool) -> CouncilMonitor:
-    universe = _create_universe()
-    waves = _inject_triad(universe)
-
-    monitor = CouncilMonitor(universe, waves, mode="trust" if trust_weighted else "equal")
-    council = TrustWeightedCouncil([1.0, 1.0, 1.0])
-
-    for iteration in range(iterations):
-        universe.apply_decoherence(entropy_factor=0.002)
-
-        phase_a, phase_b, phase_c = _observer_phases(iteration)
-        phases = [phase_a, phase_b, phase_c]
-
-        if trust_weighted:
-            consensus_phase = council.weighted_phase(phases)
+    def __call__(self, iteration: int, phases: np.ndarray) -> Tuple[float, float]:
+        if self.trust_weighted:
+            consensus_phase = self.council.weighted_phase(phases)
         else:
             consensus_phase = float(np.mean(phases))
 
-        alignments = _alignment_scores(phases, consensus_phase)
-        council.update(alignments)
-
-        if iteration % 4 == 0:
-            for wave in waves:
-                wave.phase = consensus_phase
-                wave.observe()
-
-        consensus_index = float(np.mean(alignments))
-        monitor.record(consensus_index, council.trust_scores.tolist())
-
-        if (iteration + 1) % 100 == 0:
-            print(
-                f"  Iteration {iteration + 1:4d} ({monitor.mode}): "
-                f"System={monitor.system_coherence_history[-1]:.4f}, "
-                f"Cross={monitor.cross_coherence_history[-1]:.4f}, "
-                f"Consensus={consensus_index:.4f}"
-            )
-
-    return monitor
+        alignments = alignment_scores(phases, consensus_phase)
+        self.council.update(alignments)
+        return consensus_phase, float(np.mean(alignments))
+
+    def record(self, monitor: CouncilMonitor, step: ScenarioStep):
+        monitor.record(step.alignment, self.council.trust_scores.tolist())
+
+
+def _progress(monitor: CouncilMonitor, step: ScenarioStep) -> str:
+    return (
+        f"  Iteration {step.iteration + 1:4d} ({monitor.mode}): "
+        f"System={monitor.system_coherence_history[-1]:.4f}, "
+        f"Cross={monitor.cross_coherence_history[-1]:.4f}, "
+        f"Consensus={step.alignment:.4f}"
+    )
+
+
+def council_scenario(iterations: int, trust_weighted: bool, seed=None) -> ScenarioSpec:
+    """Three observers (one adversarial) locking a shared triad every 4 iterations."""
+    mode = "trust" if trust_weighted else "equal"
+    policy = CouncilPolicy(TrustWeightedCouncil([1.0, 1.0, 1.0]), trust_weighted)
+    return ScenarioSpec(
+        name=mode,
+        iterations=iterations,
+        monitor=partial(CouncilMonitor, mode=mode, observers=len(policy.council.trust_scores), capacity=iterations),
+        record=policy.record,
+        observer_phases=_observer_phases,
+        policy=policy,
+        lock_every=4,
+        progress=_progress,
+        seed=seed,
+    )
+
+
+def run_council(iterations: int, trust_weighted: bool, seed=SEED) -> CouncilMonitor:
+    spec = council_scenario(iterations, trust_weighted, seed)
+    params = {"iterations": iterations, "trust_weighted": trust_weighted}
+    return run_cached_scenario(spec, CACHE, params, sources=[council_scenario]).monitor
 
 
 def visualize_results(equal: CouncilMonitor, trust: CouncilMonitor):
@@ -14,12 +14,15 @@ Date: February 4, 2026
 """
 
 import os
+from dataclasses import dataclass
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
-from typing import List, Optional
+from typing import Dict, List, Optional
 import time
 
+from mutation_journal import AppendDelta, ColumnDelta, CompactDelta, KillDelta, MutationJournal
+
 
 class TheOne:
     """
@@ -34,28 +37,423 @@ class TheOne:
         return "! (The One)"
 
 
+def _prefixed(prefix: str, state: dict) -> dict:
+    return {prefix + key: value for key, value in state.items()}
+
+
+def _unprefixed(prefix: str, state: dict) -> dict:
+    return {key[len(prefix):]: value for key, value in state.items() if key.startswith(prefix)}
+
+
+class SimulationClock:
+    """
+    Deterministic step clock (the default Omega clock).
+    Time only moves when the symphony ticks, so runs replay identically.
+    """
+    def __init__(self, start: float = 0.0):
+        self._now = float(start)
+
+    def now(self) -> float:
+        """Return the current simulated time."""
+        return self._now
+
+    def advance(self, dt: float):
+        """Move simulated time forward by dt."""
+        self._now += float(dt)
+
+    def __repr__(self):
+        return f"SimulationClock(t={self._now:.4f})"
+
+
+class WallClock:
+    """
+    Real-time clock for interactive runs.
+    Ticks do not move it; elapsed time is measured from creation.
+    """
+    def __init__(self):
+        self._origin = time.time()
+
+    def now(self) -> float:
+        """Return seconds elapsed since the clock was created."""
+        return time.time() - self._origin
+
+    def advance(self, dt: float):
+        """Wall time advances on its own; ticks are ignored."""
+        return None
+
+    def __repr__(self):
+        return f"WallClock(t={self.now():.4f})"
+
+
+PARTICLE_BLOCK_SIZE = 4096
+
+STREAM_UNIVERSE = 0
+STREAM_DECOHERENCE = 1
+STREAM_OBSERVATION = 2
+STREAM_WORKER = 3
+STREAM_CHILD = 4
+
+
+class RandomStreams:
+    """
+    SeedSequence-spawned generator hierarchy: universe -> purpose -> step -> block.
+    Every particle block draws from its own stream, so any split of blocks
+    across chunks or worker processes reproduces the serial result bit for bit.
+    """
+    def __init__(self, seed=None, block_size: int = PARTICLE_BLOCK_SIZE):
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+        self.block_size = int(block_size)
+        self.universe = np.random.default_rng(self.child(STREAM_UNIVERSE))
+
+    def child(self, *key: int) -> np.random.SeedSequence:
+        """Derive the SeedSequence at a path below this universe's root."""
+        root = self.seed_sequence
+        return np.random.SeedSequence(
+            root.entropy,
+            spawn_key=tuple(root.spawn_key) + tuple(int(k) for k in key),
+            pool_size=root.pool_size,
+        )
+
+    def block_generator(self, purpose: int, step: int, block: int) -> np.random.Generator:
+        """Generator owned by one particle block for one draw step."""
+        return np.random.default_rng(self.child(purpose, step, block))
+
+    def worker(self, worker_id: int) -> np.random.SeedSequence:
+        """Seed material for an external worker process."""
+        return self.child(STREAM_WORKER, worker_id)
+
+    def block_count(self, n: int) -> int:
+        return -(-int(n) // self.block_size)
+
+    def _draw(self, purpose: int, step: int, n: int, blocks, draw) -> np.ndarray:
+        if blocks is None:
+            blocks = range(self.block_count(n))
+        chunks = []
+        for block in blocks:
+            start = block * self.block_size
+            size = min(n, start + self.block_size) - start
+            if size > 0:
+                chunks.append(draw(self.block_generator(purpose, step, block), size))
+        return np.concatenate(chunks) if chunks else np.empty(0)
+
+    def normal(self, purpose: int, step: int, n: int, scale: float = 1.0, blocks=None) -> np.ndarray:
+        """Gaussian draws for particles [0, n), optionally only for some blocks."""
+        return self._draw(purpose, step, n, blocks, lambda g, size: g.normal(0.0, scale, size))
+
+    def uniform(self, purpose: int, step: int, n: int, blocks=None) -> np.ndarray:
+        """Uniform [0, 1) draws for particles [0, n), optionally only for some blocks."""
+        return self._draw(purpose, step, n, blocks, lambda g, size: g.random(size))
+
+    def state_dict(self) -> dict:
+        """Root seed material and the universe generator's position (JSON-able)."""
+        root = self.seed_sequence
+        entropy = root.entropy
+        return {
+            'entropy': int(entropy) if np.isscalar(entropy) else [int(e) for e in entropy],
+            'spawn_key': [int(k) for k in root.spawn_key],
+            'pool_size': int(root.pool_size),
+            'block_size': self.block_size,
+            'universe': self.universe.bit_generator.state,
+        }
+
+    def load_state_dict(self, state: dict):
+        """Restore in place; the universe Generator object keeps its identity."""
+        self.seed_sequence = np.random.SeedSequence(
+            state['entropy'], spawn_key=tuple(state['spawn_key']), pool_size=int(state['pool_size'])
+        )
+        self.block_size = int(state['block_size'])
+        self.universe.bit_generator.state = state['universe']
+
+
+def _optional_time(value) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+def _time_to_column(value) -> float:
+    return np.nan if value is None else float(value)
+
+
+def _read_only(values: np.ndarray) -> np.ndarray:
+    view = values.view()
+    view.flags.writeable = False
+    return view
+
+
+class ParticleColumns:
+    """
+    Columnar backing store for a symphony's particles.
+    Each particle owns one row (its slot); bulk operations work on whole columns.
+    Removed rows become tombstones until compact() squeezes them out; the
+    stable `id` column (always ascending) survives compaction.
+    fork() shares every column buffer with a new store; shared columns are
+    read-only views and each side copies a column on its first write.
+    """
+    DTYPES = {
+        'id': np.int64,
+        'alive': np.bool_,
+        'freq': np.float64,
+        'depth': np.int64,
+        'max_depth': np.int64,
+        'phase': np.float64,
+        'observed': np.bool_,
+        'superposition': np.float64,
+        'decoherence_time': np.float64,  # NaN means no time-based collapse
+        'created_at': np.float64,
+        'partner': np.int64,  # id of the entangled partner, -1 if none
+    }
+
+    def __init__(self, capacity: int = 16):
+        self.size = 0
+        self.next_id = 0
+        self.tombstones = 0
+        self.version = 0  # bumped on every write; lets summaries detect staleness
+        self.listener = None  # called after every write (the owning symphony's dirty hook)
+        self.journal: Optional[MutationJournal] = None  # logs deltas of every write when set
+        self._live_slots: Optional[np.ndarray] = None
+        self._shared: set = set()  # columns whose buffer a fork may still be reading
+        self.data = {name: np.empty(max(1, capacity), dtype=dtype) for name, dtype in self.DTYPES.items()}
+
+    @property
+    def capacity(self) -> int:
+        return len(self.data['freq'])
+
+    @property
+    def live_count(self) -> int:
+        return self.size - self.tombstones
+
+    def column(self, name: str, write: bool = False) -> np.ndarray:
+        """
+        Live view of the first `size` rows of a column (tombstones included).
+        Pass write=True to modify it: a column shared with a fork is copied first.
+        """
+        return (self.writable(name) if write else self.data[name])[:self.size]
+
+    def writable(self, name: str) -> np.ndarray:
+        """Whole backing array of a column, owned by this store."""
+        if name in self._shared:
+            self.data[name] = np.array(self.data[name])
+            self._shared.discard(name)
+        return self.data[name]
+
+    def _log_values(self, name: str, index):
+        """Journal a column's current values at `index` before they are overwritten."""
+        if self.journal is not None:
+            self.journal.record(ColumnDelta(name, index, np.array(self.data[name][index])))
+
+    def fork(self) -> 'ParticleColumns':
+        """
+        Store holding the same rows without copying them. Both stores keep
+        read-only views of the shared buffers until they write a column.
+        """
+        for name in self.DTYPES:
+            if name not in self._shared:
+                self.data[name] = _read_only(self.data[name])
+        self._shared = set(self.DTYPES)
+        clone = ParticleColumns.__new__(ParticleColumns)
+        clone.size = self.size
+        clone.next_id = self.next_id
+        clone.tombstones = self.tombstones
+        clone.version = self.version
+        clone.listener = None
+        clone.journal = None
+        clone._live_slots = self._live_slots
+        clone._shared = set(self.DTYPES)
+        clone.data = {name: _read_only(values) for name, values in self.data.items()}
+        return clone
+
+    def live(self):
+        """Index of live rows: a plain slice unless tombstones are present."""
+        if self.tombstones == 0:
+            return slice(0, self.size)
+        if self._live_slots is None:
+            self._live_slots = np.flatnonzero(self.column('alive'))
+        return self._live_slots
+
+    def live_slots(self) -> np.ndarray:
+        index = self.live()
+        return np.arange(self.size) if isinstance(index, slice) else index
+
+    def touch(self):
+        self.version += 1
+        if self.listener is not None:
+            self.listener()
+
+    def reserve(self, capacity: int):
+        """Grow every column geometrically so appends stay amortized O(1)."""
+        if capacity <= self.capacity:
+            return
+        new_capacity = max(capacity, 2 * self.capacity)
+        for name, values in self.data.items():
+            grown = np.empty(new_capacity, dtype=values.dtype)
+            grown[:self.size] = values[:self.size]
+            self.data[name] = grown
+        self._shared.clear()
+
+    def extend(self, particles: List['QuantumParticle']) -> range:
+        """Copy free particles into new rows and bind them to this store."""
+        start = self.size
+        stop = start + len(particles)
+        if self.journal is not None:
+            self.journal.record(AppendDelta(start, stop, self.next_id))
+        self.reserve(stop)
+        for name, field in _PARTICLE_FIELDS.items():
+            self.writable(name)[start:stop] = [field.read(p) for p in particles]
+        self.writable('id')[start:stop] = np.arange(self.next_id, self.next_id + len(particles))
+        self.writable('alive')[start:stop] = True
+        self.writable('partner')[start:stop] = -1
+        self.next_id += len(particles)
+        self.size = stop
+        self._live_slots = None
+        for slot, particle in enumerate(particles, start):
+            particle._store = self
+            particle._slot = slot
+        for particle in particles:
+            partner = particle._entangled_with
+            if partner is not None and partner._store is self:
+                self.link(particle._slot, partner._slot)
+        self.touch()
+        return range(start, stop)
+
+    def link(self, slot_a: int, slot_b: int):
+        """Record an entangled pair."""
+        ids = self.data['id']
+        self._log_values('partner', [slot_a, slot_b])
+        partner = self.writable('partner')
+        partner[slot_a] = ids[slot_b]
+        partner[slot_b] = ids[slot_a]
+
+    def slots_of(self, ids) -> np.ndarray:
+        """Map stable ids to current slots; -1 for ids that are gone."""
+        ids = np.asarray(ids, dtype=np.int64)
+        id_column = self.column('id')
+        slots = np.searchsorted(id_column, ids)
+        in_range = slots < self.size
+        found = np.zeros(ids.shape, dtype=bool)
+        found[in_range] = id_column[slots[in_range]] == ids[in_range]
+        found[found] = self.column('alive')[slots[found]]
+        return np.where(found, slots, -1)
+
+    def kill(self, slots: np.ndarray) -> int:
+        """Tombstone rows; returns how many were still alive."""
+        slots = np.unique(np.asarray(slots, dtype=np.int64))
+        slots = slots[self.column('alive')[slots]]
+        self.column('alive', write=True)[slots] = False
+        self.tombstones += len(slots)
+        self._live_slots = None
+        self.touch()
+        return len(slots)
+
+    def state_dict(self) -> dict:
+        """Counters plus views of the used rows of every column."""
+        state = {'size': self.size, 'next_id': self.next_id, 'tombstones': self.tombstones}
+        state.update({name: self.column(name) for name in self.DTYPES})
+        return state
+
+    def load_state_dict(self, state: dict):
+        """Replace every row with state_dict() output (handles must be rebound by the owner)."""
+        size = int(state['size'])
+        self.data = {name: np.empty(max(1, size), dtype=dtype) for name, dtype in self.DTYPES.items()}
+        for name in self.DTYPES:
+            self.data[name][:size] = state[name]
+        self._shared = set()
+        self.size = size
+        self.next_id = int(state['next_id'])
+        self.tombstones = int(state['tombstones'])
+        self._live_slots = None
+        self.touch()
+
+    def compact(self) -> np.ndarray:
+        """Squeeze out tombstones. Returns the old slots of the surviving rows."""
+        kept = self.live_slots()
+        count = len(kept)
+        for name in self.DTYPES:
+            values = self.writable(name)
+            values[:count] = values[kept]
+        self.size = count
+        self.tombstones = 0
+        self._live_slots = None
+        self.touch()
+        return kept
+
+
+class _Column:
+    """Particle attribute that lives in the symphony's columns once bound."""
+    def __init__(self, column: str, to_python=float, to_column=None):
+        self.column = column
+        self.to_python = to_python
+        self.to_column = to_column
+
+    def __set_name__(self, owner, name):
+        self.local = '_local' + name if name.startswith('_') else '_local_' + name
+
+    def read(self, particle) -> object:
+        """Current value in column representation, wherever it lives."""
+        value = self.__get__(particle)
+        return self.to_column(value) if self.to_column is not None else value
+
+    def __get__(self, particle, owner=None):
+        if particle is None:
+            return self
+        store = particle._store
+        if store is None:
+            return particle.__dict__[self.local]
+        return self.to_python(store.data[self.column][particle._slot])
+
+    def __set__(self, particle, value):
+        store = particle.__dict__.get('_store')
+        if store is None:
+            particle.__dict__[self.local] = value
+            return
+        if self.to_column is not None:
+            value = self.to_column(value)
+        store._log_values(self.column, [particle._slot])
+        store.writable(self.column)[particle._slot] = value
+        store.touch()
+
+
 class QuantumParticle:
     """
     Steps 5-6: Interference & Matter.
     Exists as a probability field until Observed.
     Implements the Quantum Observer Effect.
+    Once added to a symphony, the particle is a handle onto one row of its columns.
     """
+    freq = _Column('freq')
+    depth = _Column('depth', int)
+    max_depth = _Column('max_depth', int)
+    phase = _Column('phase')
+    is_observed = _Column('observed', bool)
+    _superposition_value = _Column('superposition')
+    decoherence_time = _Column('decoherence_time', _optional_time, _time_to_column)
+    _created_at = _Column('created_at')
+
     def __init__(
         self,
         frequency: float,
         depth: int = 0,
         max_depth: int = 6,
         decoherence_time: Optional[float] = None,
+        clock: Optional['SimulationClock'] = None,
+        rng: Optional[np.random.Generator] = None,
     ):
+        self._store: Optional[ParticleColumns] = None
+        self._slot = -1
         self.freq = frequency
         self.depth = depth
         self.max_depth = max_depth
         self.is_observed = False
-        self._superposition_value = np.random.uniform(0, 1)
+        # Without an explicit generator the legacy global np.random state is used
+        self._rng = rng
+        self._superposition_value = (rng if rng is not None else np.random).uniform(0, 1)
         self.sub_particles: List['QuantumParticle'] = []
         self.source = TheOne()  # Every particle contains the 1
         self.decoherence_time = decoherence_time
-        self._created_at = time.time()
+        # Particles share their symphony's clock; only the birth reading is kept
+        self.clock = clock
+        self._created_at = clock.now() if clock is not None else 0.0
         self._entangled_with: Optional['QuantumParticle'] = None
         self.phase = 0.0
     
@@ -77,20 +475,54 @@ class QuantumParticle:
         """Entangle two particles to share collapse outcome."""
         if partner is self:
             return
-        shared_value = np.random.uniform(0, 1)
+        shared_value = (self._rng if self._rng is not None else np.random).uniform(0, 1)
         self._superposition_value = shared_value
         partner._superposition_value = shared_value
         self._entangled_with = partner
         partner._entangled_with = self
+        if self._store is not None and self._store is partner._store:
+            self._store.link(self._slot, partner._slot)
         return self, partner
 
+    @classmethod
+    def _handle(cls, store: 'ParticleColumns', slot: int, clock=None, rng=None) -> 'QuantumParticle':
+        """Handle onto an existing row, skipping per-field initialization."""
+        particle = cls.__new__(cls)
+        particle._store = store
+        particle._slot = slot
+        particle._rng = rng
+        particle.sub_particles = []
+        particle.source = TheOne()
+        particle.clock = clock
+        particle._entangled_with = None
+        return particle
+
+    @property
+    def particle_id(self) -> Optional[int]:
+        """Stable id within the owning symphony (None while free)."""
+        if self._store is None:
+            return None
+        return int(self._store.data['id'][self._slot])
+
+    def _detach(self):
+        """Pull this particle's row back into plain attributes."""
+        values = {field.local: field.__get__(self) for field in _PARTICLE_FIELDS.values()}
+        self._store = None
+        self._slot = -1
+        self.__dict__.update(values)
+
     def maybe_decohere(self, now: Optional[float] = None) -> bool:
         """Time-based collapse without observation."""
         if self.is_observed:
             return False
         if self.decoherence_time is None:
             return False
-        current_time = now if now is not None else time.time()
+        if now is not None:
+            current_time = now
+        elif self.clock is not None:
+            current_time = self.clock.now()
+        else:
+            current_time = 0.0
         if current_time - self._created_at >= self.decoherence_time:
             self.observe()
             return True
@@ -112,8 +544,10 @@ class QuantumParticle:
         """
         if self.depth < self.max_depth:
             # Generate octave harmonics (2x and 3x parent frequency)
-            child_1 = QuantumParticle(self.freq * 2, self.depth + 1, self.max_depth)
-            child_2 = QuantumParticle(self.freq * 3, self.depth + 1, self.max_depth)
+            child_1 = QuantumParticle(self.freq * 2, self.depth + 1, self.max_depth,
+                                      clock=self.clock, rng=self._rng)
+            child_2 = QuantumParticle(self.freq * 3, self.depth + 1, self.max_depth,
+                                      clock=self.clock, rng=self._rng)
             self.sub_particles = [child_1, child_2]
             return self.sub_particles
         return None
@@ -123,6 +557,11 @@ class QuantumParticle:
         return f"Particle(f={self.freq:.2f}Hz, depth={self.depth}, {state})"
 
 
+_PARTICLE_FIELDS = {
+    field.column: field for field in vars(QuantumParticle).values() if isinstance(field, _Column)
+}
+
+
 class Consciousness:
     """
     Step 8-9: Complexity becomes Conscious.
@@ -250,7 +689,9 @@ class Consciousness:
         new_particle = QuantumParticle(
             frequency=frequency,
             depth=depth,
-            max_depth=symphony.entities[0].max_depth if symphony.entities else 6
+            max_depth=symphony.entities[0].max_depth if symphony.entities else 6,
+            clock=symphony.clock,
+            rng=symphony.streams.universe,
         )
         
         # Override default phase
@@ -266,52 +707,453 @@ class Consciousness:
         return new_particle
 
 
+@dataclass
+class SymphonySummary:
+    """
+    Aggregate state a universe publishes to its parent.
+    The spectrum folds every particle at a frequency into one complex
+    amplitude, so a parent can render and measure without touching particles.
+    """
+    count: int
+    observed_count: int
+    phasor_sum: complex
+    abs_freq_sum: float
+    abs_phase_sum: float
+    spectrum_freqs: np.ndarray
+    spectrum_amplitudes: np.ndarray
+
+    @classmethod
+    def from_columns(cls, freq: np.ndarray, phase: np.ndarray, observed: np.ndarray) -> 'SymphonySummary':
+        phasors = np.exp(1j * phase)
+        amps = np.where(observed, 1.0, 0.1) * phasors
+        freqs, inverse = np.unique(freq, return_inverse=True)
+        spectrum = np.bincount(inverse, weights=amps.real, minlength=len(freqs)) + \
+            1j * np.bincount(inverse, weights=amps.imag, minlength=len(freqs))
+        return cls(
+            count=len(freq),
+            observed_count=int(np.count_nonzero(observed)),
+            phasor_sum=complex(np.sum(phasors)),
+            abs_freq_sum=float(np.sum(np.abs(freq))),
+            abs_phase_sum=float(np.sum(np.abs(phase))),
+            spectrum_freqs=freqs,
+            spectrum_amplitudes=spectrum,
+        )
+
+    @classmethod
+    def combine(cls, parts: List['SymphonySummary']) -> 'SymphonySummary':
+        """Merge summaries; spectra are merged by frequency."""
+        freqs, inverse = np.unique(
+            np.concatenate([p.spectrum_freqs for p in parts]), return_inverse=True
+        )
+        amps = np.concatenate([p.spectrum_amplitudes for p in parts])
+        spectrum = np.bincount(inverse, weights=amps.real, minlength=len(freqs)) + \
+            1j * np.bincount(inverse, weights=amps.imag, minlength=len(freqs))
+        return cls(
+            count=sum(p.count for p in parts),
+            observed_count=sum(p.observed_count for p in parts),
+            phasor_sum=sum((p.phasor_sum for p in parts), 0j),
+            abs_freq_sum=sum(p.abs_freq_sum for p in parts),
+            abs_phase_sum=sum(p.abs_phase_sum for p in parts),
+            spectrum_freqs=freqs,
+            spectrum_amplitudes=spectrum,
+        )
+
+    @property
+    def coherence(self) -> float:
+        return abs(self.phasor_sum) / self.count if self.count else 1.0
+
+    def render(self, t: np.ndarray, chunk_elements: int = 1 << 22) -> np.ndarray:
+        """Interference pattern from the aggregated spectrum (one sine per frequency)."""
+        t = np.asarray(t, dtype=float)
+        flat_t = t.reshape(-1)
+        field = np.zeros_like(flat_t)
+        chunk = max(1, chunk_elements // max(1, flat_t.size))
+        for start in range(0, len(self.spectrum_freqs), chunk):
+            freqs = self.spectrum_freqs[start:start + chunk]
+            amps = self.spectrum_amplitudes[start:start + chunk]
+            rotation = np.exp(2j * np.pi * np.outer(freqs, flat_t))
+            field += (amps @ rotation).imag
+        return field.reshape(t.shape)
+
+
 class UniversalSymphony:
     """
     The 'Interactivity' Manager (The Octave Wave).
     Manages all oscillators across all depths.
+    Particle state lives in columnar arrays (ParticleColumns) so field-wide
+    operations are single NumPy calls; `entities` holds the particle handles.
+
+    Universes nest: each child publishes a cached SymphonySummary, and field-wide
+    measures (coherence, complexity, tick, rendering) of a parent cover its
+    whole subtree while costing O(children) once the children are clean.
     """
-    def __init__(self):
-        self.entities: List[QuantumParticle] = []
+    RENDER_CHUNK_ELEMENTS = 1 << 22  # particles x samples evaluated per render pass
+    COMPACT_RATIO = 0.5  # compact once this fraction of rows are tombstones
+
+    def __init__(self, clock: Optional[SimulationClock] = None, seed=None):
+        self.columns = ParticleColumns()
+        self._handles: Dict[int, QuantumParticle] = {}  # slot -> handle, created on first access
+        self._entities: Optional[List[QuantumParticle]] = []
         self.source = TheOne()
         self.omega_time = 0.0
+        self.clock = clock if clock is not None else SimulationClock()
+        self.streams = RandomStreams(seed)
+        self._decoherence_step = 0
+        self._observation_step = 0
+        self.parent: Optional['UniversalSymphony'] = None
+        self.children: List['UniversalSymphony'] = []
+        self._summary: Optional[SymphonySummary] = None
+        self._own_summary: Optional[SymphonySummary] = None
+        self._own_summary_version = -1
+        self.journal: Optional[MutationJournal] = None
+        self.columns.listener = self._mark_dirty
+
+    def _mark_dirty(self):
+        """Drop cached summaries up the parent chain (stops at the first dirty one)."""
+        node = self
+        while node is not None and node._summary is not None:
+            node._summary = None
+            node = node.parent
+
+    def add_child(self, child: 'UniversalSymphony') -> 'UniversalSymphony':
+        """Nest a universe below this one; its summary feeds this universe's measures."""
+        if child.parent is not None:
+            child.parent.remove_child(child)
+        child.parent = self
+        self.children.append(child)
+        self._mark_dirty()
+        return child
+
+    def spawn_child(self) -> 'UniversalSymphony':
+        """Create a nested universe that shares this clock and derives its seed from ours."""
+        seed = self.streams.child(STREAM_CHILD, len(self.children))
+        return self.add_child(UniversalSymphony(clock=self.clock, seed=seed))
+
+    def remove_child(self, child: 'UniversalSymphony'):
+        self.children.remove(child)
+        child.parent = None
+        self._mark_dirty()
+
+    def state_dict(self) -> dict:
+        """
+        Everything a bit-exact resume needs, as arrays and JSON-able values:
+        particle columns, Omega Time, clock reading, random stream positions
+        and nested universes (under 'child.<i>/' keys). Arrays are views.
+        """
+        state = {
+            'omega_time': self.omega_time,
+            'clock': self.clock.now() if isinstance(self.clock, SimulationClock) else None,
+            'decoherence_step': self._decoherence_step,
+            'observation_step': self._observation_step,
+            'children': len(self.children),
+        }
+        state.update(_prefixed('columns/', self.columns.state_dict()))
+        state.update(_prefixed('streams/', self.streams.state_dict()))
+        for index, child in enumerate(self.children):
+            state.update(_prefixed(f'child.{index}/', child.state_dict()))
+            state[f'child.{index}/shared_clock'] = child.clock is self.clock
+        return state
+
+    def load_state_dict(self, state: dict):
+        """
+        Restore state_dict() output in place. Handles of particles that are
+        still present are re-pointed, so references held elsewhere (a
+        monitored Word, say) stay valid; other rows get fresh handles.
+        """
+        columns = _unprefixed('columns/', state)
+        alive = np.asarray(columns['alive'], dtype=bool)
+        restored_ids = np.asarray(columns['id'])[alive]
+        handles = list(self._handles.values())
+        current_ids = np.array([handle.particle_id for handle in handles], dtype=np.int64)
+        kept = {}
+        for handle, particle_id, survives in zip(handles, current_ids.tolist(), np.isin(current_ids, restored_ids)):
+            if survives:
+                kept[particle_id] = handle
+            else:
+                handle._detach()
+
+        self.columns.load_state_dict(columns)
+        self.streams.load_state_dict(_unprefixed('streams/', state))
+        self._handles = {}
+        self._entities = None
+        if kept:
+            slots = self.columns.slots_of(list(kept))
+            for handle, slot in zip(kept.values(), slots.tolist()):
+                handle._slot = slot
+                handle._entangled_with = None
+                self._handles[slot] = handle
+            for slot in slots.tolist():
+                self._link_handle(slot)
+
+        self.omega_time = float(state['omega_time'])
+        if state['clock'] is not None and isinstance(self.clock, SimulationClock):
+            self.clock._now = float(state['clock'])
+        self._decoherence_step = int(state['decoherence_step'])
+        self._observation_step = int(state['observation_step'])
+
+        count = int(state['children'])
+        while len(self.children) > count:
+            self.remove_child(self.children[-1])
+        while len(self.children) < count:
+            shared = state[f'child.{len(self.children)}/shared_clock']
+            self.add_child(UniversalSymphony(clock=self.clock if shared else SimulationClock()))
+        for index, child in enumerate(self.children):
+            child.load_state_dict(_unprefixed(f'child.{index}/', state))
+        self._own_summary_version = -1
+        self._mark_dirty()
+        if self.journal is not None:
+            self.journal.clear()
+
+    def enable_journal(self, limit: Optional[int] = None) -> MutationJournal:
+        """
+        Start logging mutations for undo / redo (see mutation_journal);
+        call commit() on the returned journal once per step.
+        """
+        if self.journal is None:
+            self.journal = MutationJournal(self, limit)
+            self.columns.journal = self.journal
+        return self.journal
+
+    def disable_journal(self):
+        self.journal = None
+        self.columns.journal = None
+
+    def fork(self, seed=None) -> 'UniversalSymphony':
+        """
+        Branch this universe (nested universes included) for A/B and
+        counterfactual runs without copying particles. The branch shares
+        every column buffer with this universe and either side copies a
+        column only when it first writes to it, so frequencies and depths
+        stay shared while phases and observations diverge.
+
+        The branch gets its own clock at the current reading (a WallClock is
+        shared) and continues this universe's random streams, so an
+        unchanged branch evolves exactly like the original; pass a seed to
+        give it independent streams instead.
+        """
+        clock = SimulationClock(self.clock.now()) if isinstance(self.clock, SimulationClock) else self.clock
+        return self._fork(clock, seed)
+
+    def _fork(self, clock, seed) -> 'UniversalSymphony':
+        branch = UniversalSymphony(clock=clock, seed=seed)
+        branch.columns = self.columns.fork()
+        branch.columns.listener = branch._mark_dirty
+        branch._entities = None
+        if seed is None:
+            branch.streams.load_state_dict(self.streams.state_dict())
+        branch.omega_time = self.omega_time
+        branch._decoherence_step = self._decoherence_step
+        branch._observation_step = self._observation_step
+        branch._own_summary = self._own_summary
+        branch._own_summary_version = self._own_summary_version
+        for index, child in enumerate(self.children):
+            if child.clock is self.clock:
+                child_clock = clock
+            elif isinstance(child.clock, SimulationClock):
+                child_clock = SimulationClock(child.clock.now())
+            else:
+                child_clock = child.clock
+            child_seed = None if seed is None else branch.streams.child(STREAM_CHILD, index)
+            branch.add_child(child._fork(child_clock, child_seed))
+        return branch
+
+    def _own(self) -> SymphonySummary:
+        if self._own_summary_version != self.columns.version:
+            self._own_summary = SymphonySummary.from_columns(
+                self._view('freq'), self._view('phase'), self._view('observed')
+            )
+            self._own_summary_version = self.columns.version
+        return self._own_summary
+
+    def summary(self) -> SymphonySummary:
+        """Cached aggregate of this universe and all nested universes."""
+        if self._summary is None:
+            own = self._own()
+            if self.children:
+                own = SymphonySummary.combine([own] + [c.summary() for c in self.children])
+            self._summary = own
+        return self._summary
     
+    def _bind_clock(self, entity: QuantumParticle):
+        """Attach a free particle to this universe's clock; it is born on arrival."""
+        if entity.clock is None:
+            entity.clock = self.clock
+            entity._created_at = self.clock.now()
+
     def add(self, entity: QuantumParticle):
         """Register a particle into the universal field."""
-        self.entities.append(entity)
+        self.add_all([entity])
     
     def add_all(self, entities: List[QuantumParticle]):
         """Register multiple particles."""
-        self.entities.extend(entities)
+        entities = [e for e in entities if e._store is not self.columns]
+        for entity in entities:
+            self._bind_clock(entity)
+        rows = self.columns.extend(entities)
+        self._handles.update(zip(rows, entities))
+        if self._entities is not None:
+            self._entities.extend(entities)
+
+    @property
+    def entities(self) -> List[QuantumParticle]:
+        """Live particles in insertion order (treat as read-only; use add/remove)."""
+        if self._entities is None:
+            self._entities = [self._handle(slot) for slot in self.columns.live_slots().tolist()]
+        return self._entities
+
+    def _handle(self, slot: int) -> QuantumParticle:
+        """Handle for a live slot, created on first access (with its entangled partner)."""
+        handle = self._handles.get(slot)
+        if handle is None:
+            handle = QuantumParticle._handle(self.columns, slot, self.clock, self.streams.universe)
+            self._handles[slot] = handle
+            self._link_handle(slot)
+        return handle
+
+    def _link_handle(self, slot: int):
+        partner_id = self.columns.data['partner'][slot]
+        if partner_id < 0:
+            return
+        partner_slot = int(self.columns.slots_of([partner_id])[0])
+        if partner_slot >= 0:
+            handle, partner = self._handles[slot], self._handle(partner_slot)
+            handle._entangled_with = partner
+            partner._entangled_with = handle
+
+    def _view(self, name: str) -> np.ndarray:
+        """Column values for live particles, aligned with `entities`."""
+        return self.columns.column(name)[self.columns.live()]
+
+    def remove(self, entity) -> bool:
+        """Retire one particle (handle or stable id) in O(1) amortized time."""
+        return self.remove_many([entity]) == 1
+
+    def remove_many(self, entities) -> int:
+        """
+        Tombstone many particles at once; the store compacts itself once
+        tombstones dominate. Removed handles become free particles again.
+        """
+        slots = []
+        ids = []
+        for item in entities:
+            if isinstance(item, QuantumParticle):
+                if item._store is self.columns:
+                    slots.append(item._slot)
+            else:
+                ids.append(item)
+        if ids:
+            found = self.columns.slots_of(ids)
+            slots.extend(found[found >= 0].tolist())
+        if not slots:
+            return 0
+        alive = self.columns.column('alive')
+        slots = np.unique(np.asarray(slots, dtype=np.int64))
+        slots = slots[alive[slots]]
+        detached = {}
+        for slot in slots.tolist():
+            handle = self._handles.pop(slot, None)
+            if handle is not None:
+                handle._detach()
+                detached[slot] = handle
+        if self.journal is not None:
+            self.journal.record(KillDelta(slots, detached))
+        removed = self.columns.kill(slots)
+        self._entities = None
+        if self.columns.tombstones > self.COMPACT_RATIO * self.columns.size:
+            self.compact()
+        return removed
+
+    def compact(self):
+        """Drop tombstoned rows; handles are re-pointed, stable ids are unchanged."""
+        if self.columns.tombstones == 0:
+            return
+        if self.journal is not None:
+            self.journal.record(CompactDelta(self.columns))
+        kept = self.columns.compact()
+        old_slots = np.fromiter(self._handles, dtype=np.int64, count=len(self._handles))
+        handles = list(self._handles.values())
+        self._handles = {}
+        for slot, handle in zip(np.searchsorted(kept, old_slots).tolist(), handles):
+            handle._slot = slot
+            self._handles[slot] = handle
+
+    def particle(self, particle_id: int) -> Optional[QuantumParticle]:
+        """Look up a live particle by stable id."""
+        slot = int(self.columns.slots_of([particle_id])[0])
+        return self._handle(slot) if slot >= 0 else None
+
+    def indices_of(self, particle_ids) -> np.ndarray:
+        """Current positions in `entities` of stable ids (-1 if removed)."""
+        slots = self.columns.slots_of(particle_ids)
+        if self.columns.tombstones == 0:
+            return slots
+        live = self.columns.live_slots()
+        positions = np.searchsorted(live, slots)
+        return np.where(slots >= 0, positions, -1)
     
     def render_reality(self, t: np.ndarray) -> np.ndarray:
         """
         Calculate the Interference Pattern of all particles.
         This is the Σ (sum) operator in Omega Code.
         """
+        if self.children:
+            return self.summary().render(t, self.RENDER_CHUNK_ELEMENTS)
+        t = np.asarray(t, dtype=float)
         field = np.zeros_like(t)
-        for entity in self.entities:
-            field += entity.get_wave(t)
+        n = self.columns.live_count
+        if n == 0:
+            return field
+        freq = self._view('freq')
+        phase = self._view('phase')
+        amp = np.where(self._view('observed'), 1.0, 0.1)
+        flat_t = t.reshape(-1)
+        chunk = max(1, self.RENDER_CHUNK_ELEMENTS // max(1, flat_t.size))
+        flat_field = field.reshape(-1)
+        for start in range(0, n, chunk):
+            stop = min(n, start + chunk)
+            waves = np.sin(2 * np.pi * np.outer(freq[start:stop], flat_t) + phase[start:stop, None])
+            flat_field += amp[start:stop] @ waves
         return field
     
     def get_complexity(self) -> int:
-        """Measure the total complexity of the universe."""
-        return len(self.entities)
+        """Measure the total complexity of the universe (nested universes included)."""
+        if self.children:
+            return self.summary().count
+        return self.columns.live_count
     
     def get_observed_count(self) -> int:
-        """Count how many particles have been observed."""
-        return sum(1 for e in self.entities if e.is_observed)
+        """Count how many particles have been observed (nested universes included)."""
+        if self.children:
+            return self.summary().observed_count
+        return int(np.count_nonzero(self._view('observed')))
 
     def tick(self, dt: float = 1.0):
         """Advance Omega Time by cumulative phase area (frequency-integrated)."""
-        if not self.entities:
-            return
-        self.omega_time += float(sum(abs(e.freq) for e in self.entities)) * dt
+        self._tick(dt, set())
+
+    def _tick(self, dt: float, advanced_clocks: set):
+        if id(self.clock) not in advanced_clocks:
+            self.clock.advance(dt)
+            advanced_clocks.add(id(self.clock))
+        for child in self.children:
+            child._tick(dt, advanced_clocks)
+        if self.children:
+            self.omega_time += self.summary().abs_freq_sum * dt
+        elif self.columns.live_count:
+            self.omega_time += float(np.sum(np.abs(self._view('freq')))) * dt
 
     def get_omega_time(self) -> float:
         """Return accumulated Omega Time."""
         return self.omega_time
 
+    def decohere_expired(self) -> int:
+        """Collapse every particle whose decoherence time has elapsed on the clock."""
+        lifetime = self._view('decoherence_time')
+        with np.errstate(invalid='ignore'):
+            due = self.clock.now() - self._view('created_at') >= lifetime
+        due &= ~self._view('observed')
+        return len(self.observe(mask=due))
+
     @property
     def emergent_time(self) -> float:
         """
@@ -319,53 +1161,192 @@ class UniversalSymphony:
         Reflects the 'activity' or 'becoming' of the system.
         Static systems have Ωτ = 0; active systems have Ωτ > 0.
         """
-        if not self.entities:
+        if self.children:
+            summary = self.summary()
+            return summary.abs_phase_sum / summary.count if summary.count else 0.0
+        if self.columns.live_count == 0:
             return 0.0
-        avg_phase = float(np.mean([abs(p.phase) for p in self.entities]))
+        avg_phase = float(np.mean(np.abs(self._view('phase'))))
         return avg_phase
 
+    def select(
+        self,
+        mask: Optional[np.ndarray] = None,
+        indices: Optional[np.ndarray] = None,
+        band: Optional[tuple] = None,
+    ) -> np.ndarray:
+        """
+        Resolve a particle selection to a boolean mask aligned with `entities`.
+        mask, indices and a (low, high) frequency band intersect; none selects all.
+        """
+        n = self.columns.live_count
+        selected = np.ones(n, dtype=bool) if mask is None else np.asarray(mask, dtype=bool).copy()
+        if selected.shape != (n,):
+            raise ValueError(f"mask must have shape ({n},), got {selected.shape}")
+        if indices is not None:
+            picked = np.zeros(n, dtype=bool)
+            picked[np.asarray(indices, dtype=np.int64)] = True
+            selected &= picked
+        if band is not None:
+            low, high = band
+            freq = self._view('freq')
+            selected &= (freq >= low) & (freq <= high)
+        return selected
+
+    def observe(
+        self,
+        mask: Optional[np.ndarray] = None,
+        indices: Optional[np.ndarray] = None,
+        probability=1.0,
+        band: Optional[tuple] = None,
+    ) -> np.ndarray:
+        """
+        Bulk Observer Effect: collapse a subset of particles in one array pass.
+
+        Args:
+            mask: Boolean selection over all particles
+            indices: Integer positions to select
+            probability: Scalar, or a vector aligned with either the selection
+                or the whole universe, giving each particle's collapse chance
+            band: (low, high) frequency band to select
+
+        Returns:
+            Collapsed values (1.0 / 0.0) of the particles that collapsed, in index order
+        """
+        cols = self.columns
+        selected = self.select(mask=mask, indices=indices, band=band)
+        n = cols.live_count
+        probability = np.asarray(probability, dtype=float)
+        if probability.ndim == 0:
+            chance = float(probability)
+            needs_draw = chance < 1.0
+        else:
+            chance = np.zeros(n)
+            if probability.shape == (n,):
+                chance[:] = probability
+            elif probability.shape == (int(np.count_nonzero(selected)),):
+                chance[selected] = probability
+            else:
+                raise ValueError("probability vector must match the selection or the universe size")
+            needs_draw = bool(np.any(chance[selected] < 1.0))
+        if needs_draw:
+            draws = self.streams.uniform(STREAM_OBSERVATION, self._observation_step, n)
+            self._observation_step += 1
+            selected &= draws < chance
+        hit = np.flatnonzero(selected)
+        if hit.size == 0:
+            return np.empty(0)
+        if cols.tombstones:
+            hit = cols.live_slots()[hit]
+
+        cols._log_values('observed', hit)
+        observed = cols.column('observed', write=True)
+        observed[hit] = True
+        partner_ids = cols.column('partner')[hit]
+        entangled = partner_ids >= 0
+        if np.any(entangled):
+            partners = cols.slots_of(partner_ids[entangled])
+            present = partners >= 0
+            cols._log_values('superposition', partners[present])
+            cols._log_values('observed', partners[present])
+            superposition = cols.column('superposition', write=True)
+            superposition[partners[present]] = superposition[hit[entangled][present]]
+            observed[partners[present]] = True
+        cols.touch()
+        return np.where(cols.column('superposition')[hit] > 0.5, 1.0, 0.0)
+
     def observe_all(self, probability: float = 1.0):
         """Observe particles with a given probability to encourage alignment."""
-        if not self.entities or probability <= 0:
+        if self.columns.live_count == 0 or probability <= 0:
             return 0
         probability = min(1.0, probability)
-        count = 0
-        for entity in self.entities:
-            if not entity.is_observed and np.random.random() < probability:
-                entity.observe()
-                count += 1
-        return count
+        pending = ~self._view('observed')
+        return len(self.observe(mask=pending, probability=probability))
+
+    def lock_phase(self, indices, phase: float) -> np.ndarray:
+        """
+        Phase locking: set the selected particles' phase and observe them,
+        in one array pass (same effect as `p.phase = phase; p.observe()` each).
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        slots = self.columns.live_slots()[indices] if self.columns.tombstones else indices
+        self.columns._log_values('phase', slots)
+        self.columns.column('phase', write=True)[slots] = phase
+        self.columns.touch()
+        return self.observe(indices=indices)
     
     def check_harmonic_resonance(self, tolerance: float = 0.01) -> List[QuantumParticle]:
         """
         Find particles whose frequency is a harmonic of 1.
         A harmonic is an integer multiple: 1Hz, 2Hz, 3Hz, etc.
         """
-        harmonics = []
-        for entity in self.entities:
-            if entity.is_observed:
-                ratio = entity.freq / 1.0
-                if abs(ratio - round(ratio)) < tolerance:
-                    harmonics.append(entity)
-        return harmonics
+        ratio = self._view('freq') / 1.0
+        harmonic = self._view('observed') & (np.abs(ratio - np.round(ratio)) < tolerance)
+        entities = self.entities
+        return [entities[i] for i in np.flatnonzero(harmonic)]
 
     def get_coherence(self) -> float:
         """
-        Measure phase coherence across all particles.
+        Measure phase coherence across all particles (nested universes included).
         Returns a value in [0, 1], where 1 is perfectly aligned.
         """
-        if not self.entities:
+        if self.children:
+            return self.summary().coherence
+        if self.columns.live_count == 0:
             return 1.0
-        phases = np.array([e.phase for e in self.entities])
+        phases = self._view('phase')
         return float(np.abs(np.mean(np.exp(1j * phases))))
 
     def apply_decoherence(self, entropy_factor: float = 0.001, rng: Optional[np.random.Generator] = None):
-        """Simulate phase drift across particles to model decoherence."""
-        if not self.entities:
+        """
+        Simulate phase drift across particles to model decoherence.
+        Without an explicit rng the noise comes from the per-block decoherence streams.
+        """
+        n = self.columns.live_count
+        if n == 0:
             return
-        generator = rng if rng is not None else np.random.default_rng()
-        for particle in self.entities:
-            particle.phase += float(generator.normal(0.0, entropy_factor))
+        if rng is not None:
+            noise = rng.normal(0.0, entropy_factor, size=n)
+        else:
+            noise = self.streams.normal(STREAM_DECOHERENCE, self._decoherence_step, n, entropy_factor)
+            self._decoherence_step += 1
+        self.columns._log_values('phase', self.columns.live())
+        self.columns.column('phase', write=True)[self.columns.live()] += noise
+        self.columns.touch()
+
+    def advance(self, steps: int, entropy_factor: float = 0.0, dt: float = 1.0):
+        """
+        Fast-forward `steps` iterations of apply_decoherence(entropy_factor)
+        followed by tick(dt), bit-identical to running that loop. Phases are
+        updated in a private array and written back once, and the Omega Time
+        increment (constant while no particle changes frequency) is computed
+        once and folded in with np.add.accumulate, which adds in loop order.
+        """
+        steps = int(steps)
+        if steps <= 0:
+            return
+        if self.children:
+            for _ in range(steps):
+                self.apply_decoherence(entropy_factor)
+                self.tick(dt)
+            return
+        n = self.columns.live_count
+        if n:
+            live = self.columns.live()
+            phase = self.columns.column('phase')[live].copy()
+            for step in range(self._decoherence_step, self._decoherence_step + steps):
+                phase += self.streams.normal(STREAM_DECOHERENCE, step, n, entropy_factor)
+            self._decoherence_step += steps
+            self.columns._log_values('phase', live)
+            self.columns.column('phase', write=True)[live] = phase
+            self.columns.touch()
+            increment = float(np.sum(np.abs(self._view('freq')))) * dt
+            self.omega_time = float(np.add.accumulate(np.r_[self.omega_time, np.full(steps, increment)])[-1])
+        if isinstance(self.clock, SimulationClock):
+            self.clock._now = float(np.add.accumulate(np.r_[self.clock._now, np.full(steps, float(dt))])[-1])
+        else:
+            for _ in range(steps):
+                self.clock.advance(dt)
 
 
 # --- Visualization Engine ---
@@ -501,13 +1482,18 @@ def visualize_convergence(
 
 # --- Main Execution ---
 
-def generate_fractal_universe(base_freq: float = 1.0, octaves: int = 6) -> List[QuantumParticle]:
+def generate_fractal_universe(
+    base_freq: float = 1.0,
+    octaves: int = 6,
+    rng: Optional[np.random.Generator] = None,
+) -> List[QuantumParticle]:
     """
     Generate a fractal tree of particles.
     Each octave doubles the complexity.
+    Pass a generator (e.g. symphony.streams.universe) for reproducible superpositions.
     """
     particles = []
-    root = QuantumParticle(base_freq, depth=0, max_depth=octaves)
+    root = QuantumParticle(base_freq, depth=0, max_depth=octaves, rng=rng)
     particles.append(root)
     
     current_generation = [root]
@@ -524,9 +1510,10 @@ def generate_fractal_universe(base_freq: float = 1.0, octaves: int = 6) -> List[
     return particles
 
 
-def main():
+def main(seed=42):
     """
     The Genesis: Create and observe the universe.
+    Every random draw comes from the universe's streams, so a seed reproduces the run.
     """
     print("\n" + "="*60)
     print("  OMEGA CODE (Ω): THE DIGITAL GENESIS")
@@ -541,11 +1528,11 @@ def main():
     
     # Steps 2-7: Generate the Fractal Universe
     print("Steps 2-7: Generating fractal universe (6 octaves)...")
-    particles = generate_fractal_universe(base_freq=1.0, octaves=6)
+    universe = UniversalSymphony(seed=seed)
+    particles = generate_fractal_universe(base_freq=1.0, octaves=6, rng=universe.streams.universe)
     print(f"  ✓ Created {len(particles)} particles\n")
     
     # Create the Universal Symphony
-    universe = UniversalSymphony()
     universe.add_all(particles)
     
     # Step 8: Consciousness Emerges
@@ -557,10 +1544,8 @@ def main():
     print("Step 9: Consciousness observes the universe...")
     observation_rate = 0.10
     num_to_observe = int(len(particles) * observation_rate)
-    observed_particles = np.random.choice(particles, size=num_to_observe, replace=False)
-    
-    for particle in observed_particles:
-        observer.observe_particle(particle)
+    chosen = universe.streams.universe.choice(len(particles), size=num_to_observe, replace=False)
+    universe.observe(indices=chosen)
     
     print(f"  ✓ Observed {universe.get_observed_count()} of {universe.get_complexity()} particles")
     print(f"    ({observation_rate*100:.0f}% observation rate)\n")
@@ -613,9 +1598,7 @@ def main():
     
     # Observe ALL particles to see full manifestation
     print("\nManifesting full reality (observing all particles)...")
-    for particle in particles:
-        if not particle.is_observed:
-            observer.observe_particle(particle)
+    universe.observe_all()
     
     reality_field_full = universe.render_reality(t)
     max_amplitude_full = np.max(np.abs(reality_field_full))